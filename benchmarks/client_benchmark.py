@@ -0,0 +1,189 @@
+"""Benchmarks of the http client against the local seafile stand-in
+
+Run from the repository root:
+
+    python -m benchmarks.client_benchmark --json > results.jsonl
+    python -m benchmarks.client_benchmark --benchmark list --benchmark download --latency 0.002
+
+Every result is reported as one json line (with --json), so results of different runs can be compared.
+By default the stand-in is started in the same process, use --url to measure against a standalone one
+(python -m benchmarks.standin_server) with the same settings.
+"""
+import json
+import time
+import asyncio
+import aiohttp
+import argparse
+import platform
+from typing import Any, Dict, List, Callable, Awaitable
+from src.aseafile import SeafileHttpClient
+from src.aseafile.enums import ParseMode
+from .standin_server import SeafileStandIn, StandInSettings
+
+
+async def measure_concurrently(call: Callable[[], Awaitable[Any]], requests: int, concurrency: int) -> float:
+    """Make calls by concurrent workers and get elapsed time in seconds"""
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            result = await call()
+            if not result.success:
+                raise RuntimeError(f'Request failed with status {result.status}: {result.errors}')
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - started_at
+
+
+async def benchmark_list(client: SeafileHttpClient, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    result = await client.get_items(SeafileStandIn.REPO_ID, '/')
+    elapsed = await measure_concurrently(
+        lambda: client.get_items(SeafileStandIn.REPO_ID, '/'), args.requests, args.concurrency)
+
+    return [{
+        'benchmark': 'list_throughput',
+        'requests': args.requests,
+        'concurrency': args.concurrency,
+        'entries': len(result.content),
+        'seconds': elapsed,
+        'requests_per_second': args.requests / elapsed,
+        'entries_per_second': args.requests * len(result.content) / elapsed
+    }]
+
+
+async def benchmark_upload(client: SeafileHttpClient, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    payload = b'x' * args.upload_size
+    elapsed = await measure_concurrently(
+        lambda: client.upload(SeafileStandIn.REPO_ID, '/', 'small.bin', payload), args.requests, args.concurrency)
+
+    return [{
+        'benchmark': 'small_file_upload',
+        'requests': args.requests,
+        'concurrency': args.concurrency,
+        'file_size': args.upload_size,
+        'seconds': elapsed,
+        'files_per_second': args.requests / elapsed
+    }]
+
+
+async def benchmark_download(client: SeafileHttpClient, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    best = float('inf')
+    size = 0
+
+    for _ in range(args.repeat):
+        started_at = time.perf_counter()
+        result = await client.download(SeafileStandIn.REPO_ID, '/large.bin')
+        best = min(best, time.perf_counter() - started_at)
+        size = len(result.content)
+
+    return [{
+        'benchmark': 'large_file_download',
+        'file_size': size,
+        'seconds': best,
+        'megabytes_per_second': size / best / 1024 ** 2
+    }]
+
+
+async def benchmark_parse(client: SeafileHttpClient, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    results = list()
+
+    for mode in ParseMode:
+        async with SeafileHttpClient(client.base_url, parse_mode=mode) as mode_client:
+            await mode_client.authorize(args.username, args.password)
+            best = float('inf')
+            entries = 0
+
+            for _ in range(args.repeat):
+                started_at = time.perf_counter()
+                result = await mode_client.get_files(SeafileStandIn.REPO_ID, '/')
+                best = min(best, time.perf_counter() - started_at)
+                entries = len(result.content)
+
+            results.append({
+                'benchmark': 'parse_cost',
+                'mode': mode.value,
+                'entries': entries,
+                'seconds': best,
+                'us_per_entry': best / entries * 1_000_000
+            })
+
+    return results
+
+
+BENCHMARKS = {
+    'list': benchmark_list,
+    'upload': benchmark_upload,
+    'download': benchmark_download,
+    'parse': benchmark_parse
+}
+
+
+async def run_benchmarks(url: str, args: argparse.Namespace) -> List[Dict[str, Any]]:
+    results = list()
+
+    async with SeafileHttpClient(url) as client:
+        await client.authorize(args.username, args.password)
+
+        for name in args.benchmark or BENCHMARKS:
+            results += await BENCHMARKS[name](client, args)
+
+    return results
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    environment = {
+        'latency': args.latency,
+        'python': platform.python_version(),
+        'aiohttp': aiohttp.__version__
+    }
+
+    if args.url is not None:
+        return [result | environment for result in await run_benchmarks(args.url, args)]
+
+    results = list()
+
+    # parse cost is measured on a large listing, throughput on a regular one
+    settings = StandInSettings(latency=args.latency, listing_size=args.listing_size, file_size=args.download_size)
+    async with SeafileStandIn(settings) as server:
+        benchmarks = [name for name in args.benchmark or BENCHMARKS if name != 'parse']
+        results += await run_benchmarks(server.url, argparse.Namespace(**vars(args) | {'benchmark': benchmarks}))
+
+    if 'parse' in (args.benchmark or BENCHMARKS):
+        async with SeafileStandIn(StandInSettings(listing_size=args.parse_entries)) as server:
+            results += await run_benchmarks(server.url, argparse.Namespace(**vars(args) | {'benchmark': ['parse']}))
+
+    return [result | environment for result in results]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--benchmark', action='append', choices=list(BENCHMARKS),
+                        help='benchmark to run (may be repeated, all by default)')
+    parser.add_argument('--url', help='base url of standalone stand-in (by default started in process)')
+    parser.add_argument('--username', default='user@example.com', help='login for authorization')
+    parser.add_argument('--password', default='password', help='password for authorization')
+    parser.add_argument('--latency', type=float, default=0.0, help='delay of every response in seconds')
+    parser.add_argument('--requests', type=int, default=1000, help='number of requests of throughput benchmarks')
+    parser.add_argument('--concurrency', type=int, default=20, help='number of concurrent requests')
+    parser.add_argument('--repeat', type=int, default=5, help='number of runs, the best one is reported')
+    parser.add_argument('--listing-size', type=int, default=100, help='number of files in listed directory')
+    parser.add_argument('--parse-entries', type=int, default=20000, help='number of entries of parse benchmark')
+    parser.add_argument('--upload-size', type=int, default=4 * 1024, help='size of uploaded files in bytes')
+    parser.add_argument('--download-size', type=int, default=64 * 1024 ** 2, help='size of downloaded file in bytes')
+    parser.add_argument('--json', action='store_true', help='print results as json lines')
+    args = parser.parse_args()
+
+    for result in asyncio.run(run(args)):
+        if args.json:
+            print(json.dumps(result))
+        else:
+            values = ', '.join(f'{key}={value:.2f}' if isinstance(value, float) else f'{key}={value}'
+                               for key, value in result.items() if key not in ('latency', 'python', 'aiohttp'))
+            print(values)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark of memory used by directory listings stored as models and as CompactListing
+
+Run from the repository root:
+
+    python -m benchmarks.listing_memory_benchmark --entries 100000
+"""
+import gc
+import json
+import argparse
+import tracemalloc
+from typing import Any, Callable, Dict, List
+from pydantic import parse_obj_as
+from src.aseafile.enums import ParseMode
+from src.aseafile.models import FileItem, CompactListing
+from src.aseafile.parsers import ResponseParser
+from benchmarks.parse_benchmark import create_listing
+
+
+def measure(parse: Callable[[List[Dict[str, Any]]], Any], content: bytes) -> int:
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        listing = parse(json.loads(content))
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del listing
+    return size
+
+
+def run(entries: int) -> List[Dict[str, Any]]:
+    content = create_listing(entries)
+    parser = ResponseParser(ParseMode.CONSTRUCT)
+    representations = {
+        'validated_models': lambda items: parse_obj_as(List[FileItem], items),
+        'constructed_models': lambda items: parser.construct(List[FileItem], items),
+        'compact_listing': lambda items: CompactListing(items)
+    }
+
+    return [
+        {
+            'benchmark': 'listing_memory',
+            'representation': name,
+            'entries': entries,
+            'bytes_per_entry': measure(parse, content) / entries
+        }
+        for name, parse in representations.items()
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--entries', type=int, default=100000, help='number of entries in listing')
+    parser.add_argument('--json', action='store_true', help='print results as json lines')
+    args = parser.parse_args()
+
+    for result in run(args.entries):
+        if args.json:
+            print(json.dumps(result))
+        else:
+            print(f"{result['representation']:>18}: {result['bytes_per_entry']:8.1f} bytes/entry")
+
+
+if __name__ == '__main__':
+    main()
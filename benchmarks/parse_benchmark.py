@@ -0,0 +1,91 @@
+"""Benchmark of parsing directory listings in every parse mode
+
+Run from the repository root:
+
+    python -m benchmarks.parse_benchmark --entries 20000 --repeat 5
+"""
+import json
+import time
+import argparse
+from typing import Any, Dict, List
+from src.aseafile.enums import ParseMode
+from src.aseafile.models import FileItem
+from src.aseafile.parsers import ResponseParser, JsonLoads
+
+
+def create_listing(entries: int) -> bytes:
+    return json.dumps([
+        {
+            'id': f'{index:040x}',
+            'type': 'file',
+            'name': f'file_{index}.txt',
+            'mtime': 1672531200 + index,
+            'permission': 'rw',
+            'size': index * 1024,
+            'modifier_name': 'user',
+            'modifier_email': 'user@example.com',
+            'modifier_contact_email': 'user@example.com',
+            'starred': False
+        }
+        for index in range(entries)
+    ]).encode()
+
+
+def get_decoders() -> Dict[str, JsonLoads]:
+    decoders: Dict[str, JsonLoads] = {'json': json.loads}
+
+    try:
+        import orjson
+        decoders['orjson'] = orjson.loads
+    except ImportError:
+        pass
+
+    return decoders
+
+
+def measure(parser: ResponseParser, content: bytes, repeat: int) -> float:
+    best = float('inf')
+
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        parser.parse(List[FileItem], content)
+        best = min(best, time.perf_counter() - started_at)
+
+    return best
+
+
+def run(entries: int, repeat: int) -> List[Dict[str, Any]]:
+    content = create_listing(entries)
+    results = list()
+
+    for decoder_name, json_loads in get_decoders().items():
+        for mode in ParseMode:
+            elapsed = measure(ResponseParser(mode, json_loads), content, repeat)
+            results.append({
+                'benchmark': 'parse_listing',
+                'mode': mode.value,
+                'decoder': decoder_name,
+                'entries': entries,
+                'seconds': elapsed,
+                'us_per_entry': elapsed / entries * 1_000_000
+            })
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--entries', type=int, default=20000, help='number of entries in listing')
+    parser.add_argument('--repeat', type=int, default=5, help='number of runs, the best one is reported')
+    parser.add_argument('--json', action='store_true', help='print results as json lines')
+    args = parser.parse_args()
+
+    for result in run(args.entries, args.repeat):
+        if args.json:
+            print(json.dumps(result))
+        else:
+            print(f"{result['mode']:>10} {result['decoder']:>7}: {result['us_per_entry']:8.2f} us/entry")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""Replay of recorded client traffic against the local seafile stand-in
+
+A trace is recorded with TrafficRecorder, every call is repeated by the client at its recorded
+offset divided by speed, the stand-in returns listings and files of recorded sizes.
+
+Run from the repository root:
+
+    python -m benchmarks.replay session.trace.gz --speed 10 --json
+
+Reported latency of calls and cpu time of the process can be compared between releases of the client
+(cpu time includes the stand-in running in the same process, it is the same for compared runs).
+"""
+import json
+import time
+import asyncio
+import aiohttp
+import argparse
+import platform
+from typing import Any, Dict, List
+from src.aseafile import SeafileHttpClient, TrafficRecorder
+from src.aseafile.models import RecordedCall
+from src.aseafile.metrics import LatencyHistogram
+from .standin_server import SeafileStandIn, StandInSettings
+
+# Methods returning listings, the size of their result is the number of entries
+LISTING_METHODS = ('get_items', 'get_files', 'get_directories')
+
+
+def create_settings(calls: List[RecordedCall], latency: float) -> StandInSettings:
+    """Create settings of the stand-in that returns results of recorded sizes"""
+    listing_sizes: Dict[str, int] = dict()
+    file_sizes: Dict[str, int] = dict()
+    search_results = 0
+
+    for call in calls:
+        if call.size is None:
+            continue
+
+        if call.method in LISTING_METHODS:
+            listing_sizes[call.arguments.get('path') or '/'] = call.size
+        elif call.method == 'download':
+            # partially downloaded file is at least of the downloaded size
+            filepath = call.arguments['filepath']
+            file_sizes[filepath] = max(file_sizes.get(filepath, 0), call.arguments.get('offset', 0) + call.size)
+        elif call.method == 'search_file':
+            search_results = max(search_results, call.size)
+
+    return StandInSettings(
+        latency=latency,
+        listing_sizes=listing_sizes,
+        file_sizes=file_sizes,
+        search_results=search_results
+    )
+
+
+async def replay_call(client: SeafileHttpClient, call: RecordedCall) -> bool:
+    arguments = dict(call.arguments)
+    if 'payload' in arguments:
+        arguments['payload'] = bytes(arguments['payload'] or 0)
+
+    result = await getattr(client, call.method)(**arguments)
+    return result.success
+
+
+async def replay(url: str, calls: List[RecordedCall], speed: float) -> List[Dict[str, Any]]:
+    latencies: Dict[str, LatencyHistogram] = dict()
+    lags = LatencyHistogram()
+    failures: Dict[str, int] = dict()
+
+    async with SeafileHttpClient(url) as client:
+        await client.authorize('user@example.com', 'password')
+
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        cpu_started_at = time.process_time()
+
+        async def run_call(call: RecordedCall):
+            await asyncio.sleep(max(started_at + call.offset / speed - loop.time(), 0))
+            call_started_at = loop.time()
+            lags.observe(call_started_at - started_at - call.offset / speed)
+
+            try:
+                success = await replay_call(client, call)
+            except Exception:
+                success = False
+
+            latencies.setdefault(call.method, LatencyHistogram()).observe(loop.time() - call_started_at)
+            if not success:
+                failures[call.method] = failures.get(call.method, 0) + 1
+
+        await asyncio.gather(*(run_call(call) for call in calls if call.method in TrafficRecorder.RECORDED_METHODS))
+        wall_time = loop.time() - started_at
+        cpu_time = time.process_time() - cpu_started_at
+
+    results = [
+        {
+            'benchmark': 'replay_call',
+            'method': method,
+            'count': histogram.count,
+            'failures': failures.get(method, 0),
+            'mean': histogram.mean,
+            'p50': histogram.quantile(0.5),
+            'p90': histogram.quantile(0.9),
+            'p99': histogram.quantile(0.99),
+            'max': histogram.max
+        }
+        for method, histogram in sorted(latencies.items())
+    ]
+
+    results.append({
+        'benchmark': 'replay',
+        'calls': sum(histogram.count for histogram in latencies.values()),
+        'failures': sum(failures.values()),
+        'speed': speed,
+        'recorded_seconds': max((call.offset + call.duration for call in calls), default=0.0),
+        'wall_seconds': wall_time,
+        'cpu_seconds': cpu_time,
+        'start_lag_p99': lags.quantile(0.99),
+        'start_lag_max': lags.max
+    })
+
+    return results
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    calls = TrafficRecorder.load(args.trace)
+    environment = {
+        'trace': args.trace,
+        'python': platform.python_version(),
+        'aiohttp': aiohttp.__version__
+    }
+
+    if args.url is not None:
+        results = await replay(args.url, calls, args.speed)
+    else:
+        async with SeafileStandIn(create_settings(calls, args.latency)) as server:
+            results = await replay(server.url, calls, args.speed)
+
+    return [result | environment for result in results]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('trace', help='path to trace file recorded by TrafficRecorder')
+    parser.add_argument('--speed', type=float, default=1.0, help='acceleration of replay (1 - original speed)')
+    parser.add_argument('--latency', type=float, default=0.0, help='delay of every response in seconds')
+    parser.add_argument('--url', help='base url of standalone stand-in (by default started in process)')
+    parser.add_argument('--json', action='store_true', help='print results as json lines')
+    args = parser.parse_args()
+
+    if args.speed <= 0:
+        parser.error('speed should be positive')
+
+    for result in asyncio.run(run(args)):
+        if args.json:
+            print(json.dumps(result))
+        else:
+            print(', '.join(f'{key}={value:.4f}' if isinstance(value, float) else f'{key}={value}'
+                            for key, value in result.items() if key not in ('trace', 'python', 'aiohttp')))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark of per call overhead of the SeaResult envelope
+
+Compares SeaResult with the previous envelope based on pydantic GenericModel.
+Run from the repository root:
+
+    python -m benchmarks.result_benchmark --number 100000
+"""
+import json
+import timeit
+import argparse
+from http import HTTPStatus
+from typing import Any, Dict, Generic, List, TypeVar
+from pydantic.generics import GenericModel
+from src.aseafile.models import SeaResult, FileItem, Error
+
+ContentT = TypeVar('ContentT')
+
+
+class GenericSeaResult(GenericModel, Generic[ContentT]):
+    """Previous implementation of SeaResult"""
+    success: bool
+    status: HTTPStatus
+    errors: List[Error] | None
+    content: ContentT | None
+
+    class Config:
+        arbitrary_types_allowed = True
+
+
+def create_items(count: int) -> List[FileItem]:
+    return [
+        FileItem(
+            id=f'{index:040x}',
+            type='file',
+            name=f'file_{index}.txt',
+            mtime=1672531200,
+            permission='rw',
+            size=1024,
+            modifier_name='user',
+            modifier_email='user@example.com',
+            modifier_contact_email='user@example.com',
+            starred=False
+        )
+        for index in range(count)
+    ]
+
+
+def run(number: int) -> List[Dict[str, Any]]:
+    items = create_items(100)
+    # handlers create results without parametrization, the type of content is only annotated
+    envelopes = {'generic_model': GenericSeaResult[List[FileItem]], 'slotted': SeaResult}
+    scenarios = {
+        # result created by handler, content is assigned after parsing
+        'create': lambda envelope: envelope(
+            success=True, status=HTTPStatus.OK, errors=None, content=None),
+        # result of the handler is wrapped again with already parsed content
+        'rewrap_100_items': lambda envelope: envelope(
+            success=True, status=HTTPStatus.OK, errors=None, content=items)
+    }
+
+    results = list()
+    for scenario, create in scenarios.items():
+        for name, envelope in envelopes.items():
+            seconds = min(timeit.repeat(lambda: create(envelope), number=number, repeat=3))
+            results.append({
+                'benchmark': 'sea_result',
+                'scenario': scenario,
+                'envelope': name,
+                'calls': number,
+                'us_per_call': seconds / number * 1_000_000
+            })
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=20000, help='number of calls in one run')
+    parser.add_argument('--json', action='store_true', help='print results as json lines')
+    args = parser.parse_args()
+
+    for result in run(args.number):
+        if args.json:
+            print(json.dumps(result))
+        else:
+            print(f"{result['scenario']:>16} {result['envelope']:>13}: {result['us_per_call']:9.3f} us/call")
+
+
+if __name__ == '__main__':
+    main()
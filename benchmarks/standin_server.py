@@ -0,0 +1,579 @@
+"""Local stand-in of the seafile web api for benchmarks and tests
+
+The stand-in implements routes of RouteStorage used by the client (ping, auth-token, repos, dir, file,
+file-detail, upload-link, search) and the seafhttp upload and download endpoints. Files and directories
+put into the stored tree (or created through the api) are served from it. Listings and files missing in
+the stored tree are generated from settings, responses are encoded once and served from memory, so the
+server costs as little as possible next to the measured client.
+
+Every request is counted by route name, a route can be slowed down or answered by queued failures, and
+issued download and upload links can be expired.
+
+Run a standalone server (e.g. in a separate process to keep its cpu time out of measurements):
+
+    python -m benchmarks.standin_server --port 8000 --latency 0.005 --listing-size 1000
+"""
+import re
+import json
+import asyncio
+import hashlib
+import argparse
+import itertools
+import posixpath
+from aiohttp import web
+from collections import Counter
+from urllib.parse import quote
+from typing import Dict, Any, Tuple, List, Set
+from pydantic import BaseModel
+from src.aseafile.route_storage import RouteStorage
+
+
+class StandInSettings(BaseModel):
+    """Settings of generated data and behaviour of the stand-in"""
+
+    # Delay in seconds added to every response
+    latency: float = 0.0
+
+    # Number of files in every directory
+    listing_size: int = 100
+
+    # Number of entries in directories by paths (overrides listing_size and listing_directories)
+    listing_sizes: Dict[str, int] = dict()
+
+    # Number of subdirectories in every directory
+    listing_directories: int = 10
+
+    # Size of every file in bytes
+    file_size: int = 1024 * 1024
+
+    # Sizes of files by paths in bytes (overrides file_size)
+    file_sizes: Dict[str, int] = dict()
+
+    # Number of items found by every search
+    search_results: int = 20
+
+    # Number of repositories
+    repos: int = 1
+
+    # Token returned by auth-token route and required by other routes
+    token: str = 'standin-token'
+
+    # Generate listings and files missing in the stored tree and only count uploaded bytes
+    # (otherwise missing paths are not found and uploaded files are kept in the stored tree)
+    generate: bool = True
+
+
+class SeafileStandIn:
+    """In-process http server imitating seafile
+
+    Usage:
+
+        async with SeafileStandIn(StandInSettings(latency=0.01)) as server:
+            client = SeafileHttpClient(server.url)
+    """
+
+    REPO_ID = '00000000-0000-0000-0000-000000000000'
+    MTIME = 1672531200
+    RANGE_PATTERN = re.compile(r'bytes=(\d+)-(\d*)')
+
+    def __init__(self, settings: StandInSettings | None = None, host: str = '127.0.0.1', port: int = 0):
+        self._settings = settings or StandInSettings()
+        self._host = host
+        self._port = port
+        self._route_storage = RouteStorage()
+        self._runner: web.AppRunner | None = None
+        self._url: str | None = None
+        self._file_content = memoryview(bytes(max(self._settings.file_size, *self._settings.file_sizes.values(), 0)))
+        self._bodies: Dict[Tuple, bytes] = dict()
+        self._link_ids = itertools.count()
+
+        # Stored tree: contents of files and paths of directories
+        self.files: Dict[str, bytes] = dict()
+        self.directories: Set[str] = set() if self._settings.generate else {'/'}
+
+        # Number of handled requests by route names
+        self.requests: Counter[str] = Counter()
+
+        # Delays in seconds of responses by route names (the response is prepared before the delay,
+        # so a slow response describes the state at the moment the request was received)
+        self.delays: Dict[str, float] = dict()
+
+        # Queued failures (status and headers) answering the next requests by route names
+        self.failures: Dict[str, List[Tuple[int, Dict[str, str]]]] = dict()
+
+        # Issued and expired download and upload links
+        self.links: Set[str] = set()
+        self.expired_links: Set[str] = set()
+
+        # Number of received bytes of uploaded files
+        self.uploaded_bytes = 0
+
+    @property
+    def settings(self) -> StandInSettings:
+        return self._settings
+
+    @property
+    def url(self) -> str:
+        """Base url of the running server"""
+        if self._url is None:
+            raise RuntimeError('Stand-in server is not started')
+
+        return self._url
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    async def start(self):
+        self._runner = web.AppRunner(self.create_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self._host, self._port)
+        await site.start()
+
+        port = site._server.sockets[0].getsockname()[1]
+        self._url = f'http://{self._host}:{port}/'
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            self._url = None
+
+    def fail(self, route_name: str, status: int, headers: Dict[str, str] | None = None, times: int = 1):
+        """Answer the next requests of the route by the status"""
+        self.failures.setdefault(route_name, list()).extend([(status, headers or dict())] * times)
+
+    def expire_links(self):
+        """Make all issued download and upload links invalid"""
+        self.expired_links |= self.links
+
+    def create_app(self) -> web.Application:
+        storage = self._route_storage
+        app = web.Application(client_max_size=1024 ** 3, middlewares=[self._middleware])
+
+        def path(route: str) -> str:
+            return '/' + route
+
+        app.router.add_get(path(storage.ping), self._ping, name='ping')
+        app.router.add_get(path(storage.auth_ping), self._ping, name='auth_ping')
+        app.router.add_post(path(storage.auth_token), self._auth_token, name='auth_token')
+        app.router.add_get(path(storage.repos), self._get_repos, name='repos')
+        app.router.add_post(path(storage.repos), self._create_repo, name='create_repo')
+        app.router.add_get(path(storage.repo('{repo_id}')), self._get_repo, name='repo')
+        app.router.add_get(path(storage.dir('{repo_id}')), self._get_dir, name='dir')
+        app.router.add_post(path(storage.dir('{repo_id}')), self._change_dir, name='change_dir')
+        app.router.add_delete(path(storage.dir('{repo_id}')), self._delete_dir, name='delete_dir')
+        app.router.add_get(path(storage.dir_detail('{repo_id}')), self._get_dir_detail, name='dir_detail')
+        app.router.add_get(path(storage.file('{repo_id}')), self._get_download_link, name='file')
+        app.router.add_post(path(storage.file('{repo_id}')), self._change_file, name='change_file')
+        app.router.add_delete(path(storage.file('{repo_id}')), self._delete_file, name='delete_file')
+        app.router.add_get(path(storage.file_detail('{repo_id}')), self._get_file_detail, name='file_detail')
+        app.router.add_get(path(storage.get_upload_link('{repo_id}')), self._get_upload_link, name='get_upload_link')
+        app.router.add_get(path(storage.search_file), self._search, name='search_file')
+        app.router.add_post('/seafhttp/upload-api/{link}', self._upload, name='upload')
+        app.router.add_get('/seafhttp/files/{link}/{filepath:.*}', self._download, name='download')
+
+        return app
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        name = request.match_info.route.name or 'unknown'
+        self.requests[name] += 1
+
+        if self._settings.latency > 0:
+            await asyncio.sleep(self._settings.latency)
+
+        failures = self.failures.get(name)
+        if failures:
+            status, headers = failures.pop(0)
+            await request.read()
+            return web.json_response({'error_msg': 'Stand-in failure'}, status=status, headers=headers)
+
+        if name not in ('ping', 'auth_token', 'upload', 'download', 'unknown') \
+                and request.headers.get('Authorization') != f'Token {self._settings.token}':
+            return web.json_response({'detail': 'Invalid token'}, status=401)
+
+        response = await handler(request)
+
+        delay = self.delays.get(name)
+        if delay:
+            await asyncio.sleep(delay)
+
+        return response
+
+    async def _ping(self, _: web.Request) -> web.Response:
+        return web.json_response('pong')
+
+    async def _auth_token(self, request: web.Request) -> web.Response:
+        data = await request.post()
+        if not data.get('username') or not data.get('password'):
+            return web.json_response({'non_field_errors': ['Unable to login with provided credentials.']}, status=400)
+
+        return web.json_response({'token': self._settings.token})
+
+    async def _get_repos(self, _: web.Request) -> web.Response:
+        return self._json_body(('repos',), lambda: [self._create_repo_item(index) for index in range(self._settings.repos)])
+
+    async def _create_repo(self, request: web.Request) -> web.Response:
+        data = await request.post()
+        return web.json_response(self._create_repo_item(0) | {'repo_name': data.get('name', 'repo')})
+
+    async def _get_repo(self, _: web.Request) -> web.Response:
+        return web.json_response(self._create_repo_item(0) | {'head_commit_id': '0' * 40})
+
+    async def _get_dir(self, request: web.Request) -> web.Response:
+        item_type = request.query.get('t')
+        recursive = request.query.get('recursive') == '1'
+        path = request.query.get('p', '/')
+
+        if self._is_stored_directory(self._normalize(path)):
+            return self._get_stored_dir(self._normalize(path), item_type)
+
+        if not self._settings.generate:
+            return web.json_response({'error_msg': 'Folder not found.'}, status=404)
+
+        overridden = path in self._settings.listing_sizes
+        key = ('dir', item_type, recursive, path if recursive or overridden else None)
+        return self._json_body(key, lambda: self._create_listing(path, item_type, recursive))
+
+    def _get_stored_dir(self, path: str, item_type: str | None) -> web.Response:
+        items = [self._create_stored_item(posixpath.join(path, name)) for name in sorted(self._children(path))]
+
+        if item_type == 'f':
+            items = [item for item in items if item['type'] == 'file']
+        elif item_type == 'd':
+            items = [item for item in items if item['type'] == 'dir']
+
+        return web.json_response(items, headers={'oid': self._get_id(path)})
+
+    async def _change_dir(self, request: web.Request) -> web.Response:
+        path = self._normalize(request.query['p'])
+        form = await request.post()
+
+        if form.get('operation') == 'mkdir':
+            self.directories.add(path)
+            return web.json_response('success', status=201)
+
+        if form.get('operation') == 'rename':
+            self._move(path, posixpath.join(posixpath.dirname(path), form['newname']))
+            return web.json_response('success')
+
+        return web.json_response({'error_msg': 'Unknown operation.'}, status=400)
+
+    async def _delete_dir(self, request: web.Request) -> web.Response:
+        path = self._normalize(request.query['p'])
+        self.files = {key: value for key, value in self.files.items() if not self._is_beneath(key, path)}
+        self.directories = {key for key in self.directories if key != path and not self._is_beneath(key, path)}
+        return web.json_response('success')
+
+    async def _get_dir_detail(self, request: web.Request) -> web.Response:
+        path = request.query.get('path', '/')
+        return web.json_response({
+            'repo_id': request.match_info['repo_id'],
+            'name': posixpath.basename(path.rstrip('/')) or '/',
+            'mtime': '2023-01-01T00:00:00+00:00',
+            'path': path
+        })
+
+    async def _get_download_link(self, request: web.Request) -> web.Response:
+        filepath = self._normalize(request.query.get('p', '/file'))
+
+        if filepath not in self.files and not self._settings.generate:
+            return web.json_response({'error_msg': 'File not found'}, status=404)
+
+        return web.json_response(f'{self._create_link("files")}/{quote(filepath.lstrip("/"))}')
+
+    async def _change_file(self, request: web.Request) -> web.Response:
+        path = self._normalize(request.query['p'])
+        form = await request.post()
+        operation = form.get('operation')
+
+        if operation == 'create':
+            self.files[path] = b''
+            return web.json_response('success', status=201)
+
+        if path not in self.files:
+            return web.json_response({'error_msg': 'File not found'}, status=404)
+
+        if operation == 'rename':
+            self._move(path, posixpath.join(posixpath.dirname(path), form['newname']))
+            return web.json_response('success')
+
+        if operation in ('move', 'copy'):
+            new_path = posixpath.join(self._normalize(form['dst_dir']), posixpath.basename(path))
+            self.files[new_path] = self.files[path]
+            if operation == 'move':
+                del self.files[path]
+            return web.json_response('success')
+
+        return web.json_response({'error_msg': 'Unknown operation.'}, status=400)
+
+    async def _delete_file(self, request: web.Request) -> web.Response:
+        self.files.pop(self._normalize(request.query['p']), None)
+        return web.json_response('success')
+
+    async def _get_file_detail(self, request: web.Request) -> web.Response:
+        filepath = self._normalize(request.query.get('p', '/file'))
+
+        if filepath in self.files:
+            item = self._create_stored_item(filepath)
+        elif self._settings.generate:
+            item = {
+                'id': '1' * 40,
+                'type': 'file',
+                'name': posixpath.basename(filepath),
+                'mtime': self.MTIME,
+                'permission': 'rw',
+                'size': self._settings.file_sizes.get(filepath, self._settings.file_size),
+                'starred': False
+            }
+        else:
+            return web.json_response({'error_msg': 'File not found'}, status=404)
+
+        return web.json_response(item | {
+            'is_draft': False,
+            'has_draft': False,
+            'can_edit': True,
+            'draft_id': None,
+            'draft_file_path': '',
+            'comment_total': 0,
+            'last_modified': '2023-01-01T00:00:00+00:00',
+            'last_modifier_name': 'user',
+            'last_modifier_email': 'user@example.com',
+            'last_modifier_contact_email': 'user@example.com'
+        })
+
+    async def _get_upload_link(self, _: web.Request) -> web.Response:
+        return web.json_response(self._create_link('upload-api'))
+
+    async def _search(self, request: web.Request) -> web.Response:
+        return self._json_body(('search',), lambda: {
+            'data': [
+                {
+                    'path': f'/found_{index}.txt',
+                    'size': self._settings.file_size,
+                    'mtime': '2023-01-01T00:00:00+00:00',
+                    'type': 'file'
+                }
+                for index in range(self._settings.search_results)
+            ]
+        })
+
+    async def _upload(self, request: web.Request) -> web.Response:
+        if request.match_info['link'] in self.expired_links:
+            await request.read()
+            return web.json_response({'error_msg': 'Access denied'}, status=403)
+
+        reader = await request.multipart()
+        fields: Dict[str, str] = dict()
+        files: List[Tuple[str, bytes, int]] = list()
+
+        async for part in reader:
+            if part.name != 'file':
+                fields[part.name] = await part.text()
+                continue
+
+            size, chunks = 0, list()
+            while chunk := await part.read_chunk():
+                size += len(chunk)
+                if not self._settings.generate:
+                    chunks.append(chunk)
+
+            self.uploaded_bytes += size
+            files.append((part.filename, b''.join(chunks), size))
+
+        if self._settings.generate:
+            return web.json_response([{'id': '2' * 40, 'name': name, 'size': size} for name, _, size in files])
+
+        parent_dir = self._normalize(posixpath.join(fields['parent_dir'], fields.get('relative_path', '').strip('/')))
+        parent = parent_dir
+        while parent not in self.directories:
+            self.directories.add(parent)
+            parent = posixpath.dirname(parent)
+
+        uploaded = list()
+        for name, body, size in files:
+            path = posixpath.join(parent_dir, name)
+            self.files[path] = body
+            uploaded.append({'id': self._get_id(path), 'name': name, 'size': size})
+
+        return web.json_response(uploaded)
+
+    async def _download(self, request: web.Request) -> web.Response:
+        if request.match_info['link'] in self.expired_links:
+            return web.json_response({'error_msg': 'Access denied'}, status=403)
+
+        filepath = '/' + request.match_info['filepath']
+
+        if filepath in self.files:
+            content = self.files[filepath]
+        elif self._settings.generate:
+            content = self._file_content[:self._settings.file_sizes.get(filepath, self._settings.file_size)]
+        else:
+            return web.json_response({'error_msg': 'File not found'}, status=404)
+
+        match = self.RANGE_PATTERN.fullmatch(request.headers.get('Range', ''))
+
+        if match is None:
+            return web.Response(body=content, content_type='application/octet-stream')
+
+        start = int(match.group(1))
+        end = min(int(match.group(2)) if match.group(2) else len(content) - 1, len(content) - 1)
+        if start >= len(content):
+            return web.Response(status=416, headers={'Content-Range': f'bytes */{len(content)}'})
+
+        return web.Response(
+            status=206,
+            body=content[start:end + 1],
+            content_type='application/octet-stream',
+            headers={'Content-Range': f'bytes {start}-{end}/{len(content)}'}
+        )
+
+    def _json_body(self, key: Tuple, create_content) -> web.Response:
+        """Respond with json body encoded once for the key"""
+        body = self._bodies.get(key)
+        if body is None:
+            body = self._bodies[key] = json.dumps(create_content()).encode()
+
+        return web.Response(body=body, content_type='application/json')
+
+    def _create_link(self, kind: str) -> str:
+        """Issue a new download or upload link"""
+        link = f'link{next(self._link_ids)}'
+        self.links.add(link)
+        return f'{self.url}seafhttp/{kind}/{link}'
+
+    def _create_repo_item(self, index: int) -> Dict[str, Any]:
+        return {
+            'id': self.REPO_ID[:-len(str(index))] + str(index),
+            'type': 'repo',
+            'name': f'repo_{index}',
+            'mtime': self.MTIME,
+            'permission': 'rw',
+            'size': self._settings.file_size * self._settings.listing_size,
+            'owner': 'user@example.com'
+        }
+
+    def _create_listing(self, path: str, item_type: str | None, recursive: bool):
+        files, directories = self._settings.listing_size, self._settings.listing_directories
+
+        if path in self._settings.listing_sizes:
+            size = self._settings.listing_sizes[path]
+            files, directories = (0, size) if item_type == 'd' else (size, 0)
+
+        items = list()
+
+        if item_type in (None, 'd'):
+            items += [
+                {
+                    'id': f'{index:040x}',
+                    'type': 'dir',
+                    'name': f'dir_{index}',
+                    'mtime': self.MTIME + index,
+                    'permission': 'rw'
+                } | ({'parent_dir': path} if recursive else {})
+                for index in range(directories)
+            ]
+
+        if item_type in (None, 'f'):
+            items += [
+                {
+                    'id': f'{index:040x}',
+                    'type': 'file',
+                    'name': f'file_{index}.txt',
+                    'mtime': self.MTIME + index,
+                    'permission': 'rw',
+                    'size': self._settings.file_size,
+                    'modifier_name': 'user',
+                    'modifier_email': 'user@example.com',
+                    'modifier_contact_email': 'user@example.com',
+                    'starred': False
+                }
+                for index in range(files)
+            ]
+
+        return items
+
+    def _create_stored_item(self, path: str) -> Dict[str, Any]:
+        item = {
+            'id': self._get_id(path),
+            'type': 'file' if path in self.files else 'dir',
+            'name': posixpath.basename(path),
+            'mtime': self.MTIME,
+            'permission': 'rw'
+        }
+
+        if path in self.files:
+            item |= {
+                'size': len(self.files[path]),
+                'modifier_name': 'user',
+                'modifier_email': 'user@example.com',
+                'modifier_contact_email': 'user@example.com',
+                'starred': False
+            }
+
+        return item
+
+    def _is_stored_directory(self, path: str) -> bool:
+        return path in self.directories or any(
+            self._is_beneath(item, path) for item in itertools.chain(self.files, self.directories))
+
+    def _children(self, path: str) -> Set[str]:
+        return {
+            item[len(path.rstrip('/')) + 1:].split('/')[0]
+            for item in itertools.chain(self.files, self.directories)
+            if self._is_beneath(item, path)
+        }
+
+    def _move(self, path: str, new_path: str):
+        for key in [key for key in self.files if key == path or self._is_beneath(key, path)]:
+            self.files[new_path + key[len(path):]] = self.files.pop(key)
+        for key in [key for key in self.directories if key == path or self._is_beneath(key, path)]:
+            self.directories.discard(key)
+            self.directories.add(new_path + key[len(path):])
+
+    def _get_id(self, path: str) -> str:
+        content = self.files.get(path)
+        if content is None:
+            # id of directory changes with anything beneath it
+            content = ','.join(
+                name + ':' + self._get_id(posixpath.join(path, name)) for name in sorted(self._children(path))).encode()
+        return hashlib.sha1(path.encode() + content).hexdigest()
+
+    @staticmethod
+    def _is_beneath(path: str, directory: str) -> bool:
+        return path != directory and path.startswith(directory.rstrip('/') + '/')
+
+    @staticmethod
+    def _normalize(path: str) -> str:
+        return posixpath.normpath('/' + path.strip('/'))
+
+
+async def serve(settings: StandInSettings, host: str, port: int):
+    async with SeafileStandIn(settings, host, port) as server:
+        print(f'Seafile stand-in is listening on {server.url}', flush=True)
+        await asyncio.Event().wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1', help='host to listen on')
+    parser.add_argument('--port', type=int, default=8000, help='port to listen on')
+    parser.add_argument('--latency', type=float, default=0.0, help='delay of every response in seconds')
+    parser.add_argument('--listing-size', type=int, default=100, help='number of files in every directory')
+    parser.add_argument('--file-size', type=int, default=1024 * 1024, help='size of every file in bytes')
+    args = parser.parse_args()
+
+    settings = StandInSettings(latency=args.latency, listing_size=args.listing_size, file_size=args.file_size)
+
+    try:
+        asyncio.run(serve(settings, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -6,13 +6,67 @@ from .models import (
     DirectoryItemDetail,
     FileItem,
     FileItemDetail,
+    FileListingDetail,
     UploadFile,
+    UploadPayload,
+    UploadSource,
     UploadedFileItem,
     RepoItem,
-    SmartLink
+    SmartLink,
+    ConnectionSettings,
+    CacheSettings,
+    BulkUploadItemResult,
+    BulkUploadResult,
+    TreeSnapshot,
+    TreeDiff,
+    CommitItem,
+    CommitHistory,
+    CommitChanges,
+    ChangeEvent,
+    CompactListing,
+    BatchItemResult,
+    BatchOperationResult,
+    CopyMoveProgress,
+    RetryPolicy,
+    LimiterMetrics,
+    RecordedCall
 )
 
 from .enums import (
     ItemType,
-    RepoType
+    RepoType,
+    ChangeType,
+    ParseMode,
+    BatchOperation
+)
+
+from .caching import (
+    CacheBackend,
+    MemoryCacheBackend,
+    ResponseCache,
+    SingleFlight
+)
+
+from .parsers import (
+    ResponseParser,
+    JsonLoads
+)
+
+from .tasks import CopyMoveTask
+
+from .metrics import (
+    MetricsRegistry,
+    MetricsCallback,
+    RouteMetrics,
+    RequestTrace,
+    LatencyHistogram
+)
+
+from .recording import TrafficRecorder
+
+from .loaders import FileDetailLoader
+
+from .limiting import (
+    AdaptiveLimiter,
+    LimiterPermit
 )
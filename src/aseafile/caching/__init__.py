@@ -0,0 +1,5 @@
+from .ttl_cache import TTLCache
+from .cache_backend import CacheBackend
+from .memory_cache_backend import MemoryCacheBackend
+from .response_cache import ResponseCache
+from .single_flight import SingleFlight
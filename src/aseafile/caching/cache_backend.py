@@ -0,0 +1,32 @@
+from typing import Any, Callable, Hashable
+from abc import ABCMeta, abstractmethod
+
+
+class CacheBackend(metaclass=ABCMeta):
+    """Storage of cached responses"""
+
+    @abstractmethod
+    async def get(self, key: Hashable) -> Any | None:
+        """Get value by key or None if it is missing or expired"""
+        ...
+
+    @abstractmethod
+    async def set(self, key: Hashable, value: Any, ttl: float | None = None):
+        """Save value by key for ttl seconds"""
+        ...
+
+    @abstractmethod
+    async def delete(self, key: Hashable):
+        ...
+
+    @abstractmethod
+    async def clear(self):
+        ...
+
+    def set_eviction_callback(self, callback: Callable[[Hashable], Any] | None):
+        """Set function called with keys of entries the backend removed by itself (expired or evicted by size).
+
+        Backends that can not report evictions leave it unused,
+        keys of such entries are forgotten by ResponseCache when they are requested and missed.
+        """
+        pass
@@ -0,0 +1,28 @@
+from typing import Any, Callable, Hashable
+from .ttl_cache import TTLCache
+from .cache_backend import CacheBackend
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-memory storage of cached responses with limited lifetime and number of entries"""
+
+    def __init__(self, ttl: float = 30, max_size: int = 4096):
+        self._cache = TTLCache(ttl, max_size)
+
+    async def get(self, key: Hashable) -> Any | None:
+        return self._cache.get(key)
+
+    async def set(self, key: Hashable, value: Any, ttl: float | None = None):
+        self._cache.set(key, value, ttl)
+
+    async def delete(self, key: Hashable):
+        self._cache.delete(key)
+
+    async def clear(self):
+        self._cache.clear()
+
+    def set_eviction_callback(self, callback: Callable[[Hashable], Any] | None):
+        self._cache.on_evict = callback
+
+    def __len__(self) -> int:
+        return len(self._cache)
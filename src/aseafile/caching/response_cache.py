@@ -0,0 +1,153 @@
+import hashlib
+import posixpath
+from urllib.parse import urlencode
+from typing import Any, Dict, Hashable, Tuple
+from .cache_backend import CacheBackend
+from .memory_cache_backend import MemoryCacheBackend
+
+
+class ResponseCache:
+    """Cache of metadata responses that is invalidated by changes of repositories
+
+    Every entry is bound to the repository and path it describes, entries without repository
+    (e.g. list of repositories) are invalidated by any change.
+    Cached results are shared between callers, so they should not be modified.
+
+    Every invalidation increments generation of the repository (or global one for all repositories),
+    a response requested before invalidation and received after it is not saved if generation is passed to set.
+    """
+
+    def __init__(self, backend: CacheBackend | None = None, ttl: float | None = None):
+        self._backend = backend if backend is not None else MemoryCacheBackend()
+        self._ttl = ttl
+        self._hits = 0
+        self._misses = 0
+        self._index: Dict[str | None, Dict[Hashable, str | None]] = dict()
+        self._scopes: Dict[Hashable, str | None] = dict()
+        self._global_generation = 0
+        self._generations: Dict[str | None, int] = dict()
+        self._backend.set_eviction_callback(self._forget)
+
+    @property
+    def backend(self) -> CacheBackend:
+        return self._backend
+
+    @property
+    def hits(self) -> int:
+        """Number of responses taken from cache"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Number of responses that were not found in cache"""
+        return self._misses
+
+    @staticmethod
+    def create_key(request_key: Tuple, content_type: Any = None) -> str:
+        """Create key of cache entry by request key (method, url, query parameters and token) and type of content"""
+        method, url, query_params, token = request_key
+        token_hash = hashlib.sha256(token.encode()).hexdigest() if token is not None else ''
+        return f'{method} {url}?{urlencode(query_params)} {token_hash} {content_type}'
+
+    def get_generation(self, repo_id: str | None = None) -> Tuple[int, int]:
+        """Get generation of cached responses about the repository, it changes with every related invalidation
+
+        :param repo_id: id of repository (None - responses without repository, changed by any invalidation)
+        """
+        return self._global_generation, self._generations.get(repo_id, 0)
+
+    async def get(self, key: Hashable) -> Any | None:
+        value = await self._backend.get(key)
+
+        if value is None:
+            self._misses += 1
+            self._forget(key)
+        else:
+            self._hits += 1
+
+        return value
+
+    async def set(
+            self,
+            key: Hashable,
+            value: Any,
+            repo_id: str | None = None,
+            path: str | None = None,
+            generation: Tuple[int, int] | None = None):
+        """Save response
+
+        :param key: key of request
+        :param value: response
+        :param repo_id: id of repository the response is about
+        :param path: path to directory or file the response is about (None - whole repository)
+        :param generation: generation of the repository taken before the request was sent,
+            the response is not saved if the repository was invalidated since then
+        """
+        if generation is not None and generation != self.get_generation(repo_id):
+            return
+
+        await self._backend.set(key, value, self._ttl)
+        self._forget(key)
+        self._index.setdefault(repo_id, dict())[key] = self._normalize_path(path)
+        self._scopes[key] = repo_id
+
+    async def invalidate(self, repo_id: str | None = None, path: str | None = None):
+        """Remove responses affected by change of the item
+
+        :param repo_id: id of changed repository (None - all repositories)
+        :param path: path to changed item (None - whole repository)
+        """
+        scopes = [None] + ([repo_id] if repo_id is not None else [key for key in self._index if key is not None])
+        path = self._normalize_path(path)
+
+        # responses without repository are changed by any invalidation
+        self._generations[None] = self._generations.get(None, 0) + 1
+        if repo_id is None:
+            self._global_generation += 1
+        else:
+            self._generations[repo_id] = self._generations.get(repo_id, 0) + 1
+
+        for scope in scopes:
+            entries = self._index.get(scope, dict())
+
+            for key, entry_path in list(entries.items()):
+                if scope is None or path is None or entry_path is None or self._is_related(entry_path, path):
+                    await self._backend.delete(key)
+                    self._forget(key)
+
+    async def clear(self):
+        self._global_generation += 1
+        await self._backend.clear()
+        self._index.clear()
+        self._scopes.clear()
+
+    def __len__(self) -> int:
+        """Number of indexed responses"""
+        return len(self._scopes)
+
+    def reset_counters(self):
+        self._hits = 0
+        self._misses = 0
+
+    def _forget(self, key: Hashable):
+        """Remove key from index of entries (when it was deleted, expired or evicted by the backend)"""
+        if key in self._scopes:
+            scope = self._scopes.pop(key)
+            entries = self._index[scope]
+            del entries[key]
+            if not entries:
+                del self._index[scope]
+
+    @staticmethod
+    def _is_related(entry_path: str, changed_path: str) -> bool:
+        """Check that one of paths is the same as another or contains it"""
+        return entry_path == changed_path \
+            or changed_path.startswith(entry_path.rstrip('/') + '/') \
+            or entry_path.startswith(changed_path.rstrip('/') + '/')
+
+    @staticmethod
+    def _normalize_path(path: str | None) -> str | None:
+        if path is None:
+            return None
+
+        return posixpath.normpath('/' + path.strip('/'))
@@ -0,0 +1,72 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """Group of in-flight calls shared by concurrent callers with the same key
+
+    The first caller starts the call, callers with the same key that come before it is finished
+    wait for it and get the same result (or exception). Finished calls are not remembered.
+    Shared results should not be modified by callers.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Tuple[asyncio.Task, Hashable]] = dict()
+        self._started = 0
+        self._shared = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls being executed"""
+        return len(self._calls)
+
+    @property
+    def started(self) -> int:
+        """Number of calls that were started"""
+        return self._started
+
+    @property
+    def shared(self) -> int:
+        """Number of callers that joined a call started by another caller"""
+        return self._shared
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]], scope: Hashable = None) -> T:
+        """Execute the call or join the call with the same key being executed
+
+        :param key: key identifying the call
+        :param call: function starting the call
+        :param scope: scope of the call used to forget it (e.g. id of repository)
+        """
+        entry = self._calls.get(key)
+
+        if entry is None:
+            task = asyncio.ensure_future(call())
+            task.add_done_callback(lambda finished: self._finish(key, finished))
+            self._calls[key] = (task, scope)
+            self._started += 1
+        else:
+            task = entry[0]
+            self._shared += 1
+
+        # cancellation of one caller does not cancel the call shared with others
+        return await asyncio.shield(task)
+
+    def forget(self, scope: Hashable = None):
+        """Do not share calls being executed with next callers (e.g. after the data was changed)
+
+        :param scope: scope of forgotten calls (None - all calls)
+        """
+        for key, (_, call_scope) in list(self._calls.items()):
+            if scope is None or call_scope is None or call_scope == scope:
+                del self._calls[key]
+
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        entry = self._calls.get(key)
+        if entry is not None and entry[0] is task:
+            del self._calls[key]
+
+        # exception is retrieved in case all callers were cancelled
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,70 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Tuple
+
+
+class TTLCache:
+    """Least recently used cache with limited lifetime of entries
+
+    :param ttl: default lifetime of entries in seconds
+    :param max_size: maximum number of entries
+    :param on_evict: function called with key of every entry removed because it expired or did not fit
+    """
+
+    def __init__(self, ttl: float, max_size: int = 1024, on_evict: Callable[[Hashable], Any] | None = None):
+        if ttl <= 0 or max_size <= 0:
+            raise ValueError('Ttl and max size of cache should be positive')
+
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self.on_evict = on_evict
+
+    @property
+    def ttl(self) -> float:
+        """Default lifetime of entries in seconds"""
+        return self._ttl
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of entries"""
+        return self._max_size
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self._evicted(key)
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None):
+        self._entries[key] = (time.monotonic() + (ttl if ttl is not None else self._ttl), value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_size:
+            evicted_key, _ = self._entries.popitem(last=False)
+            self._evicted(evicted_key)
+
+    def delete(self, key: Hashable):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def _evicted(self, key: Hashable):
+        if self.on_evict is not None:
+            self.on_evict(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, self) is not self
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -3,3 +3,6 @@ from .dir_operations import DirectoryOperation
 from .http_methods import HttpMethod
 from .item_type import ItemType
 from .repo_type import RepoType
+from .change_type import ChangeType
+from .parse_mode import ParseMode
+from .batch_operation import BatchOperation
@@ -0,0 +1,11 @@
+from .base import StrEnum
+
+
+class BatchOperation(StrEnum):
+    """Enumeration of operations that can be performed on many items of a directory at once"""
+
+    COPY = 'copy'
+
+    MOVE = 'move'
+
+    DELETE = 'delete'
@@ -0,0 +1,19 @@
+from .base import StrEnum
+
+
+class ChangeType(StrEnum):
+    """Enumeration of types of changes made by the repository commit"""
+
+    ADDED = 'added'
+
+    REMOVED = 'removed'
+
+    MODIFIED = 'modified'
+
+    RENAMED = 'renamed'
+
+    MOVED = 'moved'
+
+    DIRECTORY_ADDED = 'directory_added'
+
+    DIRECTORY_REMOVED = 'directory_removed'
@@ -0,0 +1,14 @@
+from .base import StrEnum
+
+
+class ParseMode(StrEnum):
+    """Enumeration of ways to turn response content into result objects"""
+
+    # Parse and validate models with pydantic (types are coerced, invalid content raises)
+    VALIDATE = 'validate'
+
+    # Build models without validation (content is trusted, values are not coerced)
+    CONSTRUCT = 'construct'
+
+    # Return decoded json as is (dicts and lists instead of models)
+    RAW = 'raw'
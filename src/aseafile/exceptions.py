@@ -1,3 +1,8 @@
+from http import HTTPStatus
+from typing import List
+from .models.error import Error
+
+
 class UnauthorizedError(Exception):
     """Custom exception that is raised when a token obtained error occurs"""
 
@@ -6,3 +11,17 @@ class UnauthorizedError(Exception):
 
         if args is not None and len(args) > 0:
             self.message = args[0] if args[0] is not None else 'The access token was not obtained'
+
+
+class DownloadError(Exception):
+    """Custom exception that is raised when a file could not be downloaded"""
+
+    def __init__(self, status: HTTPStatus, errors: List[Error] | None = None):
+        self.status = status
+        self.errors = errors
+        self.message = f'Failed to download file ({status.value} {status.phrase})'
+
+        if errors:
+            self.message += ': ' + ', '.join(e.message for e in errors)
+
+        super().__init__(self.message)
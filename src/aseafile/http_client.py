@@ -1,21 +1,93 @@
+import io
+import os
+import sys
+import json
+import time
+import asyncio
+import fnmatch
+import posixpath
+import inspect
 import aiohttp
-from typing import Dict, List, BinaryIO, Any
-from urllib.parse import urljoin
+from http import HTTPStatus
+from collections import deque
+from contextlib import aclosing
+from typing import Dict, List, BinaryIO, Any, Type, TypeVar, Tuple, Callable, Iterable, AsyncIterator, AsyncIterable
+from urllib.parse import urljoin, quote
 from .enums import *
 from .models import *
 from .builders import QueryParams
+from .parsers import ResponseParser, JsonLoads
 from .route_storage import RouteStorage
-from .http_handlers import HttpRequestHandler, HttpDownloadHandler
+from .caching import TTLCache, ResponseCache, SingleFlight
+from .tasks import CopyMoveTask
+from .limiting import AdaptiveLimiter
+from .metrics import MetricsRegistry
+from .exceptions import DownloadError
+from .http_handlers import BaseHttpHandler, HttpRequestHandler, HttpDownloadHandler, FilePayload
+
+T = TypeVar('T')
+HandlerT = TypeVar('HandlerT', bound=BaseHttpHandler)
 
 
 class SeafileHttpClient:
     """Httpclient providing seafile web api methods."""
 
-    def __init__(self, base_url: str):
+    # Statuses of fileserver response meaning that the upload link is no longer valid
+    EXPIRED_UPLOAD_LINK_STATUSES = (
+        HTTPStatus.UNAUTHORIZED,
+        HTTPStatus.FORBIDDEN,
+        HTTPStatus.NOT_FOUND
+    )
+
+    # Statuses of fileserver response meaning that the reusable download link is no longer valid
+    EXPIRED_DOWNLOAD_LINK_STATUSES = (
+        HTTPStatus.FORBIDDEN,
+        HTTPStatus.NOT_FOUND
+    )
+
+    # Lifetime of reusable download link in seconds
+    REUSABLE_DOWNLOAD_LINK_TTL = 3600
+
+    # Reusable download links are removed from cache earlier than they expire by this number of seconds
+    DOWNLOAD_LINK_TTL_MARGIN = 60
+
+    def __init__(
+            self,
+            base_url: str,
+            connection_settings: ConnectionSettings | None = None,
+            upload_link_cache: CacheSettings | None = None,
+            download_link_cache: CacheSettings | None = None,
+            response_cache: ResponseCache | None = None,
+            parse_mode: ParseMode = ParseMode.VALIDATE,
+            json_loads: JsonLoads | None = None,
+            retry_policy: RetryPolicy | None = None,
+            concurrency_limiter: AdaptiveLimiter | None = None,
+            metrics: MetricsRegistry | None = None,
+            single_flight: SingleFlight | None = None):
         self._version = 'v2.1'
         self._token = None
         self._base_url = base_url
         self._route_storage = RouteStorage()
+        self._connection_settings = connection_settings or ConnectionSettings()
+        self._session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+        self._upload_link_cache = self._create_cache(upload_link_cache)
+        self._download_link_cache = self._create_cache(download_link_cache)
+        self._response_cache = response_cache
+        self._parser = ResponseParser(ParseMode.VALIDATE, json_loads)
+        self._listing_parser = ResponseParser(parse_mode, json_loads)
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._concurrency_limiter = concurrency_limiter
+        self._metrics = metrics
+        self._single_flight = single_flight
+
+    async def __aenter__(self):
+        if self._connection_settings.warmup_connections > 0:
+            await self.warmup()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
 
     @property
     def version(self):
@@ -32,6 +104,76 @@ class SeafileHttpClient:
         """Access token"""
         return self._token
 
+    @property
+    def connection_settings(self) -> ConnectionSettings:
+        """Settings of the connection pool"""
+        return self._connection_settings
+
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        """Cache of metadata responses (None if caching is disabled)"""
+        return self._response_cache
+
+    @property
+    def single_flight(self) -> SingleFlight | None:
+        """Group of identical concurrent requests sharing one call (None if requests are not coalesced)"""
+        return self._single_flight
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """Policy of repeating requests failed by transient errors"""
+        return self._retry_policy
+
+    @property
+    def concurrency_limiter(self) -> AdaptiveLimiter | None:
+        """Adaptive limiter of concurrent requests (None if requests are not limited)"""
+        return self._concurrency_limiter
+
+    @property
+    def metrics(self) -> MetricsRegistry | None:
+        """Registry of metrics of requests by routes (None if metrics are not collected)"""
+        return self._metrics
+
+    @property
+    def parse_mode(self) -> ParseMode:
+        """Way of parsing directory and repository listings (other responses are always validated)"""
+        return self._listing_parser.mode
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Http session shared by all requests of the client.
+
+        The session is created on first access inside a running event loop
+        and recreated if it was closed or the client is used from another event loop.
+        The session of another loop is closed in that loop if it is still running (e.g. in another thread),
+        otherwise it can not be closed gracefully and is detached: its pooled connections are not reused
+        and their sockets are closed when they are garbage collected.
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._release_session()
+            self._session = self._create_session()
+            self._session_loop = loop
+
+        return self._session
+
+    async def warmup(self, connections: int | None = None):
+        """Open connections to seafile service beforehand and keep them in the pool
+
+        :param connections: number of connections to open (by default from connection settings)
+        """
+        connections = connections or self._connection_settings.warmup_connections
+        await asyncio.gather(*(self.ping() for _ in range(connections)))
+
+    async def aclose(self):
+        """Close the shared session and all pooled connections"""
+        session_is_open = self._session is not None and not self._session.closed
+        if session_is_open and self._session_loop is asyncio.get_running_loop():
+            await self._session.close()
+
+        self._release_session()
+
     async def ping(self):
         """Ping seafile service
 
@@ -39,7 +181,8 @@ class SeafileHttpClient:
         """
         method_url = urljoin(self.base_url, self._route_storage.ping)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.GET,
             url=method_url
         )
@@ -53,7 +196,8 @@ class SeafileHttpClient:
         """
         method_url = urljoin(self.base_url, self._route_storage.auth_ping)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.GET,
             url=method_url,
             token=token or self.token
@@ -74,7 +218,8 @@ class SeafileHttpClient:
         data.add_field('username', username)
         data.add_field('password', password)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.POST,
             url=method_url,
             data=data
@@ -105,19 +250,15 @@ class SeafileHttpClient:
         """
         method_url = urljoin(self.base_url, self._route_storage.default_repo)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.GET,
             url=method_url,
             token=token or self.token
         )
 
-        response = await handler.execute(content_type=Dict[str, Any])
-        result = SeaResult[str](
-            success=response.success,
-            status=response.status,
-            errors=response.errors,
-            content=None
-        )
+        response = await self._execute_cached(handler, Dict[str, Any])
+        result = SeaResult[str].from_result(response)
 
         if not result.success:
             return result
@@ -134,19 +275,15 @@ class SeafileHttpClient:
         """
         method_url = urljoin(self.base_url, self._route_storage.default_repo)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.POST,
             url=method_url,
             token=token or self.token
         )
 
-        response = await handler.execute(content_type=Dict[str, Any])
-        result = SeaResult[str](
-            success=response.success,
-            status=response.status,
-            errors=response.errors,
-            content=None
-        )
+        response = await self._execute_and_invalidate(handler, None, content_type=Dict[str, Any])
+        result = SeaResult[str].from_result(response)
 
         if not result.success:
             return result
@@ -168,14 +305,16 @@ class SeafileHttpClient:
         query_params = QueryParams()
         query_params.add_param_if_exists('type', repo_t)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.GET,
             url=method_url,
             token=token or self.token,
-            query_params=query_params.get_result()
+            query_params=query_params.get_result(),
+            parser=self._listing_parser
         )
 
-        return await handler.execute(content_type=List[RepoItem])
+        return await self._execute_cached(handler, List[RepoItem])
 
     async def create_repo(self, repo_name: str, token: str | None = None) -> SeaResult[RepoItem]:
         """Create repo
@@ -189,20 +328,16 @@ class SeafileHttpClient:
         data = aiohttp.FormData()
         data.add_field('name', repo_name)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.POST,
             url=method_url,
             token=token or self.token,
             data=data
         )
 
-        response = await handler.execute(content_type=Dict[str, Any])
-        result = SeaResult[RepoItem](
-            success=response.success,
-            status=response.status,
-            errors=response.errors,
-            content=None
-        )
+        response = await self._execute_and_invalidate(handler, None, content_type=Dict[str, Any])
+        result = SeaResult[RepoItem].from_result(response)
 
         if not result.success:
             return result
@@ -228,13 +363,219 @@ class SeafileHttpClient:
         """
         method_url = urljoin(self.base_url, self._route_storage.repo(repo_id))
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.DELETE,
             url=method_url,
             token=token or self.token
         )
 
-        return await handler.execute()
+        return await self._execute_and_invalidate(handler, repo_id)
+
+    async def get_head_commit(self, repo_id: str, token: str | None = None):
+        """Get id of the latest commit of the repository
+
+        :param repo_id: id of repository
+        :param token: access token
+        :returns: SeaResult object with commit id
+        """
+        method_url = urljoin(self.base_url, self._route_storage.repo(repo_id))
+
+        handler = self._create_handler(
+            HttpRequestHandler,
+            method=HttpMethod.GET,
+            url=method_url,
+            token=token or self.token
+        )
+
+        response = await handler.execute(content_type=Dict[str, Any])
+        result = SeaResult[str].from_result(response)
+
+        if result.success and response.content:
+            result.content = response.content['head_commit_id']
+
+        return result
+
+    async def get_commits(self, repo_id: str, page: int = 1, per_page: int = 100, token: str | None = None):
+        """Get page of the repository history, newest commits go first
+
+        :param repo_id: id of repository
+        :param page: number of page starting from 1
+        :param per_page: number of commits on the page
+        :param token: access token
+        :returns: SeaResult object with CommitHistory
+        """
+        method_url = urljoin(self.base_url, self._route_storage.repo_history(repo_id))
+
+        query_params = QueryParams()
+        query_params.add_param('page', page)
+        query_params.add_param('per_page', per_page)
+
+        handler = self._create_handler(
+            HttpRequestHandler,
+            method=HttpMethod.GET,
+            url=method_url,
+            token=token or self.token,
+            query_params=query_params.get_result()
+        )
+
+        return await handler.execute(content_type=CommitHistory)
+
+    async def get_commit_changes(self, repo_id: str, commit_id: str, token: str | None = None):
+        """Get paths of items changed by the commit
+
+        :param repo_id: id of repository
+        :param commit_id: id of commit
+        :param token: access token
+        :returns: SeaResult object with CommitChanges
+        """
+        method_url = urljoin(self.base_url, self._route_storage.repo_history_changes(repo_id))
+
+        query_params = QueryParams()
+        query_params.add_param('commit_id', commit_id)
+
+        handler = self._create_handler(
+            HttpRequestHandler,
+            method=HttpMethod.GET,
+            url=method_url,
+            token=token or self.token,
+            query_params=query_params.get_result()
+        )
+
+        return await handler.execute(content_type=CommitChanges)
+
+    async def get_changes(
+            self,
+            repo_id: str,
+            since_commit_id: str,
+            until_commit_id: str | None = None,
+            concurrency: int = 8,
+            token: str | None = None) -> SeaResult[List[ChangeEvent]]:
+        """Get changes made by commits after since_commit_id up to until_commit_id inclusive
+
+        :param repo_id: id of repository
+        :param since_commit_id: id of commit after which changes are returned
+        :param until_commit_id: id of the last commit whose changes are returned (head commit by default)
+        :param concurrency: maximum number of commit changes requested at the same time
+        :param token: access token
+        :returns: SeaResult object with list of ChangeEvent in order of commits (oldest first)
+        """
+        if concurrency <= 0:
+            raise ValueError('Concurrency should be positive')
+
+        if until_commit_id is None:
+            head_result = await self.get_head_commit(repo_id, token)
+            if not head_result.success:
+                return SeaResult[List[ChangeEvent]](
+                    success=False,
+                    status=head_result.status,
+                    errors=head_result.errors,
+                    content=None
+                )
+            until_commit_id = head_result.content
+
+        commits = list()
+        collecting = False
+        found = since_commit_id == until_commit_id
+        page = 1
+
+        while not found:
+            history_result = await self.get_commits(repo_id, page, token=token)
+            if not history_result.success:
+                return SeaResult[List[ChangeEvent]](
+                    success=False,
+                    status=history_result.status,
+                    errors=history_result.errors,
+                    content=None
+                )
+
+            for commit in history_result.content.data:
+                if commit.commit_id == since_commit_id:
+                    found = True
+                    break
+
+                collecting = collecting or commit.commit_id == until_commit_id
+                if collecting:
+                    commits.append(commit)
+
+            if not history_result.content.more:
+                break
+            page += 1
+
+        if not found:
+            return SeaResult[List[ChangeEvent]](
+                success=False,
+                status=HTTPStatus.NOT_FOUND,
+                errors=[Error(
+                    title='commit_not_found',
+                    message=f'Commit {since_commit_id} is not found in the history before {until_commit_id}')],
+                content=None
+            )
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get_commit_changes(commit_id: str):
+            async with semaphore:
+                return await self.get_commit_changes(repo_id, commit_id, token)
+
+        changes_results = await asyncio.gather(*(get_commit_changes(commit.commit_id) for commit in commits))
+
+        events = list()
+        for commit, changes_result in zip(reversed(commits), reversed(changes_results)):
+            if not changes_result.success:
+                return SeaResult[List[ChangeEvent]](
+                    success=False,
+                    status=changes_result.status,
+                    errors=changes_result.errors,
+                    content=None
+                )
+            events.extend(self._create_change_events(commit, changes_result.content))
+
+        return SeaResult[List[ChangeEvent]](
+            success=True,
+            status=HTTPStatus.OK,
+            errors=None,
+            content=events
+        )
+
+    async def iter_changes(
+            self,
+            repo_id: str,
+            cursor: str | None = None,
+            poll_interval: float = 30.0,
+            on_error: Callable[[SeaResult], None] | None = None,
+            token: str | None = None) -> AsyncIterator[ChangeEvent]:
+        """Poll the repository for new commits and yield their changes endlessly
+
+        Changes of one commit are yielded together, commit_id of the processed event
+        can be saved as a cursor to continue reading changes after restart.
+
+        :param repo_id: id of repository
+        :param cursor: id of commit after which changes are yielded (current head commit by default)
+        :param poll_interval: delay between polls in seconds
+        :param on_error: function called with failed result of polling (polling continues)
+        :param token: access token
+        :returns: async iterator over ChangeEvent
+        """
+        while True:
+            head_result = await self.get_head_commit(repo_id, token)
+
+            if not head_result.success:
+                if on_error is not None:
+                    on_error(head_result)
+            elif cursor is None:
+                cursor = head_result.content
+            elif head_result.content != cursor:
+                changes_result = await self.get_changes(repo_id, cursor, head_result.content, token=token)
+
+                if changes_result.success:
+                    for event in changes_result.content:
+                        yield event
+                    cursor = head_result.content
+                elif on_error is not None:
+                    on_error(changes_result)
+
+            await asyncio.sleep(poll_interval)
 
     async def get_upload_link(self, repo_id: str, dir_path: str, token: str | None = None):
         """Get a link to upload file
@@ -249,7 +590,8 @@ class SeafileHttpClient:
         query_params = QueryParams()
         query_params.add_param('p', dir_path)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.GET,
             url=method_url,
             token=token or self.token,
@@ -263,7 +605,7 @@ class SeafileHttpClient:
             repo_id: str,
             dir_path: str,
             filename: str,
-            payload: BinaryIO,
+            payload: UploadPayload,
             replace: bool = False,
             relative_path: str | None = None,
             token: str | None = None
@@ -273,50 +615,19 @@ class SeafileHttpClient:
         :param repo_id: id of repository where file will be uploaded
         :param dir_path: path to directory where file will be uploaded
         :param filename: name of uploaded file
-        :param payload: file contents
+        :param payload: file contents (file object, bytes or async iterator over chunks of bytes,
+        the iterator is streamed into request body without reading it into memory)
         :param replace: indicates whether file should be overwritten if it already exists
         :param relative_path: sub-folder of "parent_dir", if this sub-folder does not exist, Seafile will create it recursively
         :param token: access token
         :returns: SeaResult object with UploadedFileItem
         """
-        upload_ilnk_response = await self.get_upload_link(repo_id, dir_path, token)
-
-        if not upload_ilnk_response.success:
-            return SeaResult[UploadedFileItem](
-                success=upload_ilnk_response.success,
-                status=upload_ilnk_response.status,
-                errors=upload_ilnk_response.errors,
-                content=None
-            )
-
-        query_params = QueryParams()
-        query_params.add_param('ret-json', 1)
-
-        data = aiohttp.FormData()
-        data.add_field('file', payload, filename=filename)
-        data.add_field('parent_dir', dir_path)
-        data.add_field('replace', str(int(replace)))
-
-        if relative_path is not None:
-            data.add_field('relative_path', relative_path)
-
-        handler = HttpRequestHandler(
-            method=HttpMethod.POST,
-            url=upload_ilnk_response.content,
-            token=token or self.token,
-            query_params=query_params.get_result(),
-            data=data
-        )
+        files = [UploadFile(filename=filename, payload=payload)]
+        upload_response = await self._upload_files(repo_id, dir_path, files, replace, relative_path, token)
 
-        upload_response = await handler.execute(content_type=List[UploadedFileItem])
-        result = SeaResult[UploadedFileItem](
-            success=upload_response.success,
-            status=upload_response.status,
-            errors=upload_response.errors,
-            content=None
-        )
+        result = SeaResult[UploadedFileItem].from_result(upload_response)
 
-        if result.success and upload_response.content is not None:
+        if result.success and upload_response.content:
             result.content = upload_response.content.pop()
 
         return result
@@ -333,43 +644,255 @@ class SeafileHttpClient:
 
         :param repo_id: id of repository where files will be uploaded
         :param dir_path: path to directory where files will be uploaded
-        :param files: list of named tuples from file name and its contents
+        :param files: list of named tuples from file name and its contents (payloads may be async iterators)
         :param replace: indicates whether the file should be overwritten if it already exists
         :param relative_path: sub-folder of "parent_dir", if this sub-folder does not exist, Seafile will create it recursively
         :param token: access token
         :returns: SeaResult object with list of UploadedFileItem
         """
-        upload_ilnk_response = await self.get_upload_link(repo_id, dir_path, token)
+        return await self._upload_files(repo_id, dir_path, files, replace, relative_path, token)
 
-        if not upload_ilnk_response.success:
-            SeaResult[List[UploadedFileItem]](
-                success=upload_ilnk_response.success,
-                status=upload_ilnk_response.status,
-                errors=upload_ilnk_response.errors,
-                content=[]
-            )
+    async def bulk_upload(
+            self,
+            repo_id: str,
+            files: Iterable[Tuple[str, UploadSource]] | AsyncIterable[Tuple[str, UploadSource]],
+            max_batch_size: int = 16 * 1024 * 1024,
+            max_batch_files: int = 50,
+            concurrency: int = 4,
+            max_open_files: int = 64,
+            max_pending_dirs: int = 32,
+            max_pending_size: int = 64 * 1024 * 1024,
+            replace: bool = False,
+            token: str | None = None) -> BulkUploadResult:
+        """Upload a lot of files by multipart batches sent concurrently
 
-        query_params = QueryParams()
-        query_params.add_param('ret-json', 1)
+        Files are grouped into batches by parent directory, total size and number of files.
+        Batches are sent while files are still being read from the input: a batch is sent when it is full
+        or when too many directories or bytes are pending (the oldest batch is sent first).
+        Local files are opened only when their batch is sent.
 
-        data = aiohttp.FormData()
-        data.add_field('parent_dir', dir_path)
-        data.add_field('replace', str(int(replace)))
-        for file in files:
-            data.add_field('file', file['payload'], filename=file['filename'])
+        :param repo_id: id of repository where files will be uploaded
+        :param files: iterable or async iterable of pairs of destination path and file source
+        (path to local file, bytes or file object)
+        :param max_batch_size: maximum total size of files in one batch in bytes (larger files are sent alone)
+        :param max_batch_files: maximum number of files in one batch
+        :param concurrency: maximum number of batches sent at the same time
+        :param max_open_files: maximum number of local files opened at the same time
+        :param max_pending_dirs: maximum number of directories with not sent batches
+        :param max_pending_size: maximum total size of files in not sent batches in bytes
+        :param replace: indicates whether files should be overwritten if they already exist
+        :param token: access token
+        :returns: BulkUploadResult object with result of each file upload
+        """
+        if max_batch_size <= 0 or max_batch_files <= 0 or concurrency <= 0:
+            raise ValueError('Batch size, number of files in batch and concurrency should be positive')
+
+        if max_pending_dirs <= 0 or max_pending_size <= 0:
+            raise ValueError('Maximum number of pending directories and their size should be positive')
+
+        if max_batch_files > max_open_files:
+            raise ValueError('Maximum number of files in batch should not exceed maximum number of open files')
+
+        started_at = time.monotonic()
+        results: List[BulkUploadItemResult] = list()
+        batches: asyncio.Queue[Tuple[str, List[Tuple[str, UploadSource, int]]] | None] = asyncio.Queue(concurrency)
+        open_files = asyncio.Semaphore(max_open_files)
+        open_files_lock = asyncio.Lock()
+        sent_batches = 0
+
+        async def send_batches():
+            nonlocal sent_batches
+            while (batch := await batches.get()) is not None:
+                dir_path, batch_files = batch
+
+                try:
+                    results.extend(await self._upload_batch(
+                        repo_id, dir_path, batch_files, open_files, open_files_lock, replace, token))
+                except Exception as error:
+                    errors = [Error(title=type(error).__name__, message=str(error))]
+                    results.extend(
+                        self._create_bulk_upload_error(posixpath.join(dir_path, filename), None, errors)
+                        for filename, _, _ in batch_files)
+
+                sent_batches += 1
+
+        workers = [asyncio.create_task(send_batches()) for _ in range(concurrency)]
+        pending: Dict[str, Tuple[List[Tuple[str, UploadSource, int]], int]] = dict()
+        pending_size = 0
+
+        try:
+            async for path, source in self._iterate(files):
+                dir_path, filename = posixpath.split('/' + path.lstrip('/'))
+                size = self._get_source_size(source, max_batch_size)
+                batch_files, batch_size = pending.get(dir_path, ([], 0))
+
+                if batch_files and (len(batch_files) >= max_batch_files or batch_size + size > max_batch_size):
+                    # the next batch of the directory is pending since now, so it goes to the end of the order
+                    del pending[dir_path]
+                    await batches.put((dir_path, batch_files))
+                    pending_size -= batch_size
+                    batch_files, batch_size = [], 0
+
+                batch_files.append((filename, source, size))
+                pending[dir_path] = (batch_files, batch_size + size)
+                pending_size += size
+
+                # batches of many small directories are not held until the end of input
+                while len(pending) > max_pending_dirs or pending_size > max_pending_size:
+                    oldest_dir_path = next(iter(pending))
+                    oldest_files, oldest_size = pending.pop(oldest_dir_path)
+                    pending_size -= oldest_size
+                    await batches.put((oldest_dir_path, oldest_files))
+
+            for dir_path, (batch_files, _) in pending.items():
+                await batches.put((dir_path, batch_files))
+
+            for _ in workers:
+                await batches.put(None)
+
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+        return BulkUploadResult(
+            items=results,
+            batches=sent_batches,
+            uploaded_bytes=sum(item.content.size for item in results if item.success and item.content is not None),
+            elapsed=time.monotonic() - started_at
+        )
 
-        if relative_path is not None:
-            data.add_field('relative_path', relative_path)
+    async def get_uploaded_bytes(self, repo_id: str, dir_path: str, filename: str, token: str | None = None):
+        """Get the number of bytes of file that were already uploaded by chunks
 
-        handler = HttpRequestHandler(
-            method=HttpMethod.POST,
-            url=upload_ilnk_response.content,
+        :param repo_id: id of repository where file is being uploaded
+        :param dir_path: path to directory where file is being uploaded
+        :param filename: name of uploaded file
+        :param token: access token
+        :returns: SeaResult object with number of uploaded bytes
+        """
+        method_url = urljoin(self.base_url, self._route_storage.file_uploaded_bytes(repo_id))
+
+        query_params = QueryParams()
+        query_params.add_param('parent_dir', dir_path)
+        query_params.add_param('file_name', filename)
+
+        handler = self._create_handler(
+            HttpRequestHandler,
+            method=HttpMethod.GET,
+            url=method_url,
             token=token or self.token,
-            query_params=query_params.get_result(),
-            data=data
+            query_params=query_params.get_result()
         )
 
-        return await handler.execute(content_type=List[UploadedFileItem])
+        response = await handler.execute(content_type=Dict[str, Any])
+        result = SeaResult[int].from_result(response)
+
+        if result.success and response.content is not None:
+            result.content = response.content['uploadedBytes']
+
+        return result
+
+    async def upload_chunked(
+            self,
+            repo_id: str,
+            dir_path: str,
+            filename: str,
+            source: str | os.PathLike | BinaryIO,
+            chunk_size: int = 8 * 1024 * 1024,
+            resume: bool = True,
+            retries: int = 3,
+            replace: bool = False,
+            relative_path: str | None = None,
+            token: str | None = None):
+        """Upload file by chunks using resumable upload
+
+        Each chunk is read from the source only when it is sent.
+
+        :param repo_id: id of repository where file will be uploaded
+        :param dir_path: path to directory where file will be uploaded
+        :param filename: name of uploaded file
+        :param source: path to local file or seekable binary file object
+        :param chunk_size: size of one chunk in bytes
+        :param resume: continue uploading from the last byte acknowledged by seafile
+        :param retries: number of retries of failed chunk
+        :param replace: indicates whether file should be overwritten if it already exists
+        :param relative_path: sub-folder of "parent_dir", if this sub-folder does not exist, Seafile will create it recursively
+        :param token: access token
+        :returns: SeaResult object with UploadedFileItem
+        """
+        if chunk_size <= 0:
+            raise ValueError('Chunk size should be positive')
+
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'rb') as file:
+                return await self.upload_chunked(
+                    repo_id, dir_path, filename, file, chunk_size, resume, retries, replace, relative_path, token)
+
+        start = source.tell()
+        total = source.seek(0, os.SEEK_END) - start
+
+        if total == 0:
+            source.seek(start)
+            return await self.upload(repo_id, dir_path, filename, source, replace, relative_path, token)
+
+        upload_link_response = await self._get_cached_upload_link(repo_id, dir_path, token)
+
+        if not upload_link_response.success:
+            return SeaResult[UploadedFileItem].from_result(upload_link_response)
+
+        target_dir = dir_path
+        if relative_path is not None:
+            target_dir = dir_path.rstrip('/') + '/' + relative_path.strip('/')
+
+        offset = 0
+        if resume:
+            offset = await self._get_uploaded_offset(repo_id, target_dir, filename, token)
+
+        attempt = 0
+
+        while True:
+            end = min(offset + chunk_size, total)
+            source.seek(start + offset)
+            chunk = source.read(end - offset)
+
+            error = None
+            try:
+                response = await self._upload_chunk(
+                    upload_link_response.content, dir_path, filename, chunk, offset, total, replace, relative_path, token)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exception:
+                response, error = None, exception
+
+            if response is not None and response.success:
+                attempt = 0
+                offset = end
+                if offset >= total:
+                    break
+                continue
+
+            if attempt >= retries:
+                if error is not None:
+                    raise error
+                return SeaResult[UploadedFileItem].from_result(response)
+
+            attempt += 1
+            offset = await self._get_uploaded_offset(repo_id, target_dir, filename, token, default=offset)
+
+            if response is not None and response.status in self.EXPIRED_UPLOAD_LINK_STATUSES:
+                self._invalidate_upload_link(repo_id, dir_path, token)
+                upload_link_response = await self._get_cached_upload_link(repo_id, dir_path, token)
+
+                if not upload_link_response.success:
+                    return SeaResult[UploadedFileItem].from_result(upload_link_response)
+
+        await self._invalidate_cache(repo_id, target_dir)
+
+        result = SeaResult[UploadedFileItem].from_result(response)
+
+        if response.content:
+            result.content = response.content.pop()
+
+        return result
 
     async def get_download_link(self, repo_id: str, filepath: str, reuse: bool = False, token: str | None = None):
         """Get a link to download file
@@ -386,7 +909,8 @@ class SeafileHttpClient:
         query_params.add_param('p', filepath)
         query_params.add_param('reuse', int(reuse))
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.GET,
             url=method_url,
             token=token or self.token,
@@ -395,30 +919,258 @@ class SeafileHttpClient:
 
         return await handler.execute(content_type=str)
 
-    async def download(self, repo_id, filepath: str, token: str | None = None):
+    async def download(
+            self,
+            repo_id,
+            filepath: str,
+            token: str | None = None,
+            offset: int = 0,
+            length: int | None = None):
         """Download file
 
         :param repo_id: id of repository to download file from
         :param filepath: path to file to download
         :param token: access token
+        :param offset: position of the first byte to download
+        :param length: number of bytes to download (by default up to the end of file)
         """
-        response = await self.get_download_link(repo_id, filepath, token=token)
+        if self._single_flight is None:
+            return await self._download(repo_id, filepath, token, offset, length)
 
-        if not response.success:
-            return SeaResult[bytes](
-                success=response.success,
-                status=response.status,
-                errors=response.errors,
+        return await self._single_flight.do(
+            ('download', repo_id, filepath, offset, length, token or self.token),
+            lambda: self._download(repo_id, filepath, token, offset, length),
+            scope=repo_id
+        )
+
+    async def iter_download(
+            self,
+            repo_id: str,
+            filepath: str,
+            chunk_size: int = HttpDownloadHandler.DEFAULT_CHUNK_SIZE,
+            token: str | None = None,
+            offset: int = 0,
+            length: int | None = None) -> AsyncIterator[bytes]:
+        """Download file by chunks
+
+        :param repo_id: id of repository to download file from
+        :param filepath: path to file to download
+        :param chunk_size: maximum size of yielded chunk in bytes
+        :param token: access token
+        :param offset: position of the first byte to download
+        :param length: number of bytes to download (by default up to the end of file)
+        :returns: async iterator over file contents
+        :raises DownloadError: if the file could not be downloaded
+        """
+        is_cached_link = self._is_download_link_cached(repo_id, filepath, token)
+        handler = await self._create_download_handler(repo_id, filepath, token, offset, length)
+
+        try:
+            async for chunk in handler.iter_chunks(chunk_size):
+                yield chunk
+        except DownloadError as error:
+            # the error is raised before the first chunk, so the download can be restarted by a fresh link
+            if not is_cached_link or error.status not in self.EXPIRED_DOWNLOAD_LINK_STATUSES:
+                raise
+
+            self._invalidate_download_link(repo_id, filepath, token)
+
+            async for chunk in self.iter_download(repo_id, filepath, chunk_size, token, offset, length):
+                yield chunk
+
+    async def download_to_file(
+            self,
+            repo_id: str,
+            filepath: str,
+            destination: str | os.PathLike | BinaryIO,
+            chunk_size: int = HttpDownloadHandler.DEFAULT_CHUNK_SIZE,
+            resume: bool = False,
+            token: str | None = None):
+        """Download file and write its contents directly to the destination
+
+        :param repo_id: id of repository to download file from
+        :param filepath: path to file to download
+        :param destination: path to local file or writable object (sync or async)
+        :param chunk_size: size of chunks in bytes that are written to the destination
+        :param resume: continue downloading of partially downloaded local file
+        and check the size of result against the size of file in seafile (destination should be a path)
+        :param token: access token
+        :returns: SeaResult object with number of written bytes
+        """
+        is_path = isinstance(destination, (str, os.PathLike))
+
+        if resume and not is_path:
+            raise ValueError('Resuming is supported only if destination is a path to local file')
+
+        offset = 0
+        expected_size = None
+
+        if resume:
+            detail_response = await self.get_file_detail(repo_id, filepath, token)
+
+            if not detail_response.success:
+                return SeaResult[int].from_result(detail_response)
+
+            expected_size = detail_response.content.size
+            if os.path.exists(destination):
+                offset = os.path.getsize(destination)
+
+            # local file that is larger than remote one can not be a part of it
+            if offset > expected_size:
+                offset = 0
+
+        written = 0
+
+        try:
+            if offset == 0 or offset < expected_size:
+                chunks = self.iter_download(repo_id, filepath, chunk_size, token, offset)
+
+                # the first chunk is received before opening the destination so that it is not touched on error
+                first_chunk = await anext(chunks, b'')
+                chunks = self._prepend_chunk(first_chunk, chunks)
+
+                if is_path:
+                    with open(destination, 'ab' if offset > 0 else 'wb') as file:
+                        written = await self._write_chunks(chunks, file)
+                else:
+                    written = await self._write_chunks(chunks, destination)
+        except DownloadError as error:
+            return SeaResult[int](
+                success=False,
+                status=error.status,
+                errors=error.errors,
                 content=None
             )
 
-        handler = HttpDownloadHandler(
-            method=HttpMethod.GET,
-            url=response.content,
-            token=token or self.token
+        result = SeaResult[int](
+            success=True,
+            status=HTTPStatus.OK,
+            errors=None,
+            content=written
         )
 
-        return await handler.execute()
+        if expected_size is not None:
+            actual_size = os.path.getsize(destination)
+
+            if actual_size != expected_size:
+                result.success = False
+                result.errors = [Error(
+                    title='size',
+                    message=f'Size of downloaded file ({actual_size}) does not match the expected size ({expected_size})')]
+
+        return result
+
+    async def download_segmented(
+            self,
+            repo_id: str,
+            filepath: str,
+            destination: str | os.PathLike,
+            segment_size: int = 8 * 1024 * 1024,
+            concurrency: int = 4,
+            retries: int = 3,
+            chunk_size: int = HttpDownloadHandler.DEFAULT_CHUNK_SIZE,
+            token: str | None = None):
+        """Download file by several byte ranges concurrently
+
+        The reusable download link is obtained once and the ranges are written into their places
+        of a preallocated temporary file, which replaces the destination when all ranges are downloaded.
+        If the cached link has expired, one fresh link is obtained and the failed ranges are repeated by it.
+
+        :param repo_id: id of repository to download file from
+        :param filepath: path to file to download
+        :param destination: path to local file
+        :param segment_size: size of one byte range in bytes
+        :param concurrency: maximum number of ranges downloaded at the same time
+        :param retries: number of retries of failed range
+        :param chunk_size: size of chunks in bytes that are written to the destination
+        :param token: access token
+        :returns: SeaResult object with number of written bytes
+        """
+        if segment_size <= 0 or concurrency <= 0:
+            raise ValueError('Segment size and concurrency should be positive')
+
+        detail_response = await self.get_file_detail(repo_id, filepath, token)
+
+        if not detail_response.success:
+            return SeaResult[int].from_result(detail_response)
+
+        is_cached_link = self._is_download_link_cached(repo_id, filepath, token)
+        link_response = await self._get_cached_download_link(repo_id, filepath, reuse=True, token=token)
+
+        if not link_response.success:
+            return SeaResult[int].from_result(link_response)
+
+        size = detail_response.content.size
+        semaphore = asyncio.Semaphore(concurrency)
+        link = link_response.content
+        cached_link = link if is_cached_link else None
+        link_lock = asyncio.Lock()
+
+        async def refresh_link() -> str:
+            """Replace expired cached link by a fresh one, it is requested once and shared by all segments"""
+            nonlocal link
+            async with link_lock:
+                if link == cached_link:
+                    self._invalidate_download_link(repo_id, filepath, token)
+                    response = await self._get_cached_download_link(repo_id, filepath, reuse=True, token=token)
+
+                    if not response.success:
+                        raise DownloadError(response.status, response.errors)
+
+                    link = response.content
+
+            return link
+
+        async def download_segment(file: BinaryIO, offset: int, length: int):
+            async with semaphore:
+                url = link
+
+                try:
+                    return await self._download_segment(url, file, offset, length, retries, chunk_size, token)
+                except DownloadError as error:
+                    if url != cached_link or error.status not in self.EXPIRED_DOWNLOAD_LINK_STATUSES:
+                        raise
+
+                # cached link has expired, so the segment is downloaded again by a fresh link
+                return await self._download_segment(await refresh_link(), file, offset, length, retries, chunk_size, token)
+
+        # ranges are written into a temporary file next to the destination,
+        # so a failed download neither leaves a partial file nor overwrites an existing one
+        temporary_path = os.fspath(destination) + '.part'
+
+        try:
+            with open(temporary_path, 'wb') as file:
+                file.truncate(size)
+
+                tasks = [
+                    asyncio.create_task(download_segment(file, offset, min(segment_size, size - offset)))
+                    for offset in range(0, size, segment_size)
+                ]
+
+                try:
+                    written = sum(await asyncio.gather(*tasks))
+                finally:
+                    for task in tasks:
+                        task.cancel()
+
+            os.replace(temporary_path, destination)
+        except DownloadError as error:
+            return SeaResult[int](
+                success=False,
+                status=error.status,
+                errors=error.errors,
+                content=None
+            )
+        finally:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+        return SeaResult[int](
+            success=True,
+            status=HTTPStatus.OK,
+            errors=None,
+            content=written
+        )
 
     async def get_file_detail(self, repo_id: str, filepath: str, token: str | None = None):
         """Get detail information about the file
@@ -433,14 +1185,15 @@ class SeafileHttpClient:
         query_params = QueryParams()
         query_params.add_param('p', filepath)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.GET,
             url=method_url,
             token=token or self.token,
             query_params=query_params.get_result()
         )
 
-        return await handler.execute(content_type=FileItemDetail)
+        return await self._execute_cached(handler, FileItemDetail, repo_id, filepath)
 
     async def create_file(self, repo_id: str, filepath: str, token: str | None = None):
         """Create new file
@@ -457,7 +1210,8 @@ class SeafileHttpClient:
         data = aiohttp.FormData()
         data.add_field('operation', FileOperation.CREATE)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.POST,
             url=method_url,
             token=token or self.token,
@@ -465,7 +1219,7 @@ class SeafileHttpClient:
             data=data
         )
 
-        return await handler.execute()
+        return await self._execute_and_invalidate(handler, repo_id, [filepath])
 
     async def rename_file(self, repo_id: str, filepath: str, new_filename: str, token: str | None = None):
         """Rename file
@@ -484,7 +1238,8 @@ class SeafileHttpClient:
         data.add_field('operation', FileOperation.RENAME)
         data.add_field('newname', new_filename)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.POST,
             url=method_url,
             token=token or self.token,
@@ -492,7 +1247,7 @@ class SeafileHttpClient:
             data=data
         )
 
-        return await handler.execute()
+        return await self._execute_and_invalidate(handler, repo_id, [filepath])
 
     async def move_file(
             self,
@@ -520,7 +1275,8 @@ class SeafileHttpClient:
         data.add_field('dst_dir', dst_dir)
         data.add_field('dst_repo', dst_repo_id or repo_id)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.POST,
             url=method_url,
             token=token or self.token,
@@ -528,7 +1284,9 @@ class SeafileHttpClient:
             data=data
         )
 
-        return await handler.execute(content_type=str)
+        response = await self._execute_and_invalidate(handler, repo_id, [filepath], content_type=str)
+        await self._invalidate_cache(dst_repo_id or repo_id, dst_dir)
+        return response
 
     async def copy_file(
             self,
@@ -555,7 +1313,8 @@ class SeafileHttpClient:
         data.add_field('dst_dir', dst_dir)
         data.add_field('dst_repo', dst_repo_id or repo_id)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.POST,
             url=method_url,
             token=token or self.token,
@@ -563,7 +1322,7 @@ class SeafileHttpClient:
             data=data
         )
 
-        return await handler.execute()
+        return await self._execute_and_invalidate(handler, dst_repo_id or repo_id, [dst_dir])
 
     async def delete_file(self, repo_id: str, filepath: str, token: str | None = None):
         """Delete file
@@ -580,7 +1339,8 @@ class SeafileHttpClient:
         data = aiohttp.FormData()
         data.add_field('operation', FileOperation.DELETE)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.DELETE,
             url=method_url,
             token=token or self.token,
@@ -588,6 +1348,168 @@ class SeafileHttpClient:
             data=data
         )
 
+        return await self._execute_and_invalidate(handler, repo_id, [filepath])
+
+    async def copy_items(
+            self,
+            repo_id: str,
+            paths: Iterable[str],
+            dst_dir: str,
+            dst_repo_id: str | None = None,
+            batch_size: int = 100,
+            concurrency: int = 1,
+            token: str | None = None) -> BatchOperationResult:
+        """Copy many files and directories by batch requests
+
+        Items are grouped by parent directory, every group is split into batches of batch_size items.
+
+        :param repo_id: id of repository where items are located
+        :param paths: paths to files and directories
+        :param dst_dir: directory where copies of items will be created
+        :param dst_repo_id: id of repository where copies of items will be created
+        :param batch_size: maximum number of items in one request
+        :param concurrency: maximum number of requests sent at the same time
+        :param token: access token
+        :returns: BatchOperationResult object with result of each item copying
+        """
+        return await self._execute_batch_operation(
+            BatchOperation.COPY, repo_id, paths, dst_dir, dst_repo_id, batch_size, concurrency, token)
+
+    async def move_items(
+            self,
+            repo_id: str,
+            paths: Iterable[str],
+            dst_dir: str,
+            dst_repo_id: str | None = None,
+            batch_size: int = 100,
+            concurrency: int = 1,
+            token: str | None = None) -> BatchOperationResult:
+        """Move many files and directories by batch requests
+
+        Items are grouped by parent directory, every group is split into batches of batch_size items.
+
+        :param repo_id: id of repository where items are located
+        :param paths: paths to files and directories
+        :param dst_dir: directory where items will be moved
+        :param dst_repo_id: id of repository where items will be moved
+        :param batch_size: maximum number of items in one request
+        :param concurrency: maximum number of requests sent at the same time
+        :param token: access token
+        :returns: BatchOperationResult object with result of each item moving
+        """
+        return await self._execute_batch_operation(
+            BatchOperation.MOVE, repo_id, paths, dst_dir, dst_repo_id, batch_size, concurrency, token)
+
+    async def delete_items(
+            self,
+            repo_id: str,
+            paths: Iterable[str],
+            batch_size: int = 100,
+            concurrency: int = 1,
+            token: str | None = None) -> BatchOperationResult:
+        """Delete many files and directories by batch requests
+
+        Items are grouped by parent directory, every group is split into batches of batch_size items.
+
+        :param repo_id: id of repository where items are located
+        :param paths: paths to files and directories to be deleted
+        :param batch_size: maximum number of items in one request
+        :param concurrency: maximum number of requests sent at the same time
+        :param token: access token
+        :returns: BatchOperationResult object with result of each item deletion
+        """
+        return await self._execute_batch_operation(
+            BatchOperation.DELETE, repo_id, paths, None, None, batch_size, concurrency, token)
+
+    async def start_copy_task(
+            self,
+            repo_id: str,
+            paths: Iterable[str],
+            dst_dir: str,
+            dst_repo_id: str | None = None,
+            poll_interval: float = 1.0,
+            token: str | None = None) -> SeaResult[CopyMoveTask]:
+        """Start copying of files and directories in background on seafile server
+
+        Unlike copy_items, the request does not wait until items are copied,
+        so whole directory trees can be copied between repositories.
+
+        :param repo_id: id of repository where items are located
+        :param paths: paths to files and directories located in the same directory
+        :param dst_dir: directory where copies of items will be created
+        :param dst_repo_id: id of repository where copies of items will be created
+        :param poll_interval: default delay between requests of task progress in seconds
+        :param token: access token
+        :returns: SeaResult object with CopyMoveTask that can be polled, awaited or cancelled
+        """
+        return await self._start_copy_move_task(
+            BatchOperation.COPY, repo_id, paths, dst_dir, dst_repo_id, poll_interval, token)
+
+    async def start_move_task(
+            self,
+            repo_id: str,
+            paths: Iterable[str],
+            dst_dir: str,
+            dst_repo_id: str | None = None,
+            poll_interval: float = 1.0,
+            token: str | None = None) -> SeaResult[CopyMoveTask]:
+        """Start moving of files and directories in background on seafile server
+
+        Unlike move_items, the request does not wait until items are moved,
+        so whole directory trees can be moved between repositories.
+
+        :param repo_id: id of repository where items are located
+        :param paths: paths to files and directories located in the same directory
+        :param dst_dir: directory where items will be moved
+        :param dst_repo_id: id of repository where items will be moved
+        :param poll_interval: default delay between requests of task progress in seconds
+        :param token: access token
+        :returns: SeaResult object with CopyMoveTask that can be polled, awaited or cancelled
+        """
+        return await self._start_copy_move_task(
+            BatchOperation.MOVE, repo_id, paths, dst_dir, dst_repo_id, poll_interval, token)
+
+    async def get_copy_move_progress(self, task_id: str, token: str | None = None):
+        """Get progress of the background copy or move task
+
+        :param task_id: id of the task
+        :param token: access token
+        :returns: SeaResult object with CopyMoveProgress
+        """
+        method_url = urljoin(self.base_url, self._route_storage.query_copy_move_progress)
+
+        query_params = QueryParams()
+        query_params.add_param('task_id', task_id)
+
+        handler = self._create_handler(
+            HttpRequestHandler,
+            method=HttpMethod.GET,
+            url=method_url,
+            token=token or self.token,
+            query_params=query_params.get_result()
+        )
+
+        return await handler.execute(content_type=CopyMoveProgress)
+
+    async def cancel_copy_move_task(self, task_id: str, token: str | None = None):
+        """Cancel the background copy or move task
+
+        :param task_id: id of the task
+        :param token: access token
+        """
+        method_url = urljoin(self.base_url, self._route_storage.copy_move_task)
+
+        data = aiohttp.FormData()
+        data.add_field('task_id', task_id)
+
+        handler = self._create_handler(
+            HttpRequestHandler,
+            method=HttpMethod.DELETE,
+            url=method_url,
+            token=token or self.token,
+            data=data
+        )
+
         return await handler.execute()
 
     async def lock_file(self, repo_id: str, filepath: str, token: str | None = None):
@@ -603,14 +1525,15 @@ class SeafileHttpClient:
         data.add_field('p', filepath)
         data.add_field('operation', FileOperation.LOCK)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.PUT,
             url=method_url,
             token=token or self.token,
             data=data
         )
 
-        return await handler.execute()
+        return await self._execute_and_invalidate(handler, repo_id, [filepath])
 
     async def unlock_file(self, repo_id: str, filepath: str, token: str | None = None):
         """Unlock file
@@ -625,36 +1548,46 @@ class SeafileHttpClient:
         data.add_field('p', filepath)
         data.add_field('operation', FileOperation.UNLOCK)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.PUT,
             url=method_url,
             token=token or self.token,
             data=data
         )
 
-        return await handler.execute()
+        return await self._execute_and_invalidate(handler, repo_id, [filepath])
 
-    async def get_items(self, repo_id: str, path: str | None = None, token: str | None = None):
+    async def get_items(
+            self,
+            repo_id: str,
+            path: str | None = None,
+            token: str | None = None,
+            compact: bool = False):
         """Get all items in a directory
 
         :param repo_id: id of repository to get information from
         :param path: path to directory where you need to find out what is located
         :param token: access token
-        :returns: SeaResult object with list of BaseItem
+        :param compact: return entries as CompactListing instead of list of models
+        :returns: SeaResult object with list of BaseItem (CompactListing if compact is set)
         """
         method_url = urljoin(self.base_url, self._route_storage.dir(repo_id))
 
         query_params = QueryParams()
         query_params.add_param('p', path or '/')
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.GET,
             url=method_url,
             token=token or self.token,
-            query_params=query_params.get_result()
+            query_params=query_params.get_result(),
+            parser=self._parser if compact else self._listing_parser
         )
 
-        return await handler.execute(content_type=List[BaseItem])
+        content_type = CompactListing if compact else List[BaseItem]
+        return await self._execute_cached(handler, content_type, repo_id, path or '/')
 
     async def get_items_by_id(self, repo_id: str, dir_id: str, token: str | None = None):
         """Get all items in a directory by directory id
@@ -669,22 +1602,30 @@ class SeafileHttpClient:
         query_params = QueryParams()
         query_params.add_param('oid', dir_id)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.GET,
             url=method_url,
             token=token or self.token,
-            query_params=query_params.get_result()
+            query_params=query_params.get_result(),
+            parser=self._listing_parser
         )
 
-        return await handler.execute(content_type=List[BaseItem])
+        return await self._execute_cached(handler, List[BaseItem], repo_id)
 
-    async def get_files(self, repo_id: str, path: str | None = None, token: str | None = None):
+    async def get_files(
+            self,
+            repo_id: str,
+            path: str | None = None,
+            token: str | None = None,
+            compact: bool = False):
         """Get all files in a directory
 
         :param repo_id: id of repository to get information from
         :param path: path to directory where you need to find out what is located
         :param token: access token
-        :returns: SeaResult object with list of FileItem
+        :param compact: return entries as CompactListing instead of list of models
+        :returns: SeaResult object with list of FileItem (CompactListing if compact is set)
         """
         method_url = urljoin(self.base_url, self._route_storage.dir(repo_id))
 
@@ -692,14 +1633,17 @@ class SeafileHttpClient:
         query_params.add_param('p', path or '/')
         query_params.add_param('t', 'f')
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.GET,
             url=method_url,
             token=token or self.token,
-            query_params=query_params.get_result()
+            query_params=query_params.get_result(),
+            parser=self._parser if compact else self._listing_parser
         )
 
-        return await handler.execute(content_type=List[FileItem])
+        content_type = CompactListing if compact else List[FileItem]
+        return await self._execute_cached(handler, content_type, repo_id, path or '/')
 
     async def get_files_by_id(self, repo_id: str, dir_id: str, token: str | None = None):
         """Get all files in a directory by directory id
@@ -715,28 +1659,32 @@ class SeafileHttpClient:
         query_params.add_param('oid', dir_id)
         query_params.add_param('t', 'f')
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.GET,
             url=method_url,
             token=token or self.token,
-            query_params=query_params.get_result()
+            query_params=query_params.get_result(),
+            parser=self._listing_parser
         )
 
-        return await handler.execute(content_type=List[FileItem])
+        return await self._execute_cached(handler, List[FileItem], repo_id)
 
     async def get_directories(
             self,
             repo_id: str,
             path: str | None = None,
             recursive: bool = False,
-            token: str | None = None):
+            token: str | None = None,
+            compact: bool = False):
         """Get all directories in a directory
 
         :param repo_id: id of repository to get information from
         :param path: path to directory where you need to find out what is located
         :param recursive: indicates a recursive search method
         :param token: access token
-        :returns: SeaResult object with list of DirectoryItem
+        :param compact: return entries as CompactListing instead of list of models
+        :returns: SeaResult object with list of DirectoryItem (CompactListing if compact is set)
         """
         method_url = urljoin(self.base_url, self._route_storage.dir(repo_id))
 
@@ -745,14 +1693,17 @@ class SeafileHttpClient:
         query_params.add_param('t', 'd')
         query_params.add_param('recursive', int(recursive))
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.GET,
             url=method_url,
             token=token or self.token,
-            query_params=query_params.get_result()
+            query_params=query_params.get_result(),
+            parser=self._parser if compact else self._listing_parser
         )
 
-        return await handler.execute(content_type=List[DirectoryItem])
+        content_type = CompactListing if compact else List[DirectoryItem]
+        return await self._execute_cached(handler, content_type, repo_id, path or '/')
 
     async def get_directories_by_id(
             self,
@@ -775,14 +1726,186 @@ class SeafileHttpClient:
         query_params.add_param('t', 'd')
         query_params.add_param('recursive', int(recursive))
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.GET,
             url=method_url,
             token=token or self.token,
-            query_params=query_params.get_result()
+            query_params=query_params.get_result(),
+            parser=self._listing_parser
         )
 
-        return await handler.execute(content_type=List[DirectoryItem])
+        return await self._execute_cached(handler, List[DirectoryItem], repo_id)
+
+    async def walk(
+            self,
+            repo_id: str,
+            path: str = '/',
+            concurrency: int = 8,
+            max_depth: int | None = None,
+            include: Iterable[str] | None = None,
+            exclude: Iterable[str] | None = None,
+            on_error: Callable[[str, SeaResult], None] | None = None,
+            token: str | None = None) -> AsyncIterator[Tuple[str, List[DirectoryItem], List[FileItem]]]:
+        """Walk the directory tree like os.walk, sibling directories are listed concurrently
+
+        Directories are yielded as soon as they are listed, a parent is always yielded before its children.
+        As in os.walk, removing items from the yielded list of directories prevents walking into them.
+
+        :param repo_id: id of repository to walk
+        :param path: path to the top directory
+        :param concurrency: maximum number of directories listed at the same time
+        :param max_depth: maximum depth of walking (0 - only the top directory, None - unlimited)
+        :param include: glob patterns of file names or paths, files not matching any of them are skipped
+        :param exclude: glob patterns of names or paths of files and directories that are skipped
+        :param on_error: function called with path and result of failed directory listing
+        :param token: access token
+        :returns: async iterator over tuples of directory path, list of DirectoryItem and list of FileItem
+        """
+        if concurrency <= 0:
+            raise ValueError('Concurrency should be positive')
+
+        include = list(include) if include is not None else None
+        exclude = list(exclude or [])
+        queue = deque([(path, 0)])
+        listings: Dict[asyncio.Task, Tuple[str, int]] = dict()
+
+        try:
+            while queue or listings:
+                while queue and len(listings) < concurrency:
+                    dir_path, depth = queue.popleft()
+                    listings[asyncio.create_task(self._list_directory(repo_id, dir_path, token))] = (dir_path, depth)
+
+                done, _ = await asyncio.wait(listings, return_when=asyncio.FIRST_COMPLETED)
+
+                for listing in done:
+                    dir_path, depth = listings.pop(listing)
+                    result = listing.result()
+
+                    if not result.success:
+                        if on_error is not None:
+                            on_error(dir_path, result)
+                        continue
+
+                    dirs, files = list(), list()
+                    for item in result.content:
+                        item_path = posixpath.join(dir_path, item.name)
+
+                        if self._match_any(item.name, item_path, exclude):
+                            continue
+                        if isinstance(item, DirectoryItem):
+                            dirs.append(item)
+                        elif include is None or self._match_any(item.name, item_path, include):
+                            files.append(item)
+
+                    yield dir_path, dirs, files
+
+                    if max_depth is None or depth < max_depth:
+                        queue.extend((posixpath.join(dir_path, item.name), depth + 1) for item in dirs)
+        finally:
+            for listing in listings:
+                listing.cancel()
+
+    async def diff_tree(
+            self,
+            repo_id: str,
+            path: str = '/',
+            previous_snapshot: TreeSnapshot | None = None,
+            concurrency: int = 8,
+            token: str | None = None) -> SeaResult[TreeDiff]:
+        """Find changes of the directory tree since the previous snapshot
+
+        Id of the directory changes only when something beneath it changes, so subtrees whose
+        directory ids are equal to the ids from the previous snapshot are not listed again.
+        Without the previous snapshot the whole tree is listed and all its items are considered as added.
+
+        :param repo_id: id of repository where the tree is located
+        :param path: path to the top directory of the tree
+        :param previous_snapshot: snapshot of the tree from the previous call (TreeDiff.snapshot)
+        :param concurrency: maximum number of directories listed at the same time
+        :param token: access token
+        :returns: SeaResult object with TreeDiff
+        """
+        path = posixpath.normpath(path)
+
+        if previous_snapshot is None:
+            previous_snapshot = TreeSnapshot(repo_id=repo_id, path=path)
+        elif previous_snapshot.repo_id != repo_id or posixpath.normpath(previous_snapshot.path) != path:
+            raise ValueError('Previous snapshot was taken from another tree')
+
+        snapshot = TreeSnapshot(repo_id=repo_id, path=path)
+        unchanged_dirs = set()
+        failed_results = list()
+        listed_directories = 0
+
+        walker = self.walk(
+            repo_id,
+            path,
+            concurrency=concurrency,
+            on_error=lambda _, result: failed_results.append(result),
+            token=token)
+
+        # the walk is closed right after break, so listings in progress are cancelled immediately
+        async with aclosing(walker):
+            async for dir_path, dirs, files in walker:
+                if failed_results:
+                    break
+
+                listed_directories += 1
+
+                for item in files:
+                    snapshot.files[posixpath.join(dir_path, item.name)] = item.id
+
+                for item in list(dirs):
+                    item_path = posixpath.join(dir_path, item.name)
+                    snapshot.directories[item_path] = item.id
+
+                    if previous_snapshot.directories.get(item_path) == item.id:
+                        unchanged_dirs.add(item_path)
+                        dirs.remove(item)
+
+        if failed_results:
+            failed_result = failed_results[0]
+            return SeaResult[TreeDiff](
+                success=False,
+                status=failed_result.status,
+                errors=failed_result.errors,
+                content=None
+            )
+
+        # items of unchanged subtrees are taken from the previous snapshot without listing
+        if unchanged_dirs:
+            for item_path, item_id in previous_snapshot.directories.items():
+                if self._is_beneath_any(item_path, unchanged_dirs):
+                    snapshot.directories[item_path] = item_id
+
+            for item_path, item_id in previous_snapshot.files.items():
+                if self._is_beneath_any(item_path, unchanged_dirs):
+                    snapshot.files[item_path] = item_id
+
+        added = [item_path for item_path in snapshot.directories if item_path not in previous_snapshot.directories]
+        added.extend(item_path for item_path in snapshot.files if item_path not in previous_snapshot.files)
+
+        removed = [item_path for item_path in previous_snapshot.directories if item_path not in snapshot.directories]
+        removed.extend(item_path for item_path in previous_snapshot.files if item_path not in snapshot.files)
+
+        modified = [
+            item_path for item_path, item_id in snapshot.files.items()
+            if item_path in previous_snapshot.files and previous_snapshot.files[item_path] != item_id
+        ]
+
+        return SeaResult[TreeDiff](
+            success=True,
+            status=HTTPStatus.OK,
+            errors=None,
+            content=TreeDiff(
+                added=sorted(added),
+                removed=sorted(removed),
+                modified=sorted(modified),
+                listed_directories=listed_directories,
+                snapshot=snapshot
+            )
+        )
 
     async def get_directory_detail(self, repo_id: str, path: str, token: str | None = None):
         """Get detailed information about the directory
@@ -800,14 +1923,15 @@ class SeafileHttpClient:
         query_params = QueryParams()
         query_params.add_param('path', path)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.GET,
             url=method_url,
             token=token or self.token,
             query_params=query_params.get_result()
         )
 
-        return await handler.execute(content_type=DirectoryItemDetail)
+        return await self._execute_cached(handler, DirectoryItemDetail, repo_id, path)
 
     async def create_directory(self, repo_id: str, path: str, token: str | None = None):
         """Create new directory
@@ -824,7 +1948,8 @@ class SeafileHttpClient:
         data = aiohttp.FormData()
         data.add_field('operation', DirectoryOperation.CREATE)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.POST,
             url=method_url,
             token=token or self.token,
@@ -832,7 +1957,7 @@ class SeafileHttpClient:
             query_params=query_params.get_result()
         )
 
-        return await handler.execute()
+        return await self._execute_and_invalidate(handler, repo_id, [path])
 
     async def rename_directory(self, repo_id: str, path: str, new_name: str, token: str | None = None):
         """Rename directory
@@ -851,7 +1976,8 @@ class SeafileHttpClient:
         data.add_field('operation', DirectoryOperation.RENAME)
         data.add_field('newname', new_name)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.POST,
             url=method_url,
             token=token or self.token,
@@ -859,7 +1985,7 @@ class SeafileHttpClient:
             query_params=query_params.get_result()
         )
 
-        return await handler.execute()
+        return await self._execute_and_invalidate(handler, repo_id, [path])
 
     async def delete_directory(self, repo_id: str, path: str, token: str | None = None):
         """Delete directory
@@ -873,14 +1999,15 @@ class SeafileHttpClient:
         query_params = QueryParams()
         query_params.add_param('p', path)
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.DELETE,
             url=method_url,
             token=token or self.token,
             query_params=query_params.get_result()
         )
 
-        return await handler.execute()
+        return await self._execute_and_invalidate(handler, repo_id, [path])
 
     async def get_smart_link(self, repo_id: str, path: str, is_dir: bool = False, token: str | None = None):
         """Get smart link to item
@@ -898,7 +2025,8 @@ class SeafileHttpClient:
         query_params.add_param('path', path)
         query_params.add_param('is_dir', str(is_dir).lower())
 
-        handler = HttpRequestHandler(
+        handler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.GET,
             url=method_url,
             token=token or self.token,
@@ -926,7 +2054,8 @@ class SeafileHttpClient:
         query_params.add_param('q', query)
         query_params.add_param('repo_id', repo_id)
 
-        hanndler = HttpRequestHandler(
+        hanndler = self._create_handler(
+            HttpRequestHandler,
             method=HttpMethod.GET,
             url=method_url,
             token=token or self.token,
@@ -934,14 +2063,806 @@ class SeafileHttpClient:
         )
 
         response = await hanndler.execute(content_type=SearchResult)
-        result = SeaResult[List[SearchResultItem]](
-            success=response.success,
-            status=response.status,
-            errors=response.errors,
-            content=None
-        )
+        result = SeaResult[List[SearchResultItem]].from_result(response)
 
         if result.success and response.content is not None:
             result.content = response.content.data
 
         return result
+
+    async def _get_cached_download_link(
+            self,
+            repo_id: str,
+            filepath: str,
+            reuse: bool = False,
+            token: str | None = None):
+        if self._download_link_cache is None:
+            return await self.get_download_link(repo_id, filepath, reuse=reuse, token=token)
+
+        key = self._get_download_link_key(repo_id, filepath, token)
+        download_link = self._download_link_cache.get(key)
+
+        if download_link is not None:
+            return SeaResult[str](
+                success=True,
+                status=HTTPStatus.OK,
+                errors=None,
+                content=download_link
+            )
+
+        response = await self.get_download_link(repo_id, filepath, reuse=True, token=token)
+
+        if response.success and response.content:
+            ttl = min(self._download_link_cache.ttl, self.REUSABLE_DOWNLOAD_LINK_TTL - self.DOWNLOAD_LINK_TTL_MARGIN)
+            self._download_link_cache.set(key, response.content, ttl)
+
+        return response
+
+    def _is_download_link_cached(self, repo_id: str, filepath: str, token: str | None = None) -> bool:
+        return self._download_link_cache is not None \
+            and self._get_download_link_key(repo_id, filepath, token) in self._download_link_cache
+
+    def _invalidate_download_link(self, repo_id: str, filepath: str, token: str | None = None):
+        if self._download_link_cache is not None:
+            self._download_link_cache.delete(self._get_download_link_key(repo_id, filepath, token))
+
+    def _get_download_link_key(self, repo_id: str, filepath: str, token: str | None = None):
+        return repo_id, filepath, token or self.token
+
+    async def _execute_cached(
+            self,
+            handler: HttpRequestHandler,
+            content_type: Type[T],
+            repo_id: str | None = None,
+            path: str | None = None) -> SeaResult[T]:
+        if self._single_flight is None:
+            return await self._execute_with_cache(handler, content_type, repo_id, path)
+
+        return await self._single_flight.do(
+            (handler.request_key, content_type),
+            lambda: self._execute_with_cache(handler, content_type, repo_id, path),
+            scope=repo_id
+        )
+
+    async def _execute_with_cache(
+            self,
+            handler: HttpRequestHandler,
+            content_type: Type[T],
+            repo_id: str | None = None,
+            path: str | None = None) -> SeaResult[T]:
+        if self._response_cache is None:
+            return await handler.execute(content_type=content_type)
+
+        key = self._response_cache.create_key(handler.request_key, content_type)
+        result = await self._response_cache.get(key)
+
+        if result is not None:
+            return result
+
+        # response received after invalidation of the repository may be stale and is not cached
+        generation = self._response_cache.get_generation(repo_id)
+        result = await handler.execute(content_type=content_type)
+
+        if result.success:
+            await self._response_cache.set(key, result, repo_id, path, generation)
+
+        return result
+
+    async def _execute_and_invalidate(
+            self,
+            handler: HttpRequestHandler,
+            repo_id: str | None,
+            paths: List[str] | None = None,
+            content_type: Type[T] | None = None) -> SeaResult[T]:
+        result = await handler.execute(content_type=content_type)
+
+        for path in paths or [None]:
+            await self._invalidate_cache(repo_id, path)
+
+        return result
+
+    async def _invalidate_cache(self, repo_id: str | None, path: str | None = None):
+        if self._single_flight is not None:
+            self._single_flight.forget(repo_id)
+
+        if self._response_cache is not None:
+            await self._response_cache.invalidate(repo_id, path)
+
+    async def _execute_batch_operation(
+            self,
+            operation: BatchOperation,
+            repo_id: str,
+            paths: Iterable[str],
+            dst_dir: str | None,
+            dst_repo_id: str | None,
+            batch_size: int,
+            concurrency: int,
+            token: str | None = None) -> BatchOperationResult:
+        if batch_size <= 0 or concurrency <= 0:
+            raise ValueError('Batch size and concurrency should be positive')
+
+        started_at = time.monotonic()
+        semaphore = asyncio.Semaphore(concurrency)
+        batches = self._split_into_batches(paths, batch_size)
+
+        async def execute_batch(parent_dir: str, names: List[str]) -> List[BatchItemResult]:
+            async with semaphore:
+                handler = self._create_batch_handler(
+                    operation, repo_id, parent_dir, names, dst_dir, dst_repo_id, token)
+
+                try:
+                    response = await handler.execute()
+                    success, status, errors = response.success, response.status, response.errors
+                except Exception as error:
+                    success, status, errors = False, None, [Error(title=type(error).__name__, message=str(error))]
+
+                if operation != BatchOperation.COPY:
+                    await self._invalidate_cache(repo_id, parent_dir)
+
+                return [
+                    BatchItemResult(path=posixpath.join(parent_dir, name), success=success, status=status, errors=errors)
+                    for name in names
+                ]
+
+        results = await asyncio.gather(*(execute_batch(parent_dir, names) for parent_dir, names in batches))
+
+        if dst_dir is not None:
+            await self._invalidate_cache(dst_repo_id or repo_id, dst_dir)
+
+        return BatchOperationResult(
+            operation=operation,
+            items=[item for batch_results in results for item in batch_results],
+            batches=len(batches),
+            elapsed=time.monotonic() - started_at
+        )
+
+    async def _start_copy_move_task(
+            self,
+            operation: BatchOperation,
+            repo_id: str,
+            paths: Iterable[str],
+            dst_dir: str,
+            dst_repo_id: str | None,
+            poll_interval: float,
+            token: str | None = None) -> SeaResult[CopyMoveTask]:
+        groups = self._split_into_batches(paths, sys.maxsize)
+        if len(groups) != 1:
+            raise ValueError('Items of the task should be located in the same directory')
+
+        parent_dir, names = groups[0]
+        handler = self._create_batch_handler(
+            operation, repo_id, parent_dir, names, dst_dir, dst_repo_id, token, background=True)
+
+        response = await handler.execute(content_type=Dict[str, Any])
+        result = SeaResult[CopyMoveTask].from_result(response)
+
+        if not result.success or not response.content:
+            return result
+
+        async def invalidate_cache():
+            if operation == BatchOperation.MOVE:
+                await self._invalidate_cache(repo_id, parent_dir)
+            await self._invalidate_cache(dst_repo_id or repo_id, dst_dir)
+
+        result.content = CopyMoveTask(
+            task_id=response.content['task_id'],
+            operation=operation,
+            get_progress=lambda task_id: self.get_copy_move_progress(task_id, token),
+            cancel=lambda task_id: self.cancel_copy_move_task(task_id, token),
+            on_finish=invalidate_cache,
+            poll_interval=poll_interval
+        )
+
+        return result
+
+    def _create_batch_handler(
+            self,
+            operation: BatchOperation,
+            repo_id: str,
+            parent_dir: str,
+            names: List[str],
+            dst_dir: str | None,
+            dst_repo_id: str | None,
+            token: str | None = None,
+            background: bool = False) -> HttpRequestHandler:
+        if operation == BatchOperation.DELETE:
+            method = HttpMethod.DELETE
+            route = self._route_storage.batch_delete_item
+            data = {
+                'repo_id': repo_id,
+                'parent_dir': parent_dir,
+                'dirents': names
+            }
+        else:
+            method = HttpMethod.POST
+            if background:
+                route = self._route_storage.async_batch_copy_item \
+                    if operation == BatchOperation.COPY else self._route_storage.async_batch_move_item
+            else:
+                route = self._route_storage.sync_batch_copy_item \
+                    if operation == BatchOperation.COPY else self._route_storage.sync_batch_move_item
+            data = {
+                'src_repo_id': repo_id,
+                'src_parent_dir': parent_dir,
+                'dst_repo_id': dst_repo_id or repo_id,
+                'dst_parent_dir': dst_dir,
+                'src_dirents': names
+            }
+
+        return self._create_handler(
+            HttpRequestHandler,
+            method=method,
+            url=urljoin(self.base_url, route),
+            token=token or self.token,
+            headers={'Content-Type': 'application/json'},
+            data=json.dumps(data)
+        )
+
+    @staticmethod
+    def _split_into_batches(paths: Iterable[str], batch_size: int) -> List[Tuple[str, List[str]]]:
+        """Group names of items by parent directory and split groups into batches"""
+        groups: Dict[str, List[str]] = dict()
+
+        for path in paths:
+            parent_dir, name = posixpath.split('/' + path.strip('/'))
+            if not name:
+                raise ValueError('Root directory can not be copied, moved or deleted')
+            groups.setdefault(parent_dir, list()).append(name)
+
+        return [
+            (parent_dir, names[start:start + batch_size])
+            for parent_dir, names in groups.items()
+            for start in range(0, len(names), batch_size)
+        ]
+
+    async def _list_directory(self, repo_id: str, path: str, token: str | None = None):
+        """Get all items in a directory as FileItem and DirectoryItem objects"""
+        method_url = urljoin(self.base_url, self._route_storage.dir(repo_id))
+
+        query_params = QueryParams()
+        query_params.add_param('p', path)
+
+        handler = self._create_handler(
+            HttpRequestHandler,
+            method=HttpMethod.GET,
+            url=method_url,
+            token=token or self.token,
+            query_params=query_params.get_result()
+        )
+
+        response = await handler.execute(content_type=List[Dict[str, Any]])
+        result = SeaResult[List[BaseItem]].from_result(response)
+
+        if result.success and response.content is not None:
+            # items are always turned into models, raw mode is trusted as construct mode
+            if self._listing_parser.mode == ParseMode.VALIDATE:
+                parse_obj = self._parser.parse_obj
+            else:
+                parse_obj = self._listing_parser.construct
+
+            result.content = [
+                parse_obj(DirectoryItem, item) if item['type'] == ItemType.DIRECTORY else parse_obj(FileItem, item)
+                for item in response.content
+            ]
+
+        return result
+
+    @staticmethod
+    def _create_change_events(commit: CommitItem, changes: CommitChanges) -> List[ChangeEvent]:
+        def create_event(change_type: ChangeType, path: str, new_path: str | None = None):
+            return ChangeEvent(
+                commit_id=commit.commit_id,
+                time=commit.time,
+                type=change_type,
+                path='/' + path.lstrip('/'),
+                new_path='/' + new_path.lstrip('/') if new_path is not None else None
+            )
+
+        events = [create_event(ChangeType.DIRECTORY_ADDED, path) for path in changes.newdir]
+        events.extend(create_event(ChangeType.ADDED, path) for path in changes.new)
+        events.extend(create_event(ChangeType.MODIFIED, path) for path in changes.modified)
+        events.extend(create_event(ChangeType.RENAMED, path, new_path) for path, new_path in changes.renamed)
+        events.extend(create_event(ChangeType.MOVED, path, new_path) for path, new_path in changes.moved)
+        events.extend(create_event(ChangeType.REMOVED, path) for path in changes.removed)
+        events.extend(create_event(ChangeType.DIRECTORY_REMOVED, path) for path in changes.deldir)
+
+        return events
+
+    @staticmethod
+    def _is_beneath_any(path: str, dir_paths: set) -> bool:
+        parent = posixpath.dirname(path)
+
+        while True:
+            if parent in dir_paths:
+                return True
+            if parent == posixpath.dirname(parent):
+                return False
+            parent = posixpath.dirname(parent)
+
+    @staticmethod
+    def _match_any(name: str, path: str, patterns: List[str]) -> bool:
+        return any(fnmatch.fnmatchcase(name, pattern) or fnmatch.fnmatchcase(path, pattern) for pattern in patterns)
+
+    async def _download(
+            self,
+            repo_id: str,
+            filepath: str,
+            token: str | None = None,
+            offset: int = 0,
+            length: int | None = None) -> SeaResult[bytes]:
+        is_cached_link = self._is_download_link_cached(repo_id, filepath, token)
+
+        try:
+            handler = await self._create_download_handler(repo_id, filepath, token, offset, length)
+        except DownloadError as error:
+            return SeaResult[bytes](
+                success=False,
+                status=error.status,
+                errors=error.errors,
+                content=None
+            )
+
+        result = await handler.execute()
+
+        if not is_cached_link or result.status not in self.EXPIRED_DOWNLOAD_LINK_STATUSES:
+            return result
+
+        # cached link has expired, so the file is downloaded again by a fresh link
+        self._invalidate_download_link(repo_id, filepath, token)
+        return await self._download(repo_id, filepath, token, offset, length)
+
+    async def _create_download_handler(
+            self,
+            repo_id: str,
+            filepath: str,
+            token: str | None = None,
+            offset: int = 0,
+            length: int | None = None) -> HttpDownloadHandler:
+        response = await self._get_cached_download_link(repo_id, filepath, token=token)
+
+        if not response.success:
+            raise DownloadError(response.status, response.errors)
+
+        return self._create_handler(
+            HttpDownloadHandler,
+            method=HttpMethod.GET,
+            url=response.content,
+            token=token or self.token,
+            offset=offset,
+            length=length
+        )
+
+    async def _download_segment(
+            self,
+            url: str,
+            file: BinaryIO,
+            offset: int,
+            length: int,
+            retries: int,
+            chunk_size: int,
+            token: str | None = None) -> int:
+        written = 0
+        attempt = 0
+
+        while True:
+            handler = self._create_handler(
+                HttpDownloadHandler,
+                method=HttpMethod.GET,
+                url=url,
+                token=token or self.token,
+                offset=offset + written,
+                length=length - written
+            )
+
+            try:
+                async for chunk in handler.iter_chunks(chunk_size):
+                    self._write_at(file, offset + written, chunk)
+                    written += len(chunk)
+            except (DownloadError, aiohttp.ClientError, asyncio.TimeoutError) as error:
+                # link rejected by fileserver will not become valid by repeating
+                if attempt >= retries \
+                        or isinstance(error, DownloadError) and error.status in self.EXPIRED_DOWNLOAD_LINK_STATUSES:
+                    raise
+                attempt += 1
+                continue
+
+            if written >= length or attempt >= retries:
+                break
+
+            # connection was closed before the whole range was received
+            attempt += 1
+
+        if written != length:
+            raise DownloadError(
+                HTTPStatus.PARTIAL_CONTENT,
+                [Error(title='size', message=f'Received {written} of {length} bytes at offset {offset}')])
+
+        return written
+
+    @staticmethod
+    def _write_at(file: BinaryIO, position: int, data: bytes):
+        if hasattr(os, 'pwrite'):
+            os.pwrite(file.fileno(), data, position)
+        else:
+            file.seek(position)
+            file.write(data)
+
+    async def _get_cached_upload_link(self, repo_id: str, dir_path: str, token: str | None = None):
+        if self._upload_link_cache is None:
+            return await self.get_upload_link(repo_id, dir_path, token)
+
+        key = self._get_upload_link_key(repo_id, dir_path, token)
+        upload_link = self._upload_link_cache.get(key)
+
+        if upload_link is not None:
+            return SeaResult[str](
+                success=True,
+                status=HTTPStatus.OK,
+                errors=None,
+                content=upload_link
+            )
+
+        response = await self.get_upload_link(repo_id, dir_path, token)
+
+        if response.success and response.content:
+            self._upload_link_cache.set(key, response.content)
+
+        return response
+
+    def _invalidate_upload_link(self, repo_id: str, dir_path: str, token: str | None = None):
+        if self._upload_link_cache is not None:
+            self._upload_link_cache.delete(self._get_upload_link_key(repo_id, dir_path, token))
+
+    def _get_upload_link_key(self, repo_id: str, dir_path: str, token: str | None = None):
+        return repo_id, dir_path, token or self.token
+
+    async def _upload_files(
+            self,
+            repo_id: str,
+            dir_path: str,
+            files: List[UploadFile],
+            replace: bool = False,
+            relative_path: str | None = None,
+            token: str | None = None) -> SeaResult[List[UploadedFileItem]]:
+        # cached link may have expired, so it is used only if all files can be sent again by a fresh link
+        if not self._is_resendable(files):
+            upload_link_response = await self.get_upload_link(repo_id, dir_path, token)
+
+            if not upload_link_response.success:
+                return SeaResult[List[UploadedFileItem]].from_result(upload_link_response)
+
+            return await self._send_files(
+                repo_id, upload_link_response.content, dir_path, files, replace, relative_path, token)
+
+        is_cached_link = self._upload_link_cache is not None \
+            and self._get_upload_link_key(repo_id, dir_path, token) in self._upload_link_cache
+        upload_link_response = await self._get_cached_upload_link(repo_id, dir_path, token)
+
+        if not upload_link_response.success:
+            return SeaResult[List[UploadedFileItem]].from_result(upload_link_response)
+
+        if not is_cached_link:
+            return await self._send_files(
+                repo_id, upload_link_response.content, dir_path, files, replace, relative_path, token)
+
+        # file objects are sent from the current position by every attempt and closed after the last one
+        # (as aiohttp does with file objects it sends)
+        file_objects = [file['payload'] for file in files if isinstance(file['payload'], io.IOBase)]
+        files = [
+            UploadFile(filename=file['filename'], payload=FilePayload(file['payload']))
+            if isinstance(file['payload'], io.IOBase) else file
+            for file in files
+        ]
+
+        try:
+            response = await self._send_files(
+                repo_id, upload_link_response.content, dir_path, files, replace, relative_path, token)
+
+            if response.status not in self.EXPIRED_UPLOAD_LINK_STATUSES:
+                return response
+
+            # cached link has expired, so the upload is retried once with a fresh link
+            self._invalidate_upload_link(repo_id, dir_path, token)
+            upload_link_response = await self._get_cached_upload_link(repo_id, dir_path, token)
+
+            if not upload_link_response.success:
+                return response
+
+            return await self._send_files(
+                repo_id, upload_link_response.content, dir_path, files, replace, relative_path, token)
+        finally:
+            for file_object in file_objects:
+                file_object.close()
+
+    @staticmethod
+    def _is_resendable(files: List[UploadFile]) -> bool:
+        """Check that all payloads can be sent again (bytes and seekable file objects)"""
+        return all(
+            isinstance(file['payload'], (bytes, bytearray, memoryview))
+            or isinstance(file['payload'], io.IOBase) and file['payload'].seekable()
+            for file in files
+        )
+
+    async def _send_files(
+            self,
+            repo_id: str,
+            upload_link: str,
+            dir_path: str,
+            files: List[UploadFile],
+            replace: bool = False,
+            relative_path: str | None = None,
+            token: str | None = None) -> SeaResult[List[UploadedFileItem]]:
+        query_params = QueryParams()
+        query_params.add_param('ret-json', 1)
+
+        data = aiohttp.FormData()
+        data.add_field('parent_dir', dir_path)
+        data.add_field('replace', str(int(replace)))
+        for file in files:
+            data.add_field('file', self._create_upload_payload(file['payload']), filename=file['filename'])
+
+        if relative_path is not None:
+            data.add_field('relative_path', relative_path)
+
+        handler = self._create_handler(
+            HttpRequestHandler,
+            method=HttpMethod.POST,
+            url=upload_link,
+            route_name='upload',
+            token=token or self.token,
+            query_params=query_params.get_result(),
+            data=data
+        )
+
+        response = await handler.execute(content_type=List[UploadedFileItem])
+        await self._invalidate_cache(repo_id, posixpath.join(dir_path, relative_path or ''))
+        return response
+
+    async def _upload_batch(
+            self,
+            repo_id: str,
+            dir_path: str,
+            batch_files: List[Tuple[str, UploadSource, int]],
+            open_files: asyncio.Semaphore,
+            open_files_lock: asyncio.Lock,
+            replace: bool = False,
+            token: str | None = None) -> List[BulkUploadItemResult]:
+        results: List[BulkUploadItemResult] = list()
+        files: List[UploadFile] = list()
+        opened: List[BinaryIO] = list()
+        paths = list()
+        local_files = sum(1 for _, source, _ in batch_files if isinstance(source, (str, os.PathLike)))
+
+        # all file handles of the batch are acquired at once, so that concurrent batches do not block each other
+        async with open_files_lock:
+            for _ in range(local_files):
+                await open_files.acquire()
+
+        try:
+            for filename, source, _ in batch_files:
+                path = posixpath.join(dir_path, filename)
+
+                if isinstance(source, (str, os.PathLike)):
+                    try:
+                        source = open(source, 'rb')
+                    except OSError as error:
+                        results.append(self._create_bulk_upload_error(path, None, [Error(title='file', message=str(error))]))
+                        continue
+                    opened.append(source)
+
+                files.append(UploadFile(filename=filename, payload=source))
+                paths.append(path)
+
+            if not files:
+                return results
+
+            relative_path = dir_path.strip('/') or None
+            response = await self._upload_files(repo_id, '/', files, replace, relative_path, token)
+        finally:
+            for file in opened:
+                file.close()
+            for _ in range(local_files):
+                open_files.release()
+
+        if not response.success:
+            return results + [self._create_bulk_upload_error(path, response.status, response.errors) for path in paths]
+
+        uploaded_items = response.content or []
+        for index, path in enumerate(paths):
+            results.append(BulkUploadItemResult(
+                path=path,
+                success=index < len(uploaded_items),
+                status=response.status,
+                errors=None,
+                content=uploaded_items[index] if index < len(uploaded_items) else None
+            ))
+
+        return results
+
+    @staticmethod
+    def _create_bulk_upload_error(
+            path: str,
+            status: HTTPStatus | None,
+            errors: List[Error] | None) -> BulkUploadItemResult:
+        return BulkUploadItemResult(
+            path=path,
+            success=False,
+            status=status,
+            errors=errors,
+            content=None
+        )
+
+    @staticmethod
+    def _get_source_size(source: UploadSource, default: int) -> int:
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return len(source)
+
+        if isinstance(source, (str, os.PathLike)):
+            try:
+                return os.path.getsize(source)
+            except OSError:
+                return 0
+
+        if isinstance(source, io.IOBase) and source.seekable():
+            position = source.tell()
+            size = source.seek(0, os.SEEK_END) - position
+            source.seek(position)
+            return size
+
+        # size of stream is unknown, so it is sent in separate batch
+        return default
+
+    @staticmethod
+    async def _iterate(items: Iterable | AsyncIterable) -> AsyncIterator:
+        if isinstance(items, AsyncIterable):
+            async for item in items:
+                yield item
+        else:
+            for item in items:
+                yield item
+
+    async def _get_uploaded_offset(
+            self,
+            repo_id: str,
+            dir_path: str,
+            filename: str,
+            token: str | None = None,
+            default: int = 0) -> int:
+        response = await self.get_uploaded_bytes(repo_id, dir_path, filename, token)
+
+        if not response.success or response.content is None:
+            return default
+
+        return response.content
+
+    async def _upload_chunk(
+            self,
+            upload_link: str,
+            dir_path: str,
+            filename: str,
+            chunk: bytes,
+            offset: int,
+            total: int,
+            replace: bool,
+            relative_path: str | None = None,
+            token: str | None = None):
+        query_params = QueryParams()
+        query_params.add_param('ret-json', 1)
+
+        data = aiohttp.FormData()
+        data.add_field('file', chunk, filename=filename)
+        data.add_field('parent_dir', dir_path)
+        data.add_field('replace', str(int(replace)))
+
+        if relative_path is not None:
+            data.add_field('relative_path', relative_path)
+
+        headers = {
+            'Content-Range': f'bytes {offset}-{offset + len(chunk) - 1}/{total}',
+            'Content-Disposition': f'attachment; filename="{quote(filename)}"'
+        }
+
+        handler = self._create_handler(
+            HttpRequestHandler,
+            method=HttpMethod.POST,
+            url=upload_link,
+            route_name='upload',
+            token=token or self.token,
+            headers=headers,
+            query_params=query_params.get_result(),
+            data=data
+        )
+
+        # seafile returns information about uploaded file only in response to the last chunk
+        if offset + len(chunk) < total:
+            return await handler.execute()
+
+        return await handler.execute(content_type=List[UploadedFileItem])
+
+    @staticmethod
+    def _create_upload_payload(payload: UploadPayload) -> UploadPayload:
+        read = getattr(payload, 'read', None)
+
+        # async file objects (e.g. aiofiles) iterate by lines, so they are read by chunks of fixed size instead
+        if isinstance(payload, AsyncIterable) and inspect.iscoroutinefunction(read):
+            return SeafileHttpClient._read_by_chunks(read)
+
+        return payload
+
+    @staticmethod
+    async def _read_by_chunks(read, chunk_size: int = 256 * 1024) -> AsyncIterator[bytes]:
+        while chunk := await read(chunk_size):
+            yield chunk
+
+    @staticmethod
+    async def _prepend_chunk(chunk: bytes, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        if chunk:
+            yield chunk
+
+        async for chunk in chunks:
+            yield chunk
+
+    @staticmethod
+    async def _write_chunks(chunks: AsyncIterator[bytes], destination) -> int:
+        written = 0
+
+        async for chunk in chunks:
+            result = destination.write(chunk)
+            if inspect.isawaitable(result):
+                await result
+            written += len(chunk)
+
+        return written
+
+    @staticmethod
+    def _create_cache(settings: CacheSettings | None) -> TTLCache | None:
+        if settings is None:
+            return None
+
+        return TTLCache(settings.ttl, settings.max_size)
+
+    def _release_session(self):
+        """Forget the session closing it in its event loop (or detaching it if the loop is not running)"""
+        session, loop = self._session, self._session_loop
+        self._session = None
+        self._session_loop = None
+
+        if session is None or session.closed:
+            return
+
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            session.detach()
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        settings = self._connection_settings
+
+        connector = aiohttp.TCPConnector(
+            limit=settings.limit,
+            limit_per_host=settings.limit_per_host,
+            keepalive_timeout=settings.keepalive_timeout if settings.keepalive_timeout > 0 else None,
+            force_close=settings.keepalive_timeout <= 0,
+            use_dns_cache=True,
+            ttl_dns_cache=settings.ttl_dns_cache
+        )
+
+        trace_configs = [self._metrics.trace_config] if self._metrics is not None else None
+        return aiohttp.ClientSession(connector=connector, trace_configs=trace_configs)
+
+    def _create_handler(self, handler_type: Type[HandlerT], **kwargs) -> HandlerT:
+        if issubclass(handler_type, HttpRequestHandler):
+            kwargs.setdefault('parser', self._parser)
+
+        kwargs.setdefault('retry_policy', self._retry_policy)
+        kwargs.setdefault('limiter', self._concurrency_limiter)
+
+        if self._metrics is not None:
+            kwargs.setdefault('metrics', self._metrics)
+            if 'route_name' not in kwargs:
+                route_name = self._route_storage.get_route_name(kwargs['url'])
+                if route_name is None and issubclass(handler_type, HttpDownloadHandler):
+                    route_name = 'download'
+                kwargs['route_name'] = route_name
+
+        return handler_type(session=self.session, **kwargs)
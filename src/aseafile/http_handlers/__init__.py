@@ -1,2 +1,4 @@
 from .http_request_handler import HttpRequestHandler
 from .http_download_handler import HttpDownloadHandler
+from .base_http_handler import BaseHttpHandler
+from .file_payload import FilePayload
@@ -1,10 +1,20 @@
+import time
+import asyncio
+import aiohttp
 from http import HTTPStatus
-from typing import Dict, Any
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Any, Tuple
+from aiohttp.payload import BytesPayload
+from contextlib import asynccontextmanager, nullcontext
 from pydantic import parse_raw_as
 from ..enums import HttpMethod
 from abc import ABCMeta, abstractmethod
 from ..exceptions import UnauthorizedError
-from ..models import SeaResult, Error
+from ..models import SeaResult, Error, RetryPolicy
+from ..limiting import AdaptiveLimiter
+from ..metrics import MetricsRegistry, RequestTrace
+from .file_payload import FilePayload
 
 
 class BaseHttpHandler(metaclass=ABCMeta):
@@ -21,6 +31,10 @@ class BaseHttpHandler(metaclass=ABCMeta):
         HTTPStatus.IM_USED
     )
 
+    # Indicates that response body is streamed to the caller for unlimited time,
+    # so only waiting for data (not the whole attempt) is limited by time budget of the retry policy
+    STREAMED_RESPONSE = False
+
     def __init__(
             self,
             method: HttpMethod,
@@ -28,22 +42,229 @@ class BaseHttpHandler(metaclass=ABCMeta):
             token: str | None = None,
             headers: Dict[str, str] | None = None,
             query_params: Dict[str, str | int] | None = None,
-            data: Any | None = None):
+            data: Any | None = None,
+            session: aiohttp.ClientSession | None = None,
+            retry_policy: RetryPolicy | None = None,
+            limiter: AdaptiveLimiter | None = None,
+            metrics: MetricsRegistry | None = None,
+            route_name: str | None = None):
         self._method = method
         self._route = url
         self._data = data
         self._token = token
         self._query_params = query_params
+        self._session = session
+        self._retry_policy = retry_policy
+        self._limiter = limiter
+        self._metrics = metrics
+        self._route_name = route_name or 'other'
+        self._trace: RequestTrace | None = None
+        self._retries = 0
         self._headers: Dict[str, str] = dict()
         if token is not None:
             self._headers |= self._create_authorization_headers(token)
         if headers is not None:
             self._headers |= headers
 
+    @property
+    def request_key(self) -> Tuple:
+        """Key identifying the request by method, url, normalized query parameters and token"""
+        query_params = tuple(sorted((key, str(value)) for key, value in (self._query_params or dict()).items()))
+        return self._method, self._route, query_params, self._token
+
+    @property
+    def retries(self) -> int:
+        """Number of repeated attempts of the last executed request"""
+        return self._retries
+
     @abstractmethod
     async def execute(self, *args, **kwargs) -> SeaResult:
         ...
 
+    @asynccontextmanager
+    async def _open_session(self):
+        """Use the shared session if it was passed to handler, otherwise open a temporary one"""
+        if self._session is not None and not self._session.closed:
+            yield self._session
+            return
+
+        async with aiohttp.ClientSession() as session:
+            yield session
+
+    @asynccontextmanager
+    async def _send_request(self, session: aiohttp.ClientSession):
+        """Send request and repeat attempts failed by transient errors according to the retry policy"""
+        self._retries = 0
+        started_at = time.monotonic()
+        data = self._prepare_data()
+
+        while True:
+            async with self._acquire_slot() as permit:
+                trace = self._start_trace()
+                try:
+                    response = await session.request(
+                        method=self._method,
+                        url=self._route,
+                        headers=self._headers,
+                        params=self._query_params,
+                        data=data,
+                        timeout=self._get_attempt_timeout(session, started_at),
+                        trace_request_ctx=trace
+                    )
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as error:
+                    self._finish_trace(trace, error)
+                    if permit is not None:
+                        permit.drop()
+
+                    delay = self._get_retry_delay(started_at, data)
+                    if delay is None:
+                        raise
+                else:
+                    if trace is not None:
+                        trace.mark_headers(response.status)
+                    if permit is not None:
+                        permit.record(response.status)
+
+                    delay = None
+                    if self._retry_policy is not None and response.status in self._retry_policy.retry_statuses:
+                        delay = self._get_retry_delay(started_at, data, response.headers.get('Retry-After'))
+
+                    if delay is not None:
+                        response.release()
+                        self._finish_trace(trace)
+
+            if delay is None:
+                break
+
+            self._retries += 1
+            await asyncio.sleep(delay)
+
+        # the slot is already released, so reading of the body (e.g. a streamed download)
+        # does not block other requests of the caller
+        try:
+            yield response
+        except Exception as error:
+            self._finish_trace(trace, error)
+            raise
+        finally:
+            response.release()
+            self._finish_trace(trace)
+
+    def _acquire_slot(self):
+        """Take a slot of the concurrency limiter for one attempt (the slot is held and latency is measured up to headers)"""
+        if self._limiter is None:
+            return nullcontext()
+
+        return self._limiter.acquire()
+
+    def _start_trace(self) -> RequestTrace | None:
+        if self._metrics is None:
+            return None
+
+        self._trace = RequestTrace(self._route_name, str(self._method))
+        return self._trace
+
+    def _finish_trace(self, trace: RequestTrace | None, error: BaseException | None = None):
+        """Record the trace of finished attempt in the metrics registry (only once)"""
+        if trace is None or self._trace is not trace:
+            return
+
+        self._trace = None
+        if error is not None:
+            trace.mark_error(error)
+
+        trace.finish()
+        self._metrics.record(trace)
+
+    def _mark_transferred(self, size: int | None = None):
+        """Mark that response body of the current attempt was read"""
+        if self._trace is not None:
+            self._trace.mark_transferred(size)
+
+    def _prepare_data(self) -> Any:
+        """Turn form data into payload once, so the same body can be sent by every attempt"""
+        if isinstance(self._data, aiohttp.FormData) and self._can_retry():
+            return self._data()
+
+        return self._data
+
+    def _can_retry(self) -> bool:
+        return self._retry_policy is not None \
+            and self._retry_policy.max_retries > 0 \
+            and self._retry_policy.is_retryable_method(self._method)
+
+    def _get_attempt_timeout(self, session: aiohttp.ClientSession, started_at: float) -> aiohttp.ClientTimeout:
+        """Get timeout of the next attempt limited by the rest of time budget of retry policy"""
+        timeout = session.timeout
+
+        if not self._can_retry() or self._retry_policy.max_total_time is None:
+            return timeout
+
+        # zero timeout means no timeout in aiohttp, so the attempt gets at least a moment
+        remaining = max(self._retry_policy.max_total_time - (time.monotonic() - started_at), 0.001)
+
+        def limit(value: float | None) -> float:
+            return min(value, remaining) if value is not None else remaining
+
+        if self.STREAMED_RESPONSE:
+            return aiohttp.ClientTimeout(
+                total=timeout.total,
+                connect=limit(timeout.connect),
+                sock_read=limit(timeout.sock_read),
+                sock_connect=timeout.sock_connect
+            )
+
+        return aiohttp.ClientTimeout(
+            total=limit(timeout.total),
+            connect=timeout.connect,
+            sock_read=timeout.sock_read,
+            sock_connect=timeout.sock_connect
+        )
+
+    def _get_retry_delay(self, started_at: float, data: Any, retry_after: str | None = None) -> float | None:
+        """Get delay before the next attempt (None if the request should not be repeated)"""
+        if not self._can_retry() or self._retries >= self._retry_policy.max_retries or not self._is_replayable(data):
+            return None
+
+        delay = self._retry_policy.get_delay(self._retries + 1)
+        if retry_after is not None and self._retry_policy.respect_retry_after:
+            delay = max(delay, self._parse_retry_after(retry_after))
+
+        max_total_time = self._retry_policy.max_total_time
+        if max_total_time is not None and time.monotonic() - started_at + delay > max_total_time:
+            return None
+
+        return delay
+
+    @staticmethod
+    def _is_replayable(data: Any) -> bool:
+        """Check that request body can be sent again (streams and files are consumed by the first attempt)"""
+        if data is None or isinstance(data, (bytes, str, dict, BytesPayload, FilePayload)):
+            return True
+
+        if isinstance(data, aiohttp.MultipartWriter):
+            return all(isinstance(part, (BytesPayload, FilePayload)) for part, _, _ in data)
+
+        return False
+
+    @staticmethod
+    def _parse_retry_after(retry_after: str) -> float:
+        """Parse Retry-After header given in seconds or as http date"""
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return 0.0
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
     @staticmethod
     def _try_parse_errors(response_content: str | bytes):
         try:
@@ -0,0 +1,28 @@
+import os
+import asyncio
+from typing import IO, Any
+from aiohttp.abc import AbstractStreamWriter
+from aiohttp.payload import IOBasePayload
+
+
+class FilePayload(IOBasePayload):
+    """Payload of seekable file object that can be sent several times
+
+    Every sending reads the file from the same position, the file is not closed after sending
+    (unlike payloads of file objects created by aiohttp), so it should be closed by the owner.
+    """
+
+    def __init__(self, value: IO[Any], *args: Any, **kwargs: Any):
+        super().__init__(value, *args, **kwargs)
+        self._position = value.tell()
+
+    @property
+    def size(self) -> int:
+        return self._value.seek(0, os.SEEK_END) - self._position
+
+    async def write(self, writer: AbstractStreamWriter) -> None:
+        loop = asyncio.get_running_loop()
+        self._value.seek(self._position)
+
+        while chunk := await loop.run_in_executor(None, self._value.read, 2 ** 16):
+            await writer.write(chunk)
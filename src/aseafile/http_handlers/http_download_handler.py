@@ -1,12 +1,17 @@
 import aiohttp
 from http import HTTPStatus
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator
 from .base_http_handler import BaseHttpHandler
 from ..enums import HttpMethod
-from ..models import SeaResult
+from ..models import SeaResult, RetryPolicy
+from ..limiting import AdaptiveLimiter
+from ..metrics import MetricsRegistry
+from ..exceptions import DownloadError
 
 
 class HttpDownloadHandler(BaseHttpHandler):
+    DEFAULT_CHUNK_SIZE = 256 * 1024
+    STREAMED_RESPONSE = True
 
     def __init__(
             self,
@@ -15,31 +20,96 @@ class HttpDownloadHandler(BaseHttpHandler):
             token: str | None = None,
             headers: Dict[str, str] | None = None,
             query_params: Dict[str, str | int] | None = None,
-            data: Any | None = None):
-        super().__init__(method, url, token, headers, query_params, data)
+            data: Any | None = None,
+            session: aiohttp.ClientSession | None = None,
+            retry_policy: RetryPolicy | None = None,
+            limiter: AdaptiveLimiter | None = None,
+            metrics: MetricsRegistry | None = None,
+            route_name: str | None = None,
+            offset: int = 0,
+            length: int | None = None):
+        super().__init__(method, url, token, headers, query_params, data, session, retry_policy, limiter, metrics, route_name)
+        self._offset = offset
+        self._length = length
+
+        if offset < 0 or (length is not None and length <= 0):
+            raise ValueError('Offset should not be negative and length should be positive')
+
+        if offset > 0 or length is not None:
+            self._headers['Range'] = self._create_range_header(offset, length)
 
     async def execute(self) -> SeaResult[bytes]:
-        async with aiohttp.ClientSession() as session:
-            async with session.request(
-                    method=self._method,
-                    url=self._route,
-                    headers=self._headers,
-                    params=self._query_params,
-                    data=self._data
-            ) as response:
+        async with self._open_session() as session:
+            async with self._send_request(session) as response:
                 response_content = await response.content.read()
+                self._mark_transferred(len(response_content))
                 http_status = HTTPStatus(response.status)
 
-                result = SeaResult[bytes](
+                result = SeaResult(
                     success=(http_status in self.SUCCESS_STATUSES),
                     status=http_status,
                     errors=None,
-                    content=None
+                    content=None,
+                    retries=self._retries
                 )
 
                 if result.success:
-                    result.content = response_content
+                    result.content = self._trim_full_content(http_status, response_content)
                 else:
                     result.errors = self._try_parse_errors(response_content)
 
                 return result
+
+    async def iter_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Read response body by chunks without loading whole file into memory
+
+        :param chunk_size: maximum size of yielded chunk in bytes
+        :raises DownloadError: if the response status is not successful
+        """
+        async with self._open_session() as session:
+            async with self._send_request(session) as response:
+                http_status = HTTPStatus(response.status)
+
+                if http_status not in self.SUCCESS_STATUSES:
+                    response_content = await response.content.read()
+                    self._mark_transferred(len(response_content))
+                    raise DownloadError(http_status, self._try_parse_errors(response_content))
+
+                if http_status == HTTPStatus.PARTIAL_CONTENT or 'Range' not in self._headers:
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        self._mark_transferred(len(chunk))
+                        yield chunk
+                    return
+
+                # the server ignored the range header and sends the whole file
+                position = 0
+                end = self._offset + self._length if self._length is not None else None
+
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    self._mark_transferred(len(chunk))
+                    chunk_start = position
+                    position += len(chunk)
+
+                    if position <= self._offset:
+                        continue
+
+                    chunk = chunk[max(self._offset - chunk_start, 0):]
+                    if end is not None and position >= end:
+                        yield chunk[:len(chunk) - (position - end)]
+                        return
+
+                    yield chunk
+
+    def _trim_full_content(self, http_status: HTTPStatus, content: bytes) -> bytes:
+        if http_status == HTTPStatus.PARTIAL_CONTENT or 'Range' not in self._headers:
+            return content
+
+        end = self._offset + self._length if self._length is not None else None
+        return content[self._offset:end]
+
+    @staticmethod
+    def _create_range_header(offset: int, length: int | None) -> str:
+        if length is None:
+            return f'bytes={offset}-'
+
+        return f'bytes={offset}-{offset + length - 1}'
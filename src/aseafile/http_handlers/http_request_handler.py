@@ -1,10 +1,12 @@
 import aiohttp
 from http import HTTPStatus
-from pydantic import parse_raw_as
 from typing import Type, TypeVar, Dict, Any
 from .base_http_handler import BaseHttpHandler
 from ..enums import HttpMethod
-from ..models import SeaResult
+from ..models import SeaResult, RetryPolicy
+from ..limiting import AdaptiveLimiter
+from ..metrics import MetricsRegistry
+from ..parsers import ResponseParser
 
 T = TypeVar('T')
 
@@ -18,31 +20,34 @@ class HttpRequestHandler(BaseHttpHandler):
             token: str | None = None,
             headers: Dict[str, str] | None = None,
             query_params: Dict[str, str | int] | None = None,
-            data: Any | None = None):
-        super().__init__(method, url, token, headers, query_params, data)
+            data: Any | None = None,
+            session: aiohttp.ClientSession | None = None,
+            retry_policy: RetryPolicy | None = None,
+            limiter: AdaptiveLimiter | None = None,
+            metrics: MetricsRegistry | None = None,
+            route_name: str | None = None,
+            parser: ResponseParser | None = None):
+        super().__init__(method, url, token, headers, query_params, data, session, retry_policy, limiter, metrics, route_name)
+        self._parser = parser or ResponseParser()
 
     async def execute(self, content_type: Type[T] | None = None) -> SeaResult[T]:
-        async with aiohttp.ClientSession() as session:
-            async with session.request(
-                    method=self._method,
-                    url=self._route,
-                    headers=self._headers,
-                    params=self._query_params,
-                    data=self._data
-            ) as response:
+        async with self._open_session() as session:
+            async with self._send_request(session) as response:
                 response_content = await response.content.read()
+                self._mark_transferred(len(response_content))
                 http_status = HTTPStatus(response.status)
 
-                result = SeaResult[T](
+                result = SeaResult(
                     success=(http_status in self.SUCCESS_STATUSES),
                     status=http_status,
                     errors=None,
-                    content=None
+                    content=None,
+                    retries=self._retries
                 )
 
                 if result.success:
                     if content_type is not None:
-                        result.content = parse_raw_as(content_type, response_content)
+                        result.content = self._parser.parse(content_type, response_content)
                 else:
                     result.errors = self._try_parse_errors(response_content)
 
@@ -0,0 +1 @@
+from .adaptive_limiter import AdaptiveLimiter, LimiterPermit
@@ -0,0 +1,221 @@
+import math
+import time
+import asyncio
+from http import HTTPStatus
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque
+from ..models import LimiterMetrics
+
+
+class LimiterPermit:
+    """Slot of the limiter taken by one request, used to report the outcome of the request"""
+
+    def __init__(self, limiter: 'AdaptiveLimiter', in_flight: int):
+        self._limiter = limiter
+        self._in_flight = in_flight
+        self._started_at = time.monotonic()
+        self._reported = False
+
+    @property
+    def reported(self) -> bool:
+        return self._reported
+
+    def record(self, status: int):
+        """Report that the response was received (overload statuses are reported as drops)
+
+        :param status: http status of the response
+        """
+        if self._reported:
+            return
+
+        self._reported = True
+        if status in self._limiter.DROP_STATUSES:
+            self._limiter.on_drop()
+        else:
+            self._limiter.on_sample(time.monotonic() - self._started_at, self._in_flight)
+
+    def drop(self):
+        """Report that the request failed by overload (e.g. connection error or timeout)"""
+        if not self._reported:
+            self._reported = True
+            self._limiter.on_drop()
+
+
+class AdaptiveLimiter:
+    """Limiter of concurrent requests that adjusts the limit to latency of the server
+
+    The limit grows while recent latency stays close to the long-term baseline and is reduced
+    proportionally when recent latency exceeds the baseline (gradient). Overload responses
+    and connection errors reduce the limit multiplicatively (AIMD).
+    """
+
+    # Statuses of responses that indicate overload of the server
+    DROP_STATUSES = (
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT
+    )
+
+    def __init__(
+            self,
+            initial_limit: int = 20,
+            min_limit: int = 1,
+            max_limit: int = 200,
+            tolerance: float = 1.5,
+            smoothing: float = 0.2,
+            backoff_ratio: float = 0.9,
+            recent_window: int = 10,
+            baseline_window: int = 500):
+        """
+        :param initial_limit: limit before any request is measured
+        :param min_limit: minimum limit
+        :param max_limit: maximum limit
+        :param tolerance: ratio of recent latency to baseline latency that does not reduce the limit
+        :param smoothing: weight of new limit estimation in the limit (0..1]
+        :param backoff_ratio: multiplier of the limit applied on drop (0..1)
+        :param recent_window: number of requests recent latency is averaged by
+        :param baseline_window: number of requests baseline latency is averaged by
+        """
+        if not 0 < min_limit <= initial_limit <= max_limit:
+            raise ValueError('Limits should satisfy 0 < min_limit <= initial_limit <= max_limit')
+        if tolerance < 1 or not 0 < smoothing <= 1 or not 0 < backoff_ratio < 1:
+            raise ValueError('Tolerance should be at least 1, smoothing and backoff ratio should be in (0, 1)')
+
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._tolerance = tolerance
+        self._smoothing = smoothing
+        self._backoff_ratio = backoff_ratio
+        self._recent_factor = 2 / (recent_window + 1)
+        self._baseline_window = baseline_window
+        self._baseline_latency: float | None = None
+        self._recent_latency: float | None = None
+        self._samples = 0
+        self._drops = 0
+        self._last_backoff_at: float | None = None
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed to be sent at the same time"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for a free slot"""
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    @property
+    def metrics(self) -> LimiterMetrics:
+        return LimiterMetrics(
+            limit=self.limit,
+            in_flight=self._in_flight,
+            queue_depth=self.queue_depth,
+            baseline_latency=self._baseline_latency,
+            recent_latency=self._recent_latency,
+            samples=self._samples,
+            drops=self._drops
+        )
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[LimiterPermit]:
+        """Wait for a free slot and hold it while the request is being sent
+
+        Exceptions raised while the slot is held (except cancellation) are reported as drops.
+        """
+        await self._acquire()
+        permit = LimiterPermit(self, self._in_flight)
+
+        try:
+            yield permit
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            permit.drop()
+            raise
+        finally:
+            self._release()
+
+    def on_sample(self, latency: float, in_flight: int):
+        """Adjust the limit by latency of the successful request
+
+        :param latency: latency of the request in seconds
+        :param in_flight: number of requests in flight when the request was sent
+        """
+        self._samples += 1
+
+        if self._baseline_latency is None or self._recent_latency is None:
+            self._baseline_latency = self._recent_latency = latency
+        else:
+            self._recent_latency += (latency - self._recent_latency) * self._recent_factor
+
+            # baseline follows the lowest latency and slowly drifts up if the server became slower
+            if latency < self._baseline_latency:
+                self._baseline_latency = latency
+            else:
+                self._baseline_latency += (self._recent_latency - self._baseline_latency) / self._baseline_window
+
+        gradient = max(0.5, min(1.0, self._tolerance * self._baseline_latency / max(self._recent_latency, 1e-9)))
+        new_limit = self._limit * gradient + math.sqrt(self._limit)
+
+        # limit is not raised while the client does not use even half of it
+        if in_flight < self._limit / 2:
+            new_limit = min(new_limit, self._limit)
+
+        # every request of the window adjusts the limit by its share, so the limit changes once per round trip
+        self._set_limit(self._limit + (new_limit - self._limit) * self._smoothing / self._limit)
+
+    def on_drop(self):
+        """Reduce the limit after the request failed by overload
+
+        Drops of requests sent before the previous reduction are counted but do not reduce the limit again.
+        """
+        self._drops += 1
+
+        now = time.monotonic()
+        if self._last_backoff_at is not None and now - self._last_backoff_at < (self._recent_latency or 0):
+            return
+
+        self._last_backoff_at = now
+        self._set_limit(self._limit * self._backoff_ratio)
+
+    def _set_limit(self, limit: float):
+        self._limit = max(float(self._min_limit), min(float(self._max_limit), limit))
+        self._wake_up()
+
+    async def _acquire(self):
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # the slot was given to the cancelled request, give it to the next one
+                self._release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+
+    def _release(self):
+        self._in_flight -= 1
+        self._wake_up()
+
+    def _wake_up(self):
+        while self._waiters and self._in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self._in_flight += 1
+                waiter.set_result(None)
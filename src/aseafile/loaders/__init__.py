@@ -0,0 +1 @@
+from .file_detail_loader import FileDetailLoader
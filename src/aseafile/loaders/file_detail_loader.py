@@ -0,0 +1,189 @@
+import asyncio
+import posixpath
+from http import HTTPStatus
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Tuple
+from ..enums import ItemType
+from ..models import SeaResult, Error, FileItem, FileItemDetail, FileListingDetail, CompactListing
+
+if TYPE_CHECKING:
+    from ..http_client import SeafileHttpClient
+
+ListingKey = Tuple[str, str, str | None]
+Listing = Tuple[SeaResult[CompactListing], Dict[str, int]]
+
+
+class FileDetailLoader:
+    """Loader of file details that batches lookups by parent directories
+
+    Lookups issued in the same iteration of the event loop are grouped by parent directory,
+    every directory is listed once and the details are taken from the listing as FileListingDetail.
+    If fields absent in listings are required, FileItemDetail is requested by get_file_detail of the client.
+    Listings are not kept after lookups are answered (use response cache of the client for caching).
+    """
+
+    # Fields of FileListingDetail taken from entry of the listing
+    LISTING_FIELDS: Dict[str, Callable[[FileItem], Any]] = {
+        'id': lambda item: item.id,
+        'type': lambda item: item.type,
+        'name': lambda item: item.name,
+        'mtime': lambda item: item.mtime,
+        'permission': lambda item: item.permission,
+        'size': lambda item: item.size,
+        'starred': lambda item: item.starred,
+        'last_modified': lambda item: datetime.fromtimestamp(item.mtime, timezone.utc),
+        'last_modifier_name': lambda item: item.modifier_name,
+        'last_modifier_email': lambda item: item.modifier_email,
+        'last_modifier_contact_email': lambda item: item.modifier_contact_email
+    }
+
+    def __init__(self, client: 'SeafileHttpClient', concurrency: int = 8):
+        """
+        :param client: http client used to list directories and get details
+        :param concurrency: maximum number of directories listed at the same time
+        """
+        self._client = client
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._listings: Dict[ListingKey, asyncio.Future] = dict()
+        self._queued: List[ListingKey] = list()
+        self._listed = 0
+
+    @property
+    def listed(self) -> int:
+        """Number of directories listed by the loader"""
+        return self._listed
+
+    async def load(
+            self,
+            repo_id: str,
+            filepath: str,
+            fields: Iterable[str] | None = None,
+            token: str | None = None) -> SeaResult[FileListingDetail | FileItemDetail]:
+        """Get detail information about the file
+
+        :param repo_id: id of repository where file is located
+        :param filepath: path to file
+        :param fields: required fields of FileItemDetail (by default fields available in listing);
+        if some of them are absent in listing, the detail is requested by get_file_detail
+        :param token: access token
+        :returns: SeaResult object with FileListingDetail taken from listing
+        or with FileItemDetail if fields absent in listing are required
+        """
+        if fields is not None and not set(fields).issubset(self.LISTING_FIELDS):
+            return await self._client.get_file_detail(repo_id, filepath, token=token)
+
+        parent_dir, name = self._split_path(filepath)
+        listing, names = await self._get_listing(repo_id, parent_dir, token)
+        result = SeaResult[FileListingDetail].from_result(listing)
+
+        if not result.success:
+            return result
+
+        index = names.get(name)
+        if index is None or listing.content.get_type(index) != ItemType.FILE:
+            result.success = False
+            result.status = HTTPStatus.NOT_FOUND
+            result.errors = [Error(title='error_msg', message='File not found')]
+            return result
+
+        item = listing.content[index]
+        result.content = FileListingDetail.construct(**{field: get(item) for field, get in self.LISTING_FIELDS.items()})
+        return result
+
+    async def load_many(
+            self,
+            repo_id: str,
+            filepaths: Iterable[str],
+            fields: Iterable[str] | None = None,
+            token: str | None = None) -> List[SeaResult[FileListingDetail | FileItemDetail]]:
+        """Get detail information about many files (see load)
+
+        :param repo_id: id of repository where files are located
+        :param filepaths: paths to files
+        :param fields: required fields of FileItemDetail (by default fields available in listing)
+        :param token: access token
+        :returns: list of SeaResult objects with FileListingDetail (or FileItemDetail) in order of paths
+        """
+        fields = list(fields) if fields is not None else None
+        return list(await asyncio.gather(*(self.load(repo_id, path, fields, token) for path in filepaths)))
+
+    async def exists(self, repo_id: str, paths: Iterable[str], token: str | None = None) -> SeaResult[Dict[str, bool]]:
+        """Check existence of files and directories with one listing per distinct parent directory
+
+        :param repo_id: id of repository where items are located
+        :param paths: paths to files or directories
+        :param token: access token
+        :returns: SeaResult object with existence of items by paths
+        (unsuccessful if some directory could not be listed for another reason than absence)
+        """
+        paths = list(paths)
+        split_paths = {path: self._split_path(path) for path in paths}
+        parent_dirs = {parent_dir for parent_dir, name in split_paths.values() if name}
+
+        listings = dict(zip(parent_dirs, await asyncio.gather(
+            *(self._get_listing(repo_id, parent_dir, token) for parent_dir in parent_dirs))))
+
+        result = SeaResult[Dict[str, bool]](success=True, status=HTTPStatus.OK, content=dict())
+
+        for path, (parent_dir, name) in split_paths.items():
+            # root directory always exists
+            if not name:
+                result.content[path] = True
+                continue
+
+            listing, names = listings[parent_dir]
+            if not listing.success and listing.status != HTTPStatus.NOT_FOUND:
+                result.success = False
+                result.status = listing.status
+                result.errors = listing.errors
+
+            result.content[path] = name in names
+
+        return result
+
+    async def _get_listing(self, repo_id: str, parent_dir: str, token: str | None) -> Listing:
+        key = (repo_id, parent_dir, token)
+        future = self._listings.get(key)
+
+        if future is None:
+            future = self._listings[key] = asyncio.get_running_loop().create_future()
+            if not self._queued:
+                asyncio.get_running_loop().call_soon(self._dispatch)
+            self._queued.append(key)
+
+        return await asyncio.shield(future)
+
+    def _dispatch(self):
+        """Start listing of directories queued in the previous iteration of the event loop"""
+        queued, self._queued = self._queued, list()
+
+        for key in queued:
+            asyncio.ensure_future(self._list_directory(key))
+
+    async def _list_directory(self, key: ListingKey):
+        repo_id, parent_dir, token = key
+        future = self._listings[key]
+
+        try:
+            async with self._semaphore:
+                listing = await self._client.get_items(repo_id, parent_dir, token=token, compact=True)
+                self._listed += 1
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            future.set_exception(error)
+        else:
+            names = dict()
+            if listing.success and listing.content is not None:
+                names = {name: index for index, name in enumerate(listing.content.column('name'))}
+            future.set_result((listing, names))
+        finally:
+            # answered listings are not shared with next lookups
+            del self._listings[key]
+            if future.done() and not future.cancelled():
+                future.exception()
+
+    @staticmethod
+    def _split_path(path: str) -> Tuple[str, str]:
+        return posixpath.split(posixpath.normpath('/' + path.strip('/')))
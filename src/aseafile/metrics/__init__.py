@@ -0,0 +1,4 @@
+from .latency_histogram import LatencyHistogram
+from .request_trace import RequestTrace
+from .route_metrics import RouteMetrics
+from .metrics_registry import MetricsRegistry, MetricsCallback
@@ -0,0 +1,85 @@
+import bisect
+from typing import Dict, List, Tuple, Any
+
+
+class LatencyHistogram:
+    """Histogram of latencies in seconds with fixed exponential buckets"""
+
+    # Upper bounds of buckets in seconds (the last bucket is unbounded)
+    DEFAULT_BOUNDS = (
+        0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+    )
+
+    __slots__ = ('_bounds', '_counts', '_count', '_sum', '_min', '_max')
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_BOUNDS):
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._min: float | None = None
+        self._max: float | None = None
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    @property
+    def mean(self) -> float | None:
+        return self._sum / self._count if self._count else None
+
+    @property
+    def min(self) -> float | None:
+        return self._min
+
+    @property
+    def max(self) -> float | None:
+        return self._max
+
+    @property
+    def buckets(self) -> List[Tuple[float, int]]:
+        """Pairs of upper bound and number of observed values in the bucket"""
+        return list(zip(self._bounds + (float('inf'),), self._counts))
+
+    def observe(self, value: float):
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self._count += 1
+        self._sum += value
+        self._min = value if self._min is None else min(self._min, value)
+        self._max = value if self._max is None else max(self._max, value)
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate quantile by upper bound of the bucket containing it (None if nothing was observed)
+
+        :param q: quantile in range [0, 1]
+        """
+        if not 0 <= q <= 1:
+            raise ValueError('Quantile should be in range [0, 1]')
+
+        if not self._count:
+            return None
+
+        rank = q * self._count
+        accumulated = 0
+        for bound, count in zip(self._bounds, self._counts):
+            accumulated += count
+            if accumulated >= rank:
+                return min(bound, self._max)
+
+        return self._max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self._count,
+            'sum': self._sum,
+            'min': self._min,
+            'max': self._max,
+            'p50': self.quantile(0.5),
+            'p90': self.quantile(0.9),
+            'p99': self.quantile(0.99),
+            'buckets': [[bound, count] for bound, count in self.buckets if count]
+        }
@@ -0,0 +1,100 @@
+import warnings
+import aiohttp
+from types import SimpleNamespace
+from typing import Dict, List, Any, Callable
+from .request_trace import RequestTrace
+from .route_metrics import RouteMetrics
+
+MetricsCallback = Callable[[RequestTrace], Any]
+
+
+class MetricsRegistry:
+    """Registry of metrics of requests grouped by routes of the web api
+
+    Timings of connections are collected by aiohttp trace config of the session,
+    other measurements are reported by http handlers.
+    """
+
+    def __init__(self):
+        self._routes: Dict[str, RouteMetrics] = dict()
+        self._callbacks: List[MetricsCallback] = list()
+        self._trace_config: aiohttp.TraceConfig | None = None
+
+    @property
+    def routes(self) -> Dict[str, RouteMetrics]:
+        """Metrics by route names"""
+        return self._routes
+
+    @property
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Trace config that should be added to the session of the client"""
+        if self._trace_config is None:
+            self._trace_config = self._create_trace_config()
+
+        return self._trace_config
+
+    def get(self, route: str) -> RouteMetrics | None:
+        return self._routes.get(route)
+
+    def add_callback(self, callback: MetricsCallback):
+        """Add callback called with trace of every finished request attempt
+
+        :param callback: function taking RequestTrace
+        """
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback: MetricsCallback):
+        self._callbacks.remove(callback)
+
+    def record(self, trace: RequestTrace):
+        """Add trace of the finished request attempt to metrics of its route and pass it to callbacks"""
+        metrics = self._routes.get(trace.route)
+        if metrics is None:
+            metrics = self._routes[trace.route] = RouteMetrics(trace.route)
+
+        metrics.add(trace)
+
+        for callback in self._callbacks:
+            try:
+                callback(trace)
+            except Exception as error:
+                warnings.warn(f'Metrics callback {callback!r} failed: {error!r}', RuntimeWarning)
+
+    def reset(self):
+        self._routes.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {route: metrics.to_dict() for route, metrics in self._routes.items()}
+
+    @staticmethod
+    def _create_trace_config() -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+
+        def on_phase(phase: str, start: bool):
+            async def callback(_: aiohttp.ClientSession, context: SimpleNamespace, __: Any):
+                trace = context.trace_request_ctx
+                if not isinstance(trace, RequestTrace):
+                    return
+
+                if start:
+                    trace.start_phase(phase)
+                else:
+                    trace.end_phase(phase)
+
+            return callback
+
+        async def on_request_chunk_sent(_: aiohttp.ClientSession, context: SimpleNamespace, params: Any):
+            trace = context.trace_request_ctx
+            if isinstance(trace, RequestTrace):
+                trace.bytes_sent += len(params.chunk)
+
+        trace_config.on_connection_queued_start.append(on_phase('pool', True))
+        trace_config.on_connection_queued_end.append(on_phase('pool', False))
+        trace_config.on_connection_create_start.append(on_phase('connect', True))
+        trace_config.on_connection_create_end.append(on_phase('connect', False))
+        trace_config.on_dns_resolvehost_start.append(on_phase('dns', True))
+        trace_config.on_dns_resolvehost_end.append(on_phase('dns', False))
+        trace_config.on_request_chunk_sent.append(on_request_chunk_sent)
+        trace_config.freeze()
+
+        return trace_config
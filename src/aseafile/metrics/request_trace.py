@@ -0,0 +1,99 @@
+import time
+from typing import Dict
+
+
+class RequestTrace:
+    """Measurements of one attempt of a request
+
+    Phases of latency in seconds:
+    pool - waiting for a free connection of the pool,
+    dns - resolving host of a new connection,
+    connect - opening a new connection (without dns),
+    ttfb - from sending the request to receiving response headers (without phases above),
+    transfer - reading response body,
+    parse - processing response body after it was read,
+    total - whole attempt.
+    """
+
+    PHASES = ('pool', 'dns', 'connect', 'ttfb', 'transfer', 'parse', 'total')
+
+    __slots__ = (
+        'route', 'method', 'status', 'error', 'bytes_sent', 'bytes_received',
+        'pool', 'dns', 'connect', 'ttfb', 'transfer', 'parse', 'total',
+        '_started_at', '_headers_at', '_transferred_at', '_phase_started_at'
+    )
+
+    def __init__(self, route: str, method: str):
+        self.route = route
+        self.method = method
+        self.status: int | None = None
+        self.error: str | None = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.pool = 0.0
+        self.dns = 0.0
+        self.connect = 0.0
+        self.ttfb = 0.0
+        self.transfer = 0.0
+        self.parse = 0.0
+        self.total = 0.0
+        self._started_at = time.perf_counter()
+        self._headers_at: float | None = None
+        self._transferred_at: float | None = None
+        self._phase_started_at: Dict[str, float] = dict()
+
+    @property
+    def status_class(self) -> str:
+        """Class of response status (e.g. 2xx) or 'error' if no response was received"""
+        if self.status is None:
+            return 'error'
+
+        return f'{self.status // 100}xx'
+
+    @property
+    def latencies(self) -> Dict[str, float]:
+        return {phase: getattr(self, phase) for phase in self.PHASES}
+
+    def start_phase(self, phase: str):
+        self._phase_started_at[phase] = time.perf_counter()
+
+    def end_phase(self, phase: str):
+        started_at = self._phase_started_at.pop(phase, None)
+        if started_at is not None:
+            setattr(self, phase, getattr(self, phase) + time.perf_counter() - started_at)
+
+    def mark_headers(self, status: int):
+        """Mark that response headers were received"""
+        self._headers_at = time.perf_counter()
+        self.status = status
+
+    def mark_transferred(self, size: int | None = None):
+        """Mark that response body was read
+
+        :param size: number of bytes read (added to received bytes)
+        """
+        self._transferred_at = time.perf_counter()
+        if size is not None:
+            self.bytes_received += size
+
+    def mark_error(self, error: BaseException):
+        self.error = type(error).__name__
+
+    def finish(self):
+        finished_at = time.perf_counter()
+        self.total = finished_at - self._started_at
+
+        # new connection is opened with dns resolving inside
+        self.connect = max(self.connect - self.dns, 0.0)
+
+        if self._headers_at is None:
+            return
+
+        self.ttfb = max(self._headers_at - self._started_at - self.pool - self.dns - self.connect, 0.0)
+        transferred_at = self._transferred_at or finished_at
+        self.transfer = max(transferred_at - self._headers_at, 0.0)
+        self.parse = finished_at - transferred_at
+
+    def __repr__(self):
+        return f'RequestTrace(route={self.route!r}, method={self.method!r}, status={self.status!r}, ' \
+               f'total={self.total:.6f})'
@@ -0,0 +1,37 @@
+from typing import Dict, Any
+from .request_trace import RequestTrace
+from .latency_histogram import LatencyHistogram
+
+
+class RouteMetrics:
+    """Aggregated metrics of requests to one route"""
+
+    __slots__ = ('route', 'count', 'status_classes', 'bytes_sent', 'bytes_received', 'latency')
+
+    def __init__(self, route: str):
+        self.route = route
+        self.count = 0
+        self.status_classes: Dict[str, int] = dict()
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency: Dict[str, LatencyHistogram] = {phase: LatencyHistogram() for phase in RequestTrace.PHASES}
+
+    def add(self, trace: RequestTrace):
+        self.count += 1
+        status_class = trace.status_class
+        self.status_classes[status_class] = self.status_classes.get(status_class, 0) + 1
+        self.bytes_sent += trace.bytes_sent
+        self.bytes_received += trace.bytes_received
+
+        for phase, histogram in self.latency.items():
+            histogram.observe(getattr(trace, phase))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'route': self.route,
+            'count': self.count,
+            'status_classes': dict(self.status_classes),
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'latency': {phase: histogram.to_dict() for phase, histogram in self.latency.items()}
+        }
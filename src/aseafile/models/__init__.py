@@ -5,10 +5,26 @@ from .base_item import BaseItem
 from .file_item import FileItem
 from .dir_item import DirectoryItem
 from .file_item_detail import FileItemDetail
+from .file_listing_detail import FileListingDetail
 from .repo_item import RepoItem
 from .dir_item_detail import DirectoryItemDetail
 from .uploaded_file_item import UploadedFileItem
-from .upload_file import UploadFile
+from .upload_file import UploadFile, UploadPayload, UploadSource
 from .error import Error
 from .search_result_item import SearchResultItem
 from .search_result import SearchResult
+from .connection_settings import ConnectionSettings
+from .cache_settings import CacheSettings
+from .bulk_upload_result import BulkUploadItemResult, BulkUploadResult
+from .tree_snapshot import TreeSnapshot
+from .tree_diff import TreeDiff
+from .commit_item import CommitItem
+from .commit_history import CommitHistory
+from .commit_changes import CommitChanges
+from .change_event import ChangeEvent
+from .compact_listing import CompactListing
+from .batch_operation_result import BatchItemResult, BatchOperationResult
+from .copy_move_progress import CopyMoveProgress
+from .retry_policy import RetryPolicy
+from .limiter_metrics import LimiterMetrics
+from .recorded_call import RecordedCall
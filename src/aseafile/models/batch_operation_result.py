@@ -0,0 +1,45 @@
+from http import HTTPStatus
+from typing import List
+from pydantic import BaseModel
+from .error import Error
+from ..enums import BatchOperation
+
+
+class BatchItemResult(BaseModel):
+    """Model with result of the batch operation on one item"""
+
+    # Path to the item
+    path: str
+
+    # Indicates the success of the operation on the item
+    success: bool
+
+    # Http status of the batch request (None if request was not sent)
+    status: HTTPStatus | None
+
+    # List of errors
+    errors: List[Error] | None
+
+
+class BatchOperationResult(BaseModel):
+    """Model with results of the operation performed on many items by batches"""
+
+    # Performed operation
+    operation: BatchOperation
+
+    # Results of the operation on each item
+    items: List[BatchItemResult]
+
+    # Number of batch requests
+    batches: int
+
+    # Duration of the operation in seconds
+    elapsed: float
+
+    @property
+    def success(self) -> bool:
+        return all(item.success for item in self.items)
+
+    @property
+    def failed_paths(self) -> List[str]:
+        return [item.path for item in self.items if not item.success]
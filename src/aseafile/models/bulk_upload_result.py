@@ -0,0 +1,53 @@
+from http import HTTPStatus
+from typing import List
+from pydantic import BaseModel
+from .error import Error
+from .uploaded_file_item import UploadedFileItem
+
+
+class BulkUploadItemResult(BaseModel):
+    """Model with result of uploading one file of the bulk upload"""
+
+    # Destination path of file
+    path: str
+
+    # Indicates the success of the file upload
+    success: bool
+
+    # Http status of the batch request (None if request was not sent)
+    status: HTTPStatus | None
+
+    # List of errors
+    errors: List[Error] | None
+
+    # Information about uploaded file
+    content: UploadedFileItem | None
+
+
+class BulkUploadResult(BaseModel):
+    """Model with results and throughput of the bulk upload"""
+
+    # Results of each file upload
+    items: List[BulkUploadItemResult]
+
+    # Number of batches the files were grouped into
+    batches: int
+
+    # Total size of successfully uploaded files in bytes
+    uploaded_bytes: int
+
+    # Duration of upload in seconds
+    elapsed: float
+
+    @property
+    def success(self) -> bool:
+        return all(item.success for item in self.items)
+
+    @property
+    def files_per_second(self) -> float:
+        uploaded_files = sum(1 for item in self.items if item.success)
+        return uploaded_files / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.uploaded_bytes / 1024 / 1024 / self.elapsed if self.elapsed > 0 else 0.0
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class CacheSettings(BaseModel):
+    """Settings of the client-side cache"""
+
+    # Lifetime of cache entry in seconds
+    ttl: float = 300
+
+    # Maximum number of entries, the least recently used entries are evicted first
+    max_size: int = 1024
@@ -0,0 +1,22 @@
+from datetime import datetime
+from pydantic import BaseModel
+from ..enums import ChangeType
+
+
+class ChangeEvent(BaseModel):
+    """Model with information about the change of the repository item"""
+
+    # Id of commit that made the change (cursor to continue reading changes from)
+    commit_id: str
+
+    # Time of the commit
+    time: datetime
+
+    # Type of the change
+    type: ChangeType
+
+    # Path to the changed item (old path for renamed and moved items)
+    path: str
+
+    # New path to the renamed or moved item
+    new_path: str | None = None
@@ -0,0 +1,14 @@
+from typing import List, Tuple
+from pydantic import BaseModel
+
+
+class CommitChanges(BaseModel):
+    """Model with paths of items changed by the repository commit"""
+    new: List[str] = list()
+    removed: List[str] = list()
+    modified: List[str] = list()
+    renamed: List[Tuple[str, str]] = list()
+    moved: List[Tuple[str, str]] = list()
+    newdir: List[str] = list()
+    deldir: List[str] = list()
+    cmt_desc: str | None
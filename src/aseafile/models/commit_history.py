@@ -0,0 +1,9 @@
+from typing import List
+from pydantic import BaseModel
+from .commit_item import CommitItem
+
+
+class CommitHistory(BaseModel):
+    """Model with page of the repository history (newest commits first)"""
+    data: List[CommitItem]
+    more: bool = False
@@ -0,0 +1,11 @@
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class CommitItem(BaseModel):
+    """Model with information about the repository commit"""
+    commit_id: str
+    time: datetime
+    description: str
+    creator_email: str | None
+    creator_name: str | None
@@ -0,0 +1,134 @@
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, List
+from .base_item import BaseItem
+from .dir_item import DirectoryItem
+from .file_item import FileItem
+from ..enums import ItemType, ParseMode
+from ..parsers import ResponseParser
+
+
+class CompactListing(Sequence):
+    """Memory efficient directory listing that stores entries in columns
+
+    Repeated strings (permissions, modifiers, parent directories) are stored once,
+    numbers are stored in arrays. FileItem and DirectoryItem objects are built without
+    validation only when an entry is accessed, they are not kept by the listing.
+    """
+
+    # Models of entries by item type
+    ITEM_MODELS = {
+        ItemType.FILE: FileItem,
+        ItemType.DIRECTORY: DirectoryItem
+    }
+
+    # Columns with values repeated across entries
+    INTERNED_COLUMNS = ('permission', 'modifier_name', 'modifier_email', 'modifier_contact_email', 'parent_dir')
+
+    # Columns with integer values
+    INTEGER_COLUMNS = ('mtime', 'size')
+
+    # Columns with unique or singleton values
+    PLAIN_COLUMNS = ('id', 'name', 'starred')
+
+    _item_types = tuple(ITEM_MODELS)
+    _parser = ResponseParser(ParseMode.CONSTRUCT)
+
+    def __init__(self, items: Iterable[Dict[str, Any]] = ()):
+        self._types = array('b')
+        self._columns: Dict[str, List[Any] | array] = dict()
+        self._strings: Dict[str, str] = dict()
+
+        for name in self.PLAIN_COLUMNS + self.INTERNED_COLUMNS:
+            self._columns[name] = list()
+        for name in self.INTEGER_COLUMNS:
+            self._columns[name] = array('q')
+
+        for item in items:
+            self.append(item)
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: Any) -> 'CompactListing':
+        if isinstance(value, cls):
+            return value
+        if not isinstance(value, list):
+            raise TypeError('Listing should be a list of items')
+
+        return cls(value)
+
+    def append(self, item: Dict[str, Any] | BaseItem):
+        """Add entry to the end of listing
+
+        :param item: decoded json of the item or the model
+        """
+        if isinstance(item, BaseItem):
+            item = item.dict()
+
+        self._types.append(self._get_type_code(item['type']))
+
+        for name in self.PLAIN_COLUMNS:
+            self._columns[name].append(item.get(name))
+        for name in self.INTERNED_COLUMNS:
+            self._columns[name].append(self._intern(item.get(name)))
+        for name in self.INTEGER_COLUMNS:
+            self._columns[name].append(item.get(name) or 0)
+
+    def column(self, name: str) -> Sequence:
+        """Get values of the field of all entries without building models
+
+        :param name: name of the field
+        :returns: sequence of values (0 or None for entries without the field)
+        """
+        if name == 'type':
+            return [self._item_types[code] for code in self._types]
+
+        return self._columns[name]
+
+    def get_type(self, index: int) -> ItemType:
+        """Get type of the entry without building its model"""
+        return self._item_types[self._types[index]]
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def __getitem__(self, index: int | slice) -> BaseItem | List[BaseItem]:
+        if isinstance(index, slice):
+            return [self._build(position) for position in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Listing index out of range')
+
+        return self._build(index)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(entries={len(self)})'
+
+    def _build(self, index: int) -> BaseItem:
+        item_type = self.get_type(index)
+        model = self.ITEM_MODELS[item_type]
+
+        values = {
+            name: item_type if name == 'type' else self._columns[name][index]
+            for name in model.__fields__
+            if name == 'type' or name in self._columns
+        }
+
+        return self._parser.construct(model, values)
+
+    def _get_type_code(self, item_type: str) -> int:
+        try:
+            return self._item_types.index(ItemType(item_type))
+        except ValueError:
+            raise ValueError(f'Unknown item type: {item_type}')
+
+    def _intern(self, value: Any) -> Any:
+        if not isinstance(value, str):
+            return value
+
+        return self._strings.setdefault(value, value)
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+
+
+class ConnectionSettings(BaseModel):
+    """Settings of the connection pool shared by all requests of the http client"""
+
+    # Total number of simultaneously opened connections (0 - unlimited)
+    limit: int = 100
+
+    # Number of simultaneously opened connections to the same host (0 - unlimited)
+    limit_per_host: int = 0
+
+    # Time in seconds to keep idle connections alive (0 - close connection after each request)
+    keepalive_timeout: float = 15
+
+    # Time in seconds to cache resolved DNS records (None - cache forever)
+    ttl_dns_cache: int | None = 10
+
+    # Number of connections opened to the seafile service beforehand (0 - no warm-up)
+    warmup_connections: int = 0
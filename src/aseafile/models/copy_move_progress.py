@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+
+class CopyMoveProgress(BaseModel):
+    """Model with progress of the asynchronous copy or move task"""
+    done: int
+    total: int
+    canceled: bool
+    failed: bool
+    failed_reason: str | None
+    successful: bool
+
+    @property
+    def finished(self) -> bool:
+        return self.successful or self.failed or self.canceled
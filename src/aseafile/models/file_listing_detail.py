@@ -0,0 +1,13 @@
+from datetime import datetime
+from .base_item import BaseItem
+
+
+class FileListingDetail(BaseItem):
+    """Model with detail information about the seafile file that is available in listing of its directory
+    (fields of FileItemDetail except drafts, editing and comments)"""
+    size: int
+    starred: bool
+    last_modified: datetime
+    last_modifier_name: str
+    last_modifier_email: str
+    last_modifier_contact_email: str
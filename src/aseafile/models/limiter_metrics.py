@@ -0,0 +1,26 @@
+from pydantic import BaseModel
+
+
+class LimiterMetrics(BaseModel):
+    """Model with state of the adaptive concurrency limiter"""
+
+    # Current number of requests allowed to be sent at the same time
+    limit: int
+
+    # Number of requests being sent
+    in_flight: int
+
+    # Number of requests waiting for a free slot
+    queue_depth: int
+
+    # Long-term average latency of requests in seconds (None - no requests were sent yet)
+    baseline_latency: float | None
+
+    # Recent average latency of requests in seconds (None - no requests were sent yet)
+    recent_latency: float | None
+
+    # Number of requests measured to adjust the limit
+    samples: int
+
+    # Number of requests failed by overload (connection errors and overload statuses)
+    drops: int
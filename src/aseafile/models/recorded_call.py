@@ -0,0 +1,24 @@
+from typing import Dict, Any
+from pydantic import BaseModel
+
+
+class RecordedCall(BaseModel):
+    """Model with information about the recorded call of the http client method"""
+
+    # Time of the call in seconds since the start of recording
+    offset: float
+
+    # Name of the http client method
+    method: str
+
+    # Arguments of the call (repository ids and paths may be anonymized, payloads are replaced by their sizes)
+    arguments: Dict[str, Any]
+
+    # Duration of the call in seconds
+    duration: float
+
+    # Http status of the result (None if the call raised an exception)
+    status: int | None
+
+    # Size of the result content (number of bytes or entries, None if the result has no content)
+    size: int | None
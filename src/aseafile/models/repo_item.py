@@ -5,3 +5,4 @@ class RepoItem(BaseItem):
     """Model with information about the seafile repository"""
     size: int
     owner: str
+    head_commit_id: str | None
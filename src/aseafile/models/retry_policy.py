@@ -0,0 +1,52 @@
+import random
+from http import HTTPStatus
+from typing import Set
+from pydantic import BaseModel
+from ..enums import HttpMethod
+
+
+class RetryPolicy(BaseModel):
+    """Policy of repeating requests failed by transient errors (connection errors and retryable statuses)"""
+
+    # Maximum number of repeated attempts of one request (0 - requests are not repeated)
+    max_retries: int = 3
+
+    # Delay before the first retry in seconds, it is doubled with every next retry
+    backoff_base: float = 0.5
+
+    # Maximum delay between attempts in seconds
+    backoff_max: float = 30
+
+    # Maximum time of all attempts of one retryable request in seconds (None - unlimited, every attempt
+    # is limited only by the timeout of the session), when it is set every attempt is limited by the rest
+    # of it (for downloads - waiting for connection and data)
+    max_total_time: float | None = None
+
+    # Statuses of responses that are considered transient
+    retry_statuses: Set[HTTPStatus] = {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT
+    }
+
+    # Methods that are safe to repeat
+    idempotent_methods: Set[HttpMethod] = {
+        HttpMethod.GET,
+        HttpMethod.HEAD,
+        HttpMethod.PUT,
+        HttpMethod.DELETE
+    }
+
+    # Indicates whether non-idempotent requests (e.g. POST) are repeated too
+    retry_non_idempotent: bool = False
+
+    # Indicates whether delay requested by server in Retry-After header is respected
+    respect_retry_after: bool = True
+
+    def is_retryable_method(self, method: HttpMethod | str) -> bool:
+        return self.retry_non_idempotent or HttpMethod(method.lower()) in self.idempotent_methods
+
+    def get_delay(self, retry: int) -> float:
+        """Get jittered delay before the retry (retries are counted from 1)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (retry - 1)))
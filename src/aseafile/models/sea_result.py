@@ -1,14 +1,33 @@
+import json
+import copy
+from dataclasses import dataclass
 from .error import Error
-from typing import List, TypeVar, Generic
-from pydantic.generics import GenericModel
+from typing import Any, Dict, List, TypeVar, Generic
 from http import HTTPStatus
+from pydantic import BaseModel, ValidationError
+from pydantic.json import pydantic_encoder
 
 # Type of method execution result
 ContentT = TypeVar('ContentT')
 
 
-class SeaResult(GenericModel, Generic[ContentT]):
-    """Model for providing information about the result of executing an APi method"""
+class _SeaResultFields(BaseModel):
+    """Validator of fields of SeaResult parsed from objects"""
+    success: bool
+    status: HTTPStatus
+    errors: List[Error] | None = None
+    content: Any = None
+    retries: int = 0
+
+
+@dataclass(slots=True)
+class SeaResult(Generic[ContentT]):
+    """Model for providing information about the result of executing an APi method
+
+    Creating a result neither validates nor copies the content. Methods of pydantic models
+    (dict, json, copy, parse_obj) are kept and the result can be a field of pydantic models,
+    where the content is validated by the parameter of the field type (e.g. SeaResult[FileItem]).
+    """
 
     # Indicates the success of the method execution
     success: bool
@@ -17,10 +36,96 @@ class SeaResult(GenericModel, Generic[ContentT]):
     status: HTTPStatus
 
     # List of errors
-    errors: List[Error] | None
+    errors: List[Error] | None = None
 
     # Result of method execution
-    content: ContentT | None
+    content: ContentT | None = None
+
+    # Number of repeated attempts of the request
+    retries: int = 0
+
+    @classmethod
+    def from_result(cls, result: 'SeaResult', content: Any | None = None) -> 'SeaResult':
+        """Create result with success, status, errors and retries of another result and new content
+
+        :param result: result to take success, status, errors and retries from
+        :param content: content of new result (it is neither validated nor copied)
+        """
+        return cls(result.success, result.status, result.errors, content, result.retries)
+
+    @classmethod
+    def parse_obj(cls, obj: Any) -> 'SeaResult':
+        """Create result from dict with its fields (the content is kept as is)
+
+        :param obj: dict with fields of result
+        :raises ValidationError: if fields are invalid
+        """
+        return cls(**_SeaResultFields.parse_obj(obj).__dict__)
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: Any, field=None) -> 'SeaResult':
+        """Validate value of a field of pydantic model, the content is validated by the parameter of the field type"""
+        result = value if isinstance(value, SeaResult) else cls.parse_obj(value)
+
+        if field is not None and field.sub_fields and result.content is not None:
+            content, errors = field.sub_fields[0].validate(result.content, {}, loc='content')
+            if errors:
+                raise ValidationError([errors], _SeaResultFields)
+            result = cls.from_result(result, content)
+
+        return result
+
+    def dict(self) -> Dict[str, Any]:
+        """Get fields of result, nested models are converted to dicts"""
+        return {name: _to_dict(value) for name, value in self._get_fields().items()}
+
+    def json(self, **dumps_kwargs) -> str:
+        """Get fields of result encoded to json
+
+        :param dumps_kwargs: arguments of json.dumps
+        """
+        return json.dumps(self.dict(), default=pydantic_encoder, **dumps_kwargs)
+
+    def copy(self, *, update: Dict[str, Any] | None = None, deep: bool = False) -> 'SeaResult':
+        """Copy result
+
+        :param update: values of fields to change in the copy
+        :param deep: indicates whether fields are copied too
+        """
+        fields = self._get_fields() | (update or dict())
+        return type(self)(**(copy.deepcopy(fields) if deep else fields))
+
+    def _get_fields(self) -> Dict[str, Any]:
+        return {
+            'success': self.success,
+            'status': self.status,
+            'errors': self.errors,
+            'content': self.content,
+            'retries': self.retries
+        }
+
+    def __getstate__(self):
+        return self._get_fields()
+
+    def __setstate__(self, state: Dict[str, Any]):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+def _to_dict(value: Any) -> Any:
+    """Convert models nested in the value to dicts like BaseModel.dict does"""
+    if isinstance(value, (BaseModel, SeaResult)):
+        return value.dict()
+
+    if isinstance(value, dict):
+        return {key: _to_dict(item) for key, item in value.items()}
+
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_to_dict(item) for item in value]
+        return type(value)(*items) if hasattr(type(value), '_fields') else type(value)(items)
 
-    class Config:
-        arbitrary_types_allowed = True
+    return value
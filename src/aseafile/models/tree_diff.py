@@ -0,0 +1,26 @@
+from typing import List
+from pydantic import BaseModel
+from .tree_snapshot import TreeSnapshot
+
+
+class TreeDiff(BaseModel):
+    """Model with changes of the directory tree between two snapshots"""
+
+    # Paths of added files and directories
+    added: List[str]
+
+    # Paths of removed files and directories
+    removed: List[str]
+
+    # Paths of files whose content has changed
+    modified: List[str]
+
+    # Number of directories listed to find the changes
+    listed_directories: int
+
+    # Current snapshot of the tree to compare with next time
+    snapshot: TreeSnapshot
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
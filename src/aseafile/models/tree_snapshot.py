@@ -0,0 +1,18 @@
+from typing import Dict
+from pydantic import BaseModel
+
+
+class TreeSnapshot(BaseModel):
+    """Model with ids of all items of the directory tree, used to find changes of the tree"""
+
+    # Id of repository where the tree is located
+    repo_id: str
+
+    # Path to the top directory of the tree
+    path: str
+
+    # Ids of directories by their paths (id changes when anything beneath the directory changes)
+    directories: Dict[str, str] = dict()
+
+    # Ids of files by their paths (id changes when content of the file changes)
+    files: Dict[str, str] = dict()
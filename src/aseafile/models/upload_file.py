@@ -1,6 +1,13 @@
-from typing import TypedDict, BinaryIO
+import os
+from typing import TypedDict, BinaryIO, AsyncIterable
+
+# Contents of uploaded file: file object, bytes or async iterator over chunks of bytes
+UploadPayload = BinaryIO | bytes | AsyncIterable[bytes]
+
+# Source of file for bulk upload: path to local file (opened only when it is sent), bytes or file object
+UploadSource = str | os.PathLike | bytes | BinaryIO
 
 
 class UploadFile(TypedDict):
     filename: str
-    payload: BinaryIO
+    payload: UploadPayload
@@ -0,0 +1 @@
+from .response_parser import ResponseParser, JsonLoads
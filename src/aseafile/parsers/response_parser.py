@@ -0,0 +1,176 @@
+import json
+import types
+import typing
+from enum import Enum
+from inspect import isclass
+from pydantic import BaseModel, parse_obj_as
+from typing import Any, Callable, Dict, Type, TypeVar
+from ..enums import ParseMode
+
+T = TypeVar('T')
+
+# Function decoding json document (e.g. json.loads or orjson.loads)
+JsonLoads = Callable[[str | bytes], Any]
+
+# Function building result object from decoded json
+Builder = Callable[[Any], Any]
+
+
+class ResponseParser:
+    """Parser of response content that turns json into result objects according to the parse mode
+
+    In construct mode models are built with BaseModel.construct: nested models and enums are built,
+    other values (e.g. datetime strings) are left as they were decoded from json.
+    """
+
+    def __init__(self, mode: ParseMode = ParseMode.VALIDATE, json_loads: JsonLoads | None = None):
+        self._mode = mode
+        self._json_loads = json_loads or json.loads
+        self._builders: Dict[Any, Builder] = dict()
+
+    @property
+    def mode(self) -> ParseMode:
+        return self._mode
+
+    @property
+    def json_loads(self) -> JsonLoads:
+        return self._json_loads
+
+    def parse(self, content_type: Type[T], content: str | bytes) -> T:
+        """Decode json content and turn it into object of content_type
+
+        :param content_type: type of result object
+        :param content: json document
+        :returns: object of content_type (decoded json in raw mode)
+        """
+        return self.parse_obj(content_type, self._json_loads(content))
+
+    def parse_obj(self, content_type: Type[T], obj: Any) -> T:
+        """Turn decoded json into object of content_type
+
+        :param content_type: type of result object
+        :param obj: decoded json
+        :returns: object of content_type (obj itself in raw mode)
+        """
+        if self._mode == ParseMode.RAW:
+            return obj
+        if self._mode == ParseMode.CONSTRUCT:
+            return self.construct(content_type, obj)
+
+        return parse_obj_as(content_type, obj)
+
+    def construct(self, content_type: Type[T], obj: Any) -> T:
+        """Build object of content_type from decoded json without validation
+
+        :param content_type: type of result object
+        :param obj: decoded json
+        :returns: object of content_type
+        """
+        builder = self._get_builder(content_type)
+        return builder(obj) if builder is not None else obj
+
+    def _get_builder(self, content_type: Any) -> Builder | None:
+        """Get cached function building objects of the type (None if decoded json is used as is)"""
+        try:
+            return self._builders[content_type]
+        except KeyError:
+            pass
+
+        # placeholder for recursive models
+        self._builders[content_type] = lambda obj: self._builders[content_type](obj)
+        builder = self._create_builder(content_type)
+        self._builders[content_type] = builder
+
+        return builder
+
+    def _create_builder(self, content_type: Any) -> Builder | None:
+        origin = typing.get_origin(content_type)
+        args = typing.get_args(content_type)
+
+        if origin in (list, set, frozenset):
+            item_builder = self._get_builder(args[0]) if args else None
+            if item_builder is None:
+                return None if origin is list else origin
+            return lambda obj: origin(item_builder(item) for item in obj)
+
+        if origin is tuple:
+            item_builders = [self._get_builder(arg) for arg in args if arg is not Ellipsis]
+            if not any(item_builders):
+                return tuple
+            if len(args) == 2 and args[1] is Ellipsis:
+                return lambda obj: tuple(item_builders[0](item) for item in obj)
+            return lambda obj: tuple(
+                builder(item) if builder is not None else item for builder, item in zip(item_builders, obj))
+
+        if origin is dict:
+            value_builder = self._get_builder(args[1]) if args else None
+            if value_builder is None:
+                return None
+            return lambda obj: {key: value_builder(value) for key, value in obj.items()}
+
+        if origin in (typing.Union, types.UnionType):
+            builders = [self._get_builder(arg) for arg in args if arg is not type(None)]
+            if len(builders) != 1 or builders[0] is None:
+                return None
+            return self._skip_none(builders[0])
+
+        if not isclass(content_type):
+            return None
+
+        if issubclass(content_type, Enum):
+            return self._create_enum_builder(content_type)
+
+        if issubclass(content_type, BaseModel):
+            return self._create_model_builder(content_type)
+
+        return None
+
+    def _create_model_builder(self, model_type: Type[BaseModel]) -> Builder:
+        fields = [
+            (name, field.alias, self._get_builder(field.annotation))
+            for name, field in model_type.__fields__.items()
+        ]
+        optional_fields = [(name, field) for name, field in model_type.__fields__.items() if not field.required]
+        has_private_attributes = bool(model_type.__private_attributes__)
+
+        def build(obj: Dict[str, Any]):
+            if isinstance(obj, model_type):
+                return obj
+
+            values = {
+                name: obj[alias] if builder is None or obj[alias] is None else builder(obj[alias])
+                for name, alias, builder in fields
+                if alias in obj
+            }
+
+            fields_set = set(values)
+            for name, field in optional_fields:
+                if name not in fields_set:
+                    values[name] = field.get_default()
+
+            # same as BaseModel.construct without its per call overhead
+            model = model_type.__new__(model_type)
+            object.__setattr__(model, '__dict__', values)
+            object.__setattr__(model, '__fields_set__', fields_set)
+            if has_private_attributes:
+                model._init_private_attributes()
+
+            return model
+
+        return build
+
+    @staticmethod
+    def _create_enum_builder(enum_type: Type[Enum]) -> Builder:
+        members = enum_type._value2member_map_
+
+        def build(value: Any):
+            try:
+                return members[value]
+            except (KeyError, TypeError):
+                return enum_type(value)
+
+        return build
+
+    @staticmethod
+    def _skip_none(builder: Builder) -> Builder:
+        return lambda obj: builder(obj) if obj is not None else None
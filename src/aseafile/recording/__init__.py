@@ -0,0 +1 @@
+from .traffic_recorder import TrafficRecorder
@@ -0,0 +1,200 @@
+import io
+import gzip
+import json
+import time
+import hashlib
+import inspect
+import functools
+from contextvars import ContextVar
+from collections.abc import Sized
+from typing import List, Dict, Any, Iterable, Callable
+from ..models import RecordedCall, SeaResult
+
+
+class TrafficRecorder:
+    """Recorder of calls of http client methods into a compact trace file
+
+    Recorded calls keep their order, start offsets, durations, statuses and sizes of results,
+    so the trace can be replayed to reproduce the load pattern (see benchmarks/replay.py).
+
+    Usage:
+
+        recorder = TrafficRecorder()
+        recorder.attach(client)
+        ...
+        recorder.detach(client)
+        recorder.save('session.trace.gz')
+    """
+
+    # Methods of the http client that are recorded
+    RECORDED_METHODS = (
+        'ping',
+        'auth_ping',
+        'get_repos',
+        'get_items',
+        'get_files',
+        'get_directories',
+        'get_directory_detail',
+        'get_file_detail',
+        'get_download_link',
+        'download',
+        'get_upload_link',
+        'upload',
+        'search_file'
+    )
+
+    # Arguments that are replaced by their hashes when anonymization is enabled
+    ANONYMIZED_ARGUMENTS = ('repo_id', 'path', 'filepath', 'dir_path', 'filename', 'relative_path', 'query')
+
+    # Arguments that are never recorded
+    SKIPPED_ARGUMENTS = ('self', 'token')
+
+    TRACE_VERSION = 1
+
+    def __init__(self, anonymize: bool = True):
+        """
+        :param anonymize: replace repository ids, paths and names by hashes keeping repeated values equal
+        """
+        self._anonymize = anonymize
+        self._calls: List[RecordedCall] = list()
+        self._started_at: float | None = None
+        self._inside_call: ContextVar[bool] = ContextVar('inside_recorded_call', default=False)
+
+    @property
+    def calls(self) -> List[RecordedCall]:
+        return self._calls
+
+    def attach(self, client: Any):
+        """Start recording calls of the client methods
+
+        :param client: http client (SeafileHttpClient) whose calls are recorded
+        """
+        if self._started_at is None:
+            self._started_at = time.monotonic()
+
+        for name in self.RECORDED_METHODS:
+            method = getattr(type(client), name)
+            setattr(client, name, self._wrap(name, method.__get__(client), inspect.signature(method)))
+
+    def detach(self, client: Any):
+        """Stop recording calls of the client methods"""
+        for name in self.RECORDED_METHODS:
+            client.__dict__.pop(name, None)
+
+    def clear(self):
+        self._calls.clear()
+        self._started_at = None
+
+    def save(self, path: str):
+        """Save recorded calls into trace file (compressed if the path ends with .gz)
+
+        :param path: path to trace file
+        """
+        with self._open(path, 'wt') as file:
+            file.write(json.dumps({'version': self.TRACE_VERSION, 'calls': len(self._calls)}) + '\n')
+            for call in self._calls:
+                file.write(json.dumps(
+                    [round(call.offset, 6), call.method, call.arguments, round(call.duration, 6), call.status, call.size],
+                    separators=(',', ':')
+                ) + '\n')
+
+    @classmethod
+    def load(cls, path: str) -> List[RecordedCall]:
+        """Load recorded calls from trace file
+
+        :param path: path to trace file
+        """
+        with cls._open(path, 'rt') as file:
+            header = json.loads(file.readline())
+            if header.get('version') != cls.TRACE_VERSION:
+                raise ValueError(f'Unsupported version of trace file: {header.get("version")}')
+
+            return [
+                RecordedCall(offset=offset, method=method, arguments=arguments, duration=duration, status=status, size=size)
+                for offset, method, arguments, duration, status, size in map(json.loads, cls._iter_lines(file))
+            ]
+
+    def _wrap(self, name: str, method: Callable, signature: inspect.Signature) -> Callable:
+        @functools.wraps(method)
+        async def wrapper(*args, **kwargs):
+            # calls made inside a recorded call are a part of it
+            if self._inside_call.get():
+                return await method(*args, **kwargs)
+
+            arguments = self._get_arguments(signature, args, kwargs)
+            started_at = time.monotonic()
+            context_token = self._inside_call.set(True)
+            status = size = None
+
+            try:
+                result = await method(*args, **kwargs)
+                if isinstance(result, SeaResult):
+                    status = int(result.status)
+                    size = self._get_size(result.content)
+                return result
+            finally:
+                self._inside_call.reset(context_token)
+                self._calls.append(RecordedCall(
+                    offset=started_at - self._started_at,
+                    method=name,
+                    arguments=arguments,
+                    duration=time.monotonic() - started_at,
+                    status=status,
+                    size=size
+                ))
+
+        return wrapper
+
+    def _get_arguments(self, signature: inspect.Signature, args: tuple, kwargs: dict) -> Dict[str, Any]:
+        bound = signature.bind(None, *args, **kwargs)
+        arguments = dict()
+
+        for name, value in bound.arguments.items():
+            if name in self.SKIPPED_ARGUMENTS:
+                continue
+
+            if name == 'payload':
+                arguments[name] = self._get_size(value)
+            elif self._anonymize and name in self.ANONYMIZED_ARGUMENTS and isinstance(value, str):
+                arguments[name] = self._anonymize_value(name, value)
+            elif value is None or isinstance(value, (bool, int, float, str)):
+                arguments[name] = value
+            else:
+                arguments[name] = str(value)
+
+        return arguments
+
+    @staticmethod
+    def _anonymize_value(name: str, value: str) -> str:
+        def hash_part(part: str) -> str:
+            return hashlib.blake2s(part.encode(), digest_size=4).hexdigest() if part else part
+
+        if name in ('repo_id', 'query'):
+            return hash_part(value)
+
+        # every part of path is hashed separately to keep the structure of directories
+        return '/'.join(hash_part(part) for part in value.split('/'))
+
+    @staticmethod
+    def _get_size(content: Any) -> int | None:
+        if isinstance(content, Sized):
+            return len(content)
+
+        if isinstance(content, io.IOBase) and content.seekable():
+            position = content.tell()
+            size = content.seek(0, io.SEEK_END) - position
+            content.seek(position)
+            return size
+
+        return None
+
+    @staticmethod
+    def _open(path: str, mode: str):
+        if path.endswith('.gz'):
+            return gzip.open(path, mode, encoding='utf-8')
+
+        return open(path, mode, encoding='utf-8')
+
+    @staticmethod
+    def _iter_lines(file) -> Iterable[str]:
+        return (line for line in file if line.strip())
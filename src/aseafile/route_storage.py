@@ -1,3 +1,8 @@
+import re
+from typing import List, Tuple
+from urllib.parse import urlsplit
+
+
 class RouteStorage:
     """Route storage for storing, processing and giving routes of seafile web api"""
 
@@ -13,10 +18,57 @@ class RouteStorage:
     SMART_LINK_ROUTE = 'smart-link/'
     GET_UPLOAD_LINK_ROUTE = 'repos/{repo_id}/upload-link/'
     SEARCH_ROUTE = 'search-file/'
+    FILE_UPLOADED_BYTES_ROUTE = 'repos/{repo_id}/file-uploaded-bytes/'
+    REPO_HISTORY_ROUTE = 'repos/{repo_id}/history/'
+    REPO_HISTORY_CHANGES_ROUTE = 'repo_history_changes/{repo_id}/'
+    SYNC_BATCH_COPY_ITEM_ROUTE = 'repos/sync-batch-copy-item/'
+    SYNC_BATCH_MOVE_ITEM_ROUTE = 'repos/sync-batch-move-item/'
+    BATCH_DELETE_ITEM_ROUTE = 'repos/batch-delete-item/'
+    ASYNC_BATCH_COPY_ITEM_ROUTE = 'repos/async-batch-copy-item/'
+    ASYNC_BATCH_MOVE_ITEM_ROUTE = 'repos/async-batch-move-item/'
+    QUERY_COPY_MOVE_PROGRESS_ROUTE = 'query-copy-move-progress/'
+    COPY_MOVE_TASK_ROUTE = 'copy-move-task/'
+
+    # Names of routes with repository id (other routes are named by properties of the storage)
+    PARAMETRIZED_ROUTE_NAMES = (
+        'repo', 'file', 'file_detail', 'dir', 'dir_detail', 'get_upload_link',
+        'file_uploaded_bytes', 'repo_history', 'repo_history_changes'
+    )
 
     def __init__(self, version: str = 'v2.1', suffix: str | None = None):
         self._version = version
         self._suffix = suffix or self.DEFAULT_SUFFIX
+        self._route_patterns: List[Tuple[str, re.Pattern]] | None = None
+
+    def get_route_name(self, url: str) -> str | None:
+        """Get name of the route (e.g. 'dir' or 'repos') the url belongs to
+
+        :param url: absolute url or path of the request (query string is ignored)
+        :return: name of the route or None if the url does not belong to any route
+        """
+        if self._route_patterns is None:
+            self._route_patterns = self._create_route_patterns()
+
+        path = urlsplit(url).path
+        for name, pattern in self._route_patterns:
+            if pattern.search(path):
+                return name
+
+        return None
+
+    def _create_route_patterns(self) -> List[Tuple[str, re.Pattern]]:
+        routes = [
+            (name, getattr(self, name))
+            for name, value in vars(type(self)).items()
+            if isinstance(value, property)
+        ]
+        routes += [(name, getattr(self, name)('{repo_id}')) for name in self.PARAMETRIZED_ROUTE_NAMES]
+
+        # routes without parameters are matched first, e.g. 'repos/sync-batch-copy-item/' before 'repos/{repo_id}/'
+        return [
+            (name, re.compile('(?:^|/)' + re.escape(route).replace(re.escape('{repo_id}'), '[^/]+') + '$'))
+            for name, route in sorted(routes, key=lambda item: '{repo_id}' in item[1])
+        ]
 
     @property
     def ping(self):
@@ -46,6 +98,34 @@ class RouteStorage:
     def search_file(self):
         return 'api/' + self._version + '/' + self.SEARCH_ROUTE
 
+    @property
+    def sync_batch_copy_item(self):
+        return 'api/' + self._version + '/' + self.SYNC_BATCH_COPY_ITEM_ROUTE
+
+    @property
+    def sync_batch_move_item(self):
+        return 'api/' + self._version + '/' + self.SYNC_BATCH_MOVE_ITEM_ROUTE
+
+    @property
+    def batch_delete_item(self):
+        return 'api/' + self._version + '/' + self.BATCH_DELETE_ITEM_ROUTE
+
+    @property
+    def async_batch_copy_item(self):
+        return 'api/' + self._version + '/' + self.ASYNC_BATCH_COPY_ITEM_ROUTE
+
+    @property
+    def async_batch_move_item(self):
+        return 'api/' + self._version + '/' + self.ASYNC_BATCH_MOVE_ITEM_ROUTE
+
+    @property
+    def query_copy_move_progress(self):
+        return 'api/' + self._version + '/' + self.QUERY_COPY_MOVE_PROGRESS_ROUTE
+
+    @property
+    def copy_move_task(self):
+        return 'api/' + self._version + '/' + self.COPY_MOVE_TASK_ROUTE
+
     def repo(self, repo_id: str):
         return self._suffix + self.REPO_ROUTE + repo_id + '/'
 
@@ -63,3 +143,12 @@ class RouteStorage:
 
     def get_upload_link(self, repo_id: str):
         return self._suffix + self.GET_UPLOAD_LINK_ROUTE.format(repo_id=repo_id)
+
+    def file_uploaded_bytes(self, repo_id: str):
+        return 'api/' + self._version + '/' + self.FILE_UPLOADED_BYTES_ROUTE.format(repo_id=repo_id)
+
+    def repo_history(self, repo_id: str):
+        return 'api/' + self._version + '/' + self.REPO_HISTORY_ROUTE.format(repo_id=repo_id)
+
+    def repo_history_changes(self, repo_id: str):
+        return self._suffix + self.REPO_HISTORY_CHANGES_ROUTE.format(repo_id=repo_id)
@@ -0,0 +1 @@
+from .copy_move_task import CopyMoveTask
@@ -0,0 +1,105 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Generator
+from ..enums import BatchOperation
+from ..models import SeaResult, CopyMoveProgress
+
+
+class CopyMoveTask:
+    """Handle of the copy or move task executed by seafile server in background
+
+    The task can be polled for progress, cancelled or awaited until it is finished
+    (awaiting the task is the same as calling wait with default arguments).
+    """
+
+    def __init__(
+            self,
+            task_id: str,
+            operation: BatchOperation,
+            get_progress: Callable[[str], Awaitable[SeaResult[CopyMoveProgress]]],
+            cancel: Callable[[str], Awaitable[SeaResult]],
+            on_finish: Callable[[], Awaitable[None]] | None = None,
+            poll_interval: float = 1.0):
+        """
+        :param task_id: id of the task
+        :param operation: operation performed by the task (copy or move)
+        :param get_progress: function requesting progress of the task by its id
+        :param cancel: function cancelling the task by its id
+        :param on_finish: function called once when the task is found to be finished
+        :param poll_interval: default delay between requests of progress in seconds
+        """
+        self._task_id = task_id
+        self._operation = operation
+        self._get_progress = get_progress
+        self._cancel = cancel
+        self._on_finish = on_finish
+        self._poll_interval = poll_interval
+        self._progress: CopyMoveProgress | None = None
+
+    @property
+    def task_id(self) -> str:
+        return self._task_id
+
+    @property
+    def operation(self) -> BatchOperation:
+        return self._operation
+
+    @property
+    def progress(self) -> CopyMoveProgress | None:
+        """Progress received by the last poll (None if the task was not polled yet)"""
+        return self._progress
+
+    @property
+    def finished(self) -> bool:
+        return self._progress is not None and self._progress.finished
+
+    async def poll(self) -> SeaResult[CopyMoveProgress]:
+        """Request current progress of the task
+
+        :returns: SeaResult object with CopyMoveProgress
+        """
+        result = await self._get_progress(self._task_id)
+
+        if result.success and result.content is not None:
+            was_finished = self.finished
+            self._progress = result.content
+
+            if self.finished and not was_finished and self._on_finish is not None:
+                await self._on_finish()
+
+        return result
+
+    async def wait(self, timeout: float | None = None, poll_interval: float | None = None):
+        """Poll the task until it is finished
+
+        :param timeout: maximum time of waiting in seconds (None - unlimited)
+        :param poll_interval: delay between requests of progress in seconds
+        :returns: SeaResult object with the last CopyMoveProgress (unsuccessful if progress can not be requested)
+        :raises asyncio.TimeoutError: if the task is not finished in time
+        """
+        poll_interval = poll_interval if poll_interval is not None else self._poll_interval
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        while True:
+            result = await self.poll()
+
+            if not result.success or self.finished:
+                return result
+
+            if deadline is not None and time.monotonic() + poll_interval > deadline:
+                raise asyncio.TimeoutError(f'Task {self._task_id} is not finished in {timeout} seconds')
+
+            await asyncio.sleep(poll_interval)
+
+    async def cancel(self) -> SeaResult:
+        """Cancel the task
+
+        :returns: SeaResult object of cancellation request
+        """
+        return await self._cancel(self._task_id)
+
+    def __await__(self) -> Generator:
+        return self.wait().__await__()
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(task_id={self._task_id!r}, operation={self._operation.value!r})'
@@ -0,0 +1,36 @@
+import os
+import asyncio
+import pytest
+from assertpy import assert_that
+from src.aseafile import SeafileHttpClient, AdaptiveLimiter
+from benchmarks.standin_server import SeafileStandIn, StandInSettings
+
+REPO_ID = SeafileStandIn.REPO_ID
+SETTINGS = StandInSettings(generate=False)
+CONTENT = os.urandom(100 * 1024)
+
+
+class TestAdaptiveLimiter:
+
+    @pytest.mark.asyncio
+    async def test_request_while_download_is_streamed(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            server.files['/file.bin'] = CONTENT
+            limiter = AdaptiveLimiter(initial_limit=1, min_limit=1, max_limit=1)
+            client = SeafileHttpClient(server.url, concurrency_limiter=limiter)
+            await client.authorize('user@example.com', 'password')
+            chunks, details, in_flight = list(), list(), list()
+
+            # Act
+            async for chunk in client.iter_download(REPO_ID, '/file.bin', chunk_size=16 * 1024):
+                chunks.append(chunk)
+                in_flight.append(limiter.in_flight)
+                details.append(await asyncio.wait_for(client.get_file_detail(REPO_ID, '/file.bin'), timeout=5))
+            await client.aclose()
+
+        # Assert
+        assert_that(b''.join(chunks)).is_equal_to(CONTENT)
+        assert_that(details).extracting('success').contains_only(True)
+        assert_that(in_flight).contains_only(0)
+        assert_that(limiter.in_flight).is_equal_to(0)
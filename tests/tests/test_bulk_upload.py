@@ -0,0 +1,85 @@
+import asyncio
+import pytest
+from assertpy import assert_that
+from src.aseafile import SeafileHttpClient
+from benchmarks.standin_server import SeafileStandIn, StandInSettings
+
+REPO_ID = SeafileStandIn.REPO_ID
+SETTINGS = StandInSettings(generate=False)
+
+
+async def create_client(server: SeafileStandIn) -> SeafileHttpClient:
+    client = SeafileHttpClient(server.url)
+    await client.authorize('user@example.com', 'password')
+    return client
+
+
+class TestBulkUpload:
+
+    @pytest.mark.asyncio
+    async def test_bulk_upload_of_many_directories(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            client = await create_client(server)
+            uploads_before_end = None
+
+            async def files():
+                nonlocal uploads_before_end
+                for index in range(20):
+                    yield f'/dir{index}/file.txt', f'file {index}'.encode()
+                    await asyncio.sleep(0.01)
+                uploads_before_end = server.requests['upload']
+
+            # Act
+            result = await client.bulk_upload(REPO_ID, files(), max_batch_files=10, concurrency=2, max_pending_dirs=4)
+            await client.aclose()
+
+        # Assert
+        assert_that(uploads_before_end).is_greater_than(0)
+        assert_that(result.batches).is_equal_to(20)
+        assert_that([item.success for item in result.items]).does_not_contain(False)
+        assert_that(server.files).contains_key(*(f'/dir{index}/file.txt' for index in range(20)))
+
+    @pytest.mark.asyncio
+    async def test_bulk_upload_pending_size(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            client = await create_client(server)
+            uploads_before_end = None
+
+            async def files():
+                nonlocal uploads_before_end
+                for index in range(8):
+                    yield f'/dir{index % 2}/file{index}.bin', bytes(1024)
+                    await asyncio.sleep(0.01)
+                uploads_before_end = server.requests['upload']
+
+            # Act
+            result = await client.bulk_upload(REPO_ID, files(), max_pending_size=3 * 1024)
+            await client.aclose()
+
+        # Assert
+        assert_that(uploads_before_end).is_greater_than(0)
+        assert_that(result.uploaded_bytes).is_equal_to(8 * 1024)
+        assert_that(len(server.files)).is_equal_to(8)
+
+    @pytest.mark.asyncio
+    async def test_bulk_upload_sends_oldest_pending_batch(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            client = await create_client(server)
+            paths = ['/a/1.txt', '/b/1.txt', '/a/2.txt', '/a/3.txt', '/c/1.txt']
+
+            async def files():
+                for path in paths:
+                    yield path, b'file'
+
+            # Act
+            result = await client.bulk_upload(
+                REPO_ID, files(), max_batch_files=2, concurrency=1, max_pending_dirs=2)
+            await client.aclose()
+
+        # Assert
+        # the second batch of /a is pending later than the batch of /b, so /b is sent first
+        assert_that([item.path for item in result.items]).is_equal_to(
+            ['/a/1.txt', '/a/2.txt', '/b/1.txt', '/a/3.txt', '/c/1.txt'])
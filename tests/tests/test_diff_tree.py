@@ -0,0 +1,79 @@
+import pytest
+from http import HTTPStatus
+from assertpy import assert_that
+from src.aseafile import SeafileHttpClient
+from src.aseafile.models import SeaResult
+from benchmarks.standin_server import SeafileStandIn, StandInSettings
+
+REPO_ID = SeafileStandIn.REPO_ID
+SETTINGS = StandInSettings(generate=False)
+
+
+async def create_client(server: SeafileStandIn) -> SeafileHttpClient:
+    client = SeafileHttpClient(server.url)
+    await client.authorize('user@example.com', 'password')
+    return client
+
+
+class TestDiffTree:
+
+    @pytest.mark.asyncio
+    async def test_diff_tree(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            server.directories |= {'/dir', '/dir/sub', '/other'}
+            server.files |= {'/dir/file.txt': b'file', '/other/file.txt': b'file'}
+            client = await create_client(server)
+            first_result = await client.diff_tree(REPO_ID)
+            server.files['/dir/sub/new.txt'] = b'new'
+
+            # Act
+            second_result = await client.diff_tree(REPO_ID, previous_snapshot=first_result.content.snapshot)
+            await client.aclose()
+
+        # Assert
+        assert_that(first_result.content.added).contains('/dir/sub', '/dir/file.txt', '/other/file.txt')
+        assert_that(second_result.success).is_true()
+        assert_that(second_result.content.added).is_equal_to(['/dir/sub/new.txt'])
+        assert_that(second_result.content.listed_directories).is_equal_to(3)
+
+    @pytest.mark.asyncio
+    async def test_diff_tree_failed_listing(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            server.directories |= {'/dir', '/other'}
+            server.fail('dir', HTTPStatus.INTERNAL_SERVER_ERROR)
+            client = await create_client(server)
+
+            # Act
+            result = await client.diff_tree(REPO_ID)
+            await client.aclose()
+
+        # Assert
+        assert_that(result.success).is_false()
+        assert_that(result.status).is_equal_to(HTTPStatus.INTERNAL_SERVER_ERROR)
+
+    @pytest.mark.asyncio
+    async def test_diff_tree_closes_walk(self, monkeypatch):
+        # Arrange
+        client = SeafileHttpClient('http://127.0.0.1/')
+        closed = list()
+        failed_result = SeaResult[list](
+            success=False, status=HTTPStatus.INTERNAL_SERVER_ERROR, errors=None, content=None)
+
+        async def walk(repo_id, path, concurrency, on_error, token):
+            try:
+                on_error('/dir', failed_result)
+                yield '/', list(), list()
+                yield '/other', list(), list()
+            finally:
+                closed.append(path)
+
+        monkeypatch.setattr(client, 'walk', walk)
+
+        # Act
+        result = await client.diff_tree(SeafileStandIn.REPO_ID)
+
+        # Assert
+        assert_that(result.success).is_false()
+        assert_that(closed).is_equal_to(['/'])
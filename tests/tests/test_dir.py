@@ -1,7 +1,7 @@
 import pytest
 from http import HTTPStatus
 from assertpy import assert_that
-from src.aseafile.models import DirectoryItemDetail
+from src.aseafile.models import DirectoryItem, DirectoryItemDetail, CompactListing
 from tests.test_data.context import TestContext
 
 
@@ -83,6 +83,59 @@ class TestDirectoriesManagement:
         assert_that(result.content).contains_item(lambda item: item.name == dir_name)
         assert_that(result.content[0].parent_dir).is_not_none().is_not_empty()
 
+    @pytest.mark.asyncio
+    async def test_get_directories_compact(self, test_repo, authorized_http_client):
+        # Arrange
+        dir_path = self.context.typed_get('dir_path', str)
+        dir_name = self.context.typed_get('dir_name', str)
+
+        # Act
+        result = await authorized_http_client.get_directories(test_repo, dir_path, recursive=True, compact=True)
+
+        # Assert
+        assert_that(result).is_not_none()
+        assert_that(result.success).is_true()
+        assert_that(result.status).is_equal_to(HTTPStatus.OK)
+        assert_that(result.errors).is_none()
+        assert_that(result.content).is_instance_of(CompactListing)
+        assert_that(result.content.column('name')).contains(dir_name)
+        assert_that(result.content[0]).is_instance_of(DirectoryItem)
+
+    @pytest.mark.asyncio
+    async def test_walk(self, test_repo, authorized_http_client):
+        # Arrange
+        dir_path = self.context.typed_get('dir_path', str)
+        dir_name = self.context.typed_get('dir_name', str)
+
+        # Act
+        result = [item async for item in authorized_http_client.walk(test_repo, dir_path, concurrency=2)]
+
+        # Assert
+        assert_that(result).is_not_empty()
+        assert_that(result[0][0]).is_equal_to(dir_path)
+        assert_that(result[0][1]).contains_item(lambda item: item.name == dir_name)
+        assert_that(result).contains_item(lambda item: item[0] == dir_path + dir_name)
+
+    @pytest.mark.asyncio
+    async def test_diff_tree(self, test_repo, authorized_http_client):
+        # Arrange
+        dir_path = self.context.typed_get('dir_path', str)
+        dir_name = self.context.typed_get('dir_name', str)
+        first_result = await authorized_http_client.diff_tree(test_repo, dir_path)
+
+        # Act
+        result = await authorized_http_client.diff_tree(test_repo, dir_path, first_result.content.snapshot)
+
+        # Assert
+        assert_that(first_result.success).is_true()
+        assert_that(first_result.content.added).contains(dir_path + dir_name)
+        assert_that(result).is_not_none()
+        assert_that(result.success).is_true()
+        assert_that(result.status).is_equal_to(HTTPStatus.OK)
+        assert_that(result.errors).is_none()
+        assert_that(result.content.has_changes).is_false()
+        assert_that(result.content.listed_directories).is_equal_to(1)
+
     @pytest.mark.asyncio
     async def test_get_directory_detail(self, test_repo, authorized_http_client):
         # Arrange
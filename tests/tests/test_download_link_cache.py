@@ -0,0 +1,137 @@
+import os
+import pytest
+from assertpy import assert_that
+from src.aseafile import SeafileHttpClient
+from src.aseafile.models import CacheSettings
+from benchmarks.standin_server import SeafileStandIn, StandInSettings
+
+REPO_ID = SeafileStandIn.REPO_ID
+SETTINGS = StandInSettings(generate=False)
+CONTENT = os.urandom(100 * 1024)
+
+
+async def create_client(server: SeafileStandIn) -> SeafileHttpClient:
+    client = SeafileHttpClient(server.url, download_link_cache=CacheSettings())
+    await client.authorize('user@example.com', 'password')
+    return client
+
+
+class TestDownloadLinkCache:
+
+    @pytest.mark.asyncio
+    async def test_download_link_is_reused(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            server.files['/file.bin'] = CONTENT
+            client = await create_client(server)
+
+            # Act
+            first_result = await client.download(REPO_ID, '/file.bin')
+            second_result = await client.download(REPO_ID, '/file.bin')
+            await client.aclose()
+
+        # Assert
+        assert_that(first_result.content).is_equal_to(CONTENT)
+        assert_that(second_result.content).is_equal_to(CONTENT)
+        assert_that(server.requests['file']).is_equal_to(1)
+        assert_that(server.requests['download']).is_equal_to(2)
+
+    @pytest.mark.asyncio
+    async def test_download_by_expired_link(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            server.files['/file.bin'] = CONTENT
+            client = await create_client(server)
+            await client.download(REPO_ID, '/file.bin')
+            server.expire_links()
+
+            # Act
+            result = await client.download(REPO_ID, '/file.bin')
+            await client.download(REPO_ID, '/file.bin')
+            await client.aclose()
+
+        # Assert
+        assert_that(result.success).is_true()
+        assert_that(result.content).is_equal_to(CONTENT)
+        assert_that(server.requests['file']).is_equal_to(2)
+
+    @pytest.mark.asyncio
+    async def test_download_segmented_reuses_link(self, tmp_path):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            server.files['/file.bin'] = CONTENT
+            client = await create_client(server)
+
+            # Act
+            first_result = await client.download_segmented(
+                REPO_ID, '/file.bin', tmp_path / 'first.bin', segment_size=16 * 1024)
+            second_result = await client.download_segmented(
+                REPO_ID, '/file.bin', tmp_path / 'second.bin', segment_size=16 * 1024)
+            await client.aclose()
+
+        # Assert
+        assert_that(first_result.content).is_equal_to(len(CONTENT))
+        assert_that(second_result.content).is_equal_to(len(CONTENT))
+        assert_that((tmp_path / 'second.bin').read_bytes()).is_equal_to(CONTENT)
+        assert_that(server.requests['file']).is_equal_to(1)
+
+    @pytest.mark.asyncio
+    async def test_download_segmented_by_expired_link(self, tmp_path):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            server.files['/file.bin'] = CONTENT
+            client = await create_client(server)
+            await client.download_segmented(REPO_ID, '/file.bin', tmp_path / 'first.bin', segment_size=16 * 1024)
+            server.expire_links()
+            server.requests.clear()
+
+            # Act
+            result = await client.download_segmented(
+                REPO_ID, '/file.bin', tmp_path / 'second.bin', segment_size=16 * 1024, concurrency=4, retries=3)
+            await client.download(REPO_ID, '/file.bin')
+            await client.aclose()
+
+        # Assert
+        assert_that(result.success).is_true()
+        assert_that(result.content).is_equal_to(len(CONTENT))
+        assert_that((tmp_path / 'second.bin').read_bytes()).is_equal_to(CONTENT)
+        # one fresh link is shared by all segments and replaces the expired one in cache
+        assert_that(server.requests['file']).is_equal_to(1)
+        # segments started by the expired link are not repeated by it
+        assert_that(server.requests['download']).is_less_than_or_equal_to(4 + 7 + 1)
+
+    @pytest.mark.asyncio
+    async def test_download_segmented_by_expired_fresh_link(self, tmp_path):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            server.files['/file.bin'] = CONTENT
+            client = await create_client(server)
+            server.fail('download', 403, times=100)
+
+            # Act
+            result = await client.download_segmented(REPO_ID, '/file.bin', tmp_path / 'file.bin', segment_size=16 * 1024)
+            await client.aclose()
+
+        # Assert
+        assert_that(result.success).is_false()
+        assert_that(result.status).is_equal_to(403)
+        assert_that(server.requests['file']).is_equal_to(1)
+
+    @pytest.mark.asyncio
+    async def test_download_segmented_failure_keeps_destination(self, tmp_path):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            server.files['/file.bin'] = CONTENT
+            (tmp_path / 'file.bin').write_bytes(b'previous')
+            client = await create_client(server)
+            server.fail('download', 500, times=100)
+
+            # Act
+            result = await client.download_segmented(
+                REPO_ID, '/file.bin', tmp_path / 'file.bin', segment_size=16 * 1024, retries=1)
+            await client.aclose()
+
+        # Assert
+        assert_that(result.success).is_false()
+        assert_that((tmp_path / 'file.bin').read_bytes()).is_equal_to(b'previous')
+        assert_that([path.name for path in tmp_path.iterdir()]).is_equal_to(['file.bin'])
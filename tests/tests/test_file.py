@@ -1,12 +1,17 @@
+import io
 import pytest
+import asyncio
 import aiofiles
 from typing import List
 from http import HTTPStatus
 from pathlib import PurePath
 from assertpy import assert_that
-from tests.config import BASE_DIR
+from tests.config import BASE_DIR, SETTINGS
 from tests.test_data.context import TestContext
-from src.aseafile.models import FileItemDetail, SmartLink, UploadedFileItem
+from src.aseafile.models import FileItemDetail, FileListingDetail, SmartLink, UploadedFileItem
+from src.aseafile.tasks import CopyMoveTask
+from src.aseafile.caching import SingleFlight
+from src.aseafile import SeafileHttpClient, FileDetailLoader
 
 
 @pytest.mark.incremental
@@ -51,6 +56,51 @@ class TestFilesManagement:
         assert_that(result.errors).is_none()
         assert_that(result.content).is_instance_of(FileItemDetail)
 
+    @pytest.mark.asyncio
+    async def test_get_file_detail_coalesced(self, test_repo, authorized_http_client):
+        # Arrange
+        filename = self.context.get('filename')
+        dirpath = self.context.get('dirpath')
+        single_flight = SingleFlight()
+        http_client = SeafileHttpClient(SETTINGS.base_url, single_flight=single_flight)
+        token = authorized_http_client.token
+
+        # Act
+        results = await asyncio.gather(
+            *(http_client.get_file_detail(test_repo, dirpath + filename, token=token) for _ in range(10)))
+        await http_client.aclose()
+
+        # Assert
+        assert_that(results).extracting('success').contains_only(True)
+        assert_that(set(map(id, results))).is_length(1)
+        assert_that(single_flight.started).is_equal_to(1)
+        assert_that(single_flight.shared).is_equal_to(9)
+        assert_that(single_flight.in_flight).is_equal_to(0)
+
+    @pytest.mark.asyncio
+    async def test_load_file_detail(self, test_repo, authorized_http_client):
+        # Arrange
+        filename = self.context.get('filename')
+        dirpath = self.context.get('dirpath')
+        loader = FileDetailLoader(authorized_http_client)
+
+        # Act
+        results = await asyncio.gather(
+            loader.load(test_repo, dirpath + filename),
+            loader.load(test_repo, dirpath + 'missing.md'))
+        exists_result = await loader.exists(test_repo, [dirpath + filename, dirpath + 'missing.md', '/'])
+
+        # Assert
+        assert_that(results[0].success).is_true()
+        assert_that(results[0].content).is_instance_of(FileListingDetail)
+        assert_that(results[0].content.name).is_equal_to(filename)
+        assert_that(results[0].content.last_modifier_email).is_not_none()
+        assert_that(results[1].success).is_false()
+        assert_that(results[1].status).is_equal_to(HTTPStatus.NOT_FOUND)
+        assert_that(exists_result.success).is_true()
+        assert_that(exists_result.content).is_equal_to({dirpath + filename: True, dirpath + 'missing.md': False, '/': True})
+        assert_that(loader.listed).is_equal_to(2)
+
     @pytest.mark.asyncio
     async def test_rename_file(self, test_repo, authorized_http_client):
         # Arrange
@@ -224,6 +274,130 @@ class TestUploadAndDownloadFiles:
             expected_content = await file.read()
             assert_that(result.content).is_equal_to(expected_content)
 
+    @pytest.mark.asyncio
+    async def test_download_file_range(self, test_repo, authorized_http_client):
+        # Arrange
+        dir_path = self.context.get('dirpath')
+        filename = self.context.get('file_0')
+        local_test_files_dir = self.context.typed_get('local_test_files_dir', PurePath)
+
+        # Act
+        result = await authorized_http_client.download(test_repo, dir_path + filename, offset=2, length=5)
+
+        # Assert
+        assert_that(result).is_not_none()
+        assert_that(result.success).is_true()
+        assert_that(result.status).is_equal_to(HTTPStatus.PARTIAL_CONTENT)
+        assert_that(result.errors).is_none()
+
+        async with aiofiles.open(local_test_files_dir / filename, 'rb') as file:
+            expected_content = await file.read()
+            assert_that(result.content).is_equal_to(expected_content[2:7])
+
+    @pytest.mark.asyncio
+    async def test_iter_download_file(self, test_repo, authorized_http_client):
+        # Arrange
+        dir_path = self.context.get('dirpath')
+        filename = self.context.get('file_0')
+        local_test_files_dir = self.context.typed_get('local_test_files_dir', PurePath)
+
+        # Act
+        chunks = [chunk async for chunk in authorized_http_client.iter_download(
+            test_repo, dir_path + filename, chunk_size=16)]
+
+        # Assert
+        assert_that(chunks).is_not_empty()
+        assert_that(max(len(chunk) for chunk in chunks)).is_less_than_or_equal_to(16)
+
+        async with aiofiles.open(local_test_files_dir / filename, 'rb') as file:
+            expected_content = await file.read()
+            assert_that(b''.join(chunks)).is_equal_to(expected_content)
+
+    @pytest.mark.asyncio
+    async def test_download_to_file(self, test_repo, authorized_http_client):
+        # Arrange
+        dir_path = self.context.get('dirpath')
+        filename = self.context.get('file_0')
+        local_test_files_dir = self.context.typed_get('local_test_files_dir', PurePath)
+        destination = io.BytesIO()
+
+        # Act
+        result = await authorized_http_client.download_to_file(test_repo, dir_path + filename, destination)
+
+        # Assert
+        assert_that(result).is_not_none()
+        assert_that(result.success).is_true()
+        assert_that(result.status).is_equal_to(HTTPStatus.OK)
+        assert_that(result.errors).is_none()
+
+        async with aiofiles.open(local_test_files_dir / filename, 'rb') as file:
+            expected_content = await file.read()
+            assert_that(result.content).is_equal_to(len(expected_content))
+            assert_that(destination.getvalue()).is_equal_to(expected_content)
+
+    @pytest.mark.asyncio
+    async def test_download_segmented(self, test_repo, authorized_http_client, tmp_path):
+        # Arrange
+        dir_path = self.context.get('dirpath')
+        filename = self.context.get('file_0')
+        local_test_files_dir = self.context.typed_get('local_test_files_dir', PurePath)
+        destination = tmp_path / filename
+
+        # Act
+        result = await authorized_http_client.download_segmented(
+            test_repo, dir_path + filename, destination, segment_size=8, concurrency=2)
+
+        # Assert
+        assert_that(result).is_not_none()
+        assert_that(result.success).is_true()
+        assert_that(result.status).is_equal_to(HTTPStatus.OK)
+        assert_that(result.errors).is_none()
+
+        async with aiofiles.open(local_test_files_dir / filename, 'rb') as file:
+            expected_content = await file.read()
+            assert_that(result.content).is_equal_to(len(expected_content))
+            assert_that(destination.read_bytes()).is_equal_to(expected_content)
+
+    @pytest.mark.asyncio
+    async def test_upload_chunked(self, test_repo, authorized_http_client):
+        # Arrange
+        dir_path = self.context.get('dirpath')
+        filename = self.context.get('file_1')
+        local_test_files_dir = self.context.typed_get('local_test_files_dir', PurePath)
+
+        # Act
+        result = await authorized_http_client.upload_chunked(
+            test_repo, dir_path, 'chunked_' + filename, local_test_files_dir / filename, chunk_size=8)
+
+        # Assert
+        assert_that(result).is_not_none()
+        assert_that(result.success).is_true()
+        assert_that(result.status).is_equal_to(HTTPStatus.OK)
+        assert_that(result.errors).is_none()
+        assert_that(result.content).is_instance_of(UploadedFileItem)
+        assert_that(result.content.size).is_equal_to((local_test_files_dir / filename).stat().st_size)
+
+    @pytest.mark.asyncio
+    async def test_upload_from_async_iterator(self, test_repo, authorized_http_client):
+        # Arrange
+        dir_path = self.context.get('dirpath')
+        chunks = [b'first chunk\n', b'second chunk\n', b'third chunk\n']
+
+        async def generate_payload():
+            for chunk in chunks:
+                yield chunk
+
+        # Act
+        result = await authorized_http_client.upload(test_repo, dir_path, 'generated.txt', generate_payload())
+
+        # Assert
+        assert_that(result).is_not_none()
+        assert_that(result.success).is_true()
+        assert_that(result.status).is_equal_to(HTTPStatus.OK)
+        assert_that(result.errors).is_none()
+        assert_that(result.content).is_instance_of(UploadedFileItem)
+        assert_that(result.content.size).is_equal_to(len(b''.join(chunks)))
+
     @pytest.mark.asyncio
     async def test_multiple_upload_files(self, test_repo, authorized_http_client):
         # Arrange
@@ -260,3 +434,74 @@ class TestUploadAndDownloadFiles:
         assert_that(result.content).contains_item(lambda item: item.name == filename_1)
         assert_that(result.content).contains_item(lambda item: item.name == filename_2)
         assert_that(result.content).contains_item(lambda item: item.name == filename_3)
+
+    @pytest.mark.asyncio
+    async def test_bulk_upload(self, test_repo, authorized_http_client):
+        # Arrange
+        local_test_files_dir = self.context.typed_get('local_test_files_dir', PurePath)
+        filenames = [self.context.get('file_1'), self.context.get('file_2'), self.context.get('file_3')]
+        files = [(f'/bulk/{filename}', local_test_files_dir / filename) for filename in filenames]
+        files.append(('/bulk/nested/generated.txt', b'generated content'))
+
+        # Act
+        result = await authorized_http_client.bulk_upload(test_repo, files, max_batch_files=2, concurrency=2)
+
+        # Assert
+        assert_that(result).is_not_none()
+        assert_that(result.success).is_true()
+        assert_that(result.batches).is_equal_to(3)
+        assert_that(result.items).is_length(len(files))
+        assert_that(result.items).contains_item(lambda item: item.path == '/bulk/nested/generated.txt')
+        for item in result.items:
+            assert_that(item.status).is_equal_to(HTTPStatus.OK)
+            assert_that(item.content).is_instance_of(UploadedFileItem)
+
+    @pytest.mark.asyncio
+    async def test_copy_items(self, test_repo, authorized_http_client):
+        # Arrange
+        filenames = [self.context.get('file_1'), self.context.get('file_2'), self.context.get('file_3')]
+        paths = [f'/bulk/{filename}' for filename in filenames] + ['/bulk/nested']
+
+        # Act
+        result = await authorized_http_client.copy_items(test_repo, paths, '/', batch_size=2)
+
+        # Assert
+        assert_that(result).is_not_none()
+        assert_that(result.success).is_true()
+        assert_that(result.batches).is_equal_to(3)
+        assert_that(result.items).is_length(len(paths))
+        for item in result.items:
+            assert_that(item.status).is_equal_to(HTTPStatus.OK)
+            assert_that(item.errors).is_none()
+
+    @pytest.mark.asyncio
+    async def test_start_move_task(self, test_repo, authorized_http_client):
+        # Arrange
+        paths = ['/nested']
+
+        # Act
+        result = await authorized_http_client.start_move_task(test_repo, paths, '/bulk', poll_interval=0.1)
+        progress_result = await result.content.wait(timeout=30)
+
+        # Assert
+        assert_that(result).is_not_none()
+        assert_that(result.success).is_true()
+        assert_that(result.status).is_equal_to(HTTPStatus.OK)
+        assert_that(result.content).is_instance_of(CopyMoveTask)
+        assert_that(progress_result.success).is_true()
+        assert_that(progress_result.content.successful).is_true()
+        assert_that(result.content.finished).is_true()
+
+    @pytest.mark.asyncio
+    async def test_delete_items(self, test_repo, authorized_http_client):
+        # Arrange
+        paths = ['/bulk']
+
+        # Act
+        result = await authorized_http_client.delete_items(test_repo, paths)
+
+        # Assert
+        assert_that(result).is_not_none()
+        assert_that(result.success).is_true()
+        assert_that(result.batches).is_equal_to(1)
+        assert_that(result.items).contains_item(lambda item: item.path == '/bulk')
@@ -0,0 +1,61 @@
+import pytest
+from http import HTTPStatus
+from assertpy import assert_that
+from src.aseafile import SeafileHttpClient, FileDetailLoader
+from src.aseafile.models import FileItemDetail, FileListingDetail
+from benchmarks.standin_server import SeafileStandIn, StandInSettings
+
+REPO_ID = SeafileStandIn.REPO_ID
+SETTINGS = StandInSettings(generate=False)
+
+
+async def create_client(server: SeafileStandIn) -> SeafileHttpClient:
+    client = SeafileHttpClient(server.url)
+    await client.authorize('user@example.com', 'password')
+    return client
+
+
+class TestFileDetailLoader:
+
+    @pytest.mark.asyncio
+    async def test_load_from_listing(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            server.directories.add('/dir')
+            server.files |= {'/dir/first.txt': b'first', '/dir/second.txt': b'second file'}
+            client = await create_client(server)
+            loader = FileDetailLoader(client)
+
+            # Act
+            results = await loader.load_many(REPO_ID, ['/dir/first.txt', '/dir/second.txt', '/dir/missing.txt'])
+            await client.aclose()
+
+        # Assert
+        assert_that(results[0].success).is_true()
+        assert_that(results[0].content).is_instance_of(FileListingDetail)
+        assert_that(results[0].content.dict()).contains_key(*FileListingDetail.__fields__)
+        assert_that(results[1].content.size).is_equal_to(len(b'second file'))
+        assert_that(results[1].content.last_modifier_email).is_equal_to('user@example.com')
+        assert_that(results[2].success).is_false()
+        assert_that(results[2].status).is_equal_to(HTTPStatus.NOT_FOUND)
+        assert_that(server.requests['dir']).is_equal_to(1)
+        assert_that(server.requests['file_detail']).is_equal_to(0)
+
+    @pytest.mark.asyncio
+    async def test_load_fields_absent_in_listing(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            server.files['/file.txt'] = b'file'
+            client = await create_client(server)
+            loader = FileDetailLoader(client)
+
+            # Act
+            result = await loader.load(REPO_ID, '/file.txt', fields=['size', 'comment_total'])
+            await client.aclose()
+
+        # Assert
+        assert_that(result.success).is_true()
+        assert_that(result.content).is_instance_of(FileItemDetail)
+        assert_that(result.content.comment_total).is_equal_to(0)
+        assert_that(server.requests['dir']).is_equal_to(0)
+        assert_that(server.requests['file_detail']).is_equal_to(1)
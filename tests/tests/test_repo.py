@@ -1,7 +1,11 @@
+import asyncio
 import pytest
 from http import HTTPStatus
 from assertpy import assert_that
+from src.aseafile import SeafileHttpClient, AdaptiveLimiter, MetricsRegistry, TrafficRecorder
+from src.aseafile.enums import ChangeType
 from src.aseafile.models import RepoItem
+from tests.config import SETTINGS
 from tests.test_data.context import TestContext
 
 
@@ -48,6 +52,87 @@ class TestRepoManagement:
         assert_that(result.errors).is_none()
         assert_that(result.content).contains_item(lambda item: item.id == repo_id)
 
+    @pytest.mark.asyncio
+    async def test_get_changes(self, authorized_http_client):
+        # Arrange
+        repo_id = self.context.typed_get('repo_id', str)
+        head_result = await authorized_http_client.get_head_commit(repo_id)
+        await authorized_http_client.create_file(repo_id, '/changed.txt')
+
+        # Act
+        result = await authorized_http_client.get_changes(repo_id, head_result.content)
+
+        # Assert
+        assert_that(head_result.success).is_true()
+        assert_that(result).is_not_none()
+        assert_that(result.success).is_true()
+        assert_that(result.status).is_equal_to(HTTPStatus.OK)
+        assert_that(result.errors).is_none()
+        assert_that(result.content).contains_item(
+            lambda item: item.type == ChangeType.ADDED and item.path == '/changed.txt')
+
+    @pytest.mark.asyncio
+    async def test_get_repos_limited(self, authorized_http_client):
+        # Arrange
+        repo_id = self.context.typed_get('repo_id', str)
+        limiter = AdaptiveLimiter(initial_limit=2)
+        http_client = SeafileHttpClient(SETTINGS.base_url, concurrency_limiter=limiter)
+        token = authorized_http_client.token
+
+        # Act
+        results = await asyncio.gather(*(http_client.get_repos(token=token) for _ in range(10)))
+        await http_client.aclose()
+
+        # Assert
+        assert_that(results).extracting('success').contains_only(True)
+        assert_that(results[0].content).contains_item(lambda item: item.id == repo_id)
+        assert_that(limiter.metrics.samples).is_equal_to(10)
+        assert_that(limiter.in_flight).is_equal_to(0)
+        assert_that(limiter.queue_depth).is_equal_to(0)
+
+    @pytest.mark.asyncio
+    async def test_get_repos_with_metrics(self, authorized_http_client):
+        # Arrange
+        metrics = MetricsRegistry()
+        traces = list()
+        metrics.add_callback(traces.append)
+        http_client = SeafileHttpClient(SETTINGS.base_url, metrics=metrics)
+        token = authorized_http_client.token
+
+        # Act
+        result = await http_client.get_repos(token=token)
+        await http_client.aclose()
+
+        # Assert
+        assert_that(result.success).is_true()
+        assert_that(traces).is_length(1)
+        assert_that(traces[0].route).is_equal_to('repos')
+        assert_that(traces[0].status_class).is_equal_to('2xx')
+        assert_that(metrics.get('repos').count).is_equal_to(1)
+        assert_that(metrics.get('repos').bytes_received).is_greater_than(0)
+        assert_that(metrics.get('repos').latency['ttfb'].count).is_equal_to(1)
+
+    @pytest.mark.asyncio
+    async def test_record_traffic(self, authorized_http_client, tmp_path):
+        # Arrange
+        repo_id = self.context.typed_get('repo_id', str)
+        recorder = TrafficRecorder()
+        trace_path = str(tmp_path / 'session.trace.gz')
+        recorder.attach(authorized_http_client)
+
+        # Act
+        await authorized_http_client.get_repos()
+        await authorized_http_client.get_items(repo_id, '/')
+        recorder.detach(authorized_http_client)
+        recorder.save(trace_path)
+        result = TrafficRecorder.load(trace_path)
+
+        # Assert
+        assert_that(result).extracting('method').is_equal_to(['get_repos', 'get_items'])
+        assert_that(result).extracting('status').contains_only(HTTPStatus.OK)
+        assert_that(result[1].arguments['repo_id']).is_not_equal_to(repo_id)
+        assert_that(result[1].offset).is_greater_than_or_equal_to(result[0].offset)
+
     @pytest.mark.asyncio
     async def test_delete_repo(self, authorized_http_client):
         # Arrange
@@ -0,0 +1,192 @@
+import asyncio
+import pytest
+from assertpy import assert_that
+from src.aseafile import SeafileHttpClient
+from src.aseafile.caching import ResponseCache, MemoryCacheBackend
+from benchmarks.standin_server import SeafileStandIn, StandInSettings
+
+REPO_ID = SeafileStandIn.REPO_ID
+SETTINGS = StandInSettings(generate=False)
+
+MUTATIONS = [
+    ('create_directory', lambda client: client.create_directory(REPO_ID, '/dir/new')),
+    ('rename_directory', lambda client: client.rename_directory(REPO_ID, '/dir/sub', 'renamed')),
+    ('delete_directory', lambda client: client.delete_directory(REPO_ID, '/dir/sub')),
+    ('create_file', lambda client: client.create_file(REPO_ID, '/dir/new.txt')),
+    ('rename_file', lambda client: client.rename_file(REPO_ID, '/dir/file.txt', 'renamed.txt')),
+    ('move_file', lambda client: client.move_file(REPO_ID, '/other/moved.txt', '/dir')),
+    ('copy_file', lambda client: client.copy_file(REPO_ID, '/other/moved.txt', '/dir')),
+    ('delete_file', lambda client: client.delete_file(REPO_ID, '/dir/file.txt')),
+    ('upload', lambda client: client.upload(REPO_ID, '/dir', 'uploaded.txt', b'uploaded'))
+]
+
+
+async def create_client(server: SeafileStandIn, response_cache: ResponseCache) -> SeafileHttpClient:
+    client = SeafileHttpClient(server.url, response_cache=response_cache)
+    await client.authorize('user@example.com', 'password')
+    return client
+
+
+def fill(server: SeafileStandIn):
+    server.directories |= {'/dir', '/dir/sub', '/other'}
+    server.files |= {'/dir/file.txt': b'file', '/other/moved.txt': b'moved'}
+
+
+class TestResponseCache:
+
+    @pytest.mark.asyncio
+    async def test_cache_hit(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            fill(server)
+            cache = ResponseCache()
+            client = await create_client(server, cache)
+
+            # Act
+            first_result = await client.get_items(REPO_ID, '/dir')
+            second_result = await client.get_items(REPO_ID, '/dir')
+            await client.aclose()
+
+        # Assert
+        assert_that(first_result.success).is_true()
+        assert_that(second_result).is_same_as(first_result)
+        assert_that(server.requests['dir']).is_equal_to(1)
+        assert_that(cache.hits).is_equal_to(1)
+        assert_that(cache.misses).is_equal_to(1)
+
+    @pytest.mark.asyncio
+    async def test_cache_miss(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            fill(server)
+            cache = ResponseCache()
+            client = await create_client(server, cache)
+
+            # Act
+            await client.get_items(REPO_ID, '/dir')
+            await client.get_items(REPO_ID, '/other')
+            await client.get_files(REPO_ID, '/dir')
+            await client.aclose()
+
+        # Assert
+        assert_that(server.requests['dir']).is_equal_to(3)
+        assert_that(cache.hits).is_equal_to(0)
+        assert_that(cache.misses).is_equal_to(3)
+        assert_that(len(cache)).is_equal_to(3)
+
+    @pytest.mark.asyncio
+    async def test_cache_failed_response_is_not_saved(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            cache = ResponseCache()
+            client = await create_client(server, cache)
+
+            # Act
+            first_result = await client.get_items(REPO_ID, '/missing')
+            second_result = await client.get_items(REPO_ID, '/missing')
+            await client.aclose()
+
+        # Assert
+        assert_that(first_result.success).is_false()
+        assert_that(second_result.success).is_false()
+        assert_that(server.requests['dir']).is_equal_to(2)
+        assert_that(len(cache)).is_equal_to(0)
+
+    @pytest.mark.asyncio
+    async def test_cache_ttl_expiry(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            fill(server)
+            cache = ResponseCache(ttl=0.05)
+            client = await create_client(server, cache)
+
+            # Act
+            await client.get_items(REPO_ID, '/dir')
+            await asyncio.sleep(0.1)
+            await client.get_items(REPO_ID, '/dir')
+            await client.aclose()
+
+        # Assert
+        assert_that(server.requests['dir']).is_equal_to(2)
+        assert_that(cache.hits).is_equal_to(0)
+        assert_that(len(cache)).is_equal_to(1)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('mutation', [mutation for _, mutation in MUTATIONS], ids=[name for name, _ in MUTATIONS])
+    async def test_cache_invalidation(self, mutation):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            fill(server)
+            cache = ResponseCache()
+            client = await create_client(server, cache)
+            before = await client.get_items(REPO_ID, '/dir')
+
+            # Act
+            mutation_result = await mutation(client)
+            after = await client.get_items(REPO_ID, '/dir')
+            await client.aclose()
+
+        # Assert
+        assert_that(mutation_result.success).is_true()
+        assert_that(server.requests['dir']).is_equal_to(2)
+        assert_that(after).is_not_same_as(before)
+        assert_that([item.name for item in after.content]).is_not_equal_to([item.name for item in before.content])
+
+    @pytest.mark.asyncio
+    async def test_cache_invalidation_keeps_unrelated_entries(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            fill(server)
+            cache = ResponseCache()
+            client = await create_client(server, cache)
+            await client.get_items(REPO_ID, '/other')
+
+            # Act
+            await client.create_directory(REPO_ID, '/dir/new')
+            await client.get_items(REPO_ID, '/other')
+            await client.aclose()
+
+        # Assert
+        assert_that(server.requests['dir']).is_equal_to(1)
+        assert_that(cache.hits).is_equal_to(1)
+
+    @pytest.mark.asyncio
+    async def test_cache_stale_response_after_invalidation(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            fill(server)
+            server.delays['dir'] = 0.2
+            cache = ResponseCache()
+            client = await create_client(server, cache)
+
+            # Act
+            slow_listing = asyncio.create_task(client.get_items(REPO_ID, '/dir'))
+            await asyncio.sleep(0.1)
+            await client.create_directory(REPO_ID, '/dir/new')
+            stale = await slow_listing
+            server.delays.clear()
+            fresh = await client.get_items(REPO_ID, '/dir')
+            await client.aclose()
+
+        # Assert
+        assert_that([item.name for item in stale.content]).does_not_contain('new')
+        assert_that([item.name for item in fresh.content]).contains('new')
+        assert_that(server.requests['dir']).is_equal_to(2)
+
+    @pytest.mark.asyncio
+    async def test_cache_index_follows_evictions(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            fill(server)
+            server.directories |= {f'/dir{index}' for index in range(10)}
+            cache = ResponseCache(MemoryCacheBackend(max_size=3))
+            client = await create_client(server, cache)
+
+            # Act
+            for index in range(10):
+                await client.get_items(REPO_ID, f'/dir{index}')
+            await client.aclose()
+
+        # Assert
+        assert_that(len(cache.backend)).is_equal_to(3)
+        assert_that(len(cache)).is_equal_to(3)
@@ -0,0 +1,137 @@
+import time
+import asyncio
+import pytest
+from http import HTTPStatus
+from assertpy import assert_that
+from src.aseafile import SeafileHttpClient, RetryPolicy
+from benchmarks.standin_server import SeafileStandIn, StandInSettings
+
+REPO_ID = SeafileStandIn.REPO_ID
+SETTINGS = StandInSettings(generate=False)
+
+
+async def create_client(server: SeafileStandIn, retry_policy: RetryPolicy) -> SeafileHttpClient:
+    client = SeafileHttpClient(server.url, retry_policy=retry_policy)
+    await client.authorize('user@example.com', 'password')
+    return client
+
+
+class TestRetryPolicy:
+
+    @pytest.mark.asyncio
+    async def test_retry_unavailable_service(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            server.fail('dir', HTTPStatus.SERVICE_UNAVAILABLE)
+            client = await create_client(server, RetryPolicy(backoff_base=0.01))
+
+            # Act
+            result = await client.get_items(REPO_ID, '/')
+            await client.aclose()
+
+        # Assert
+        assert_that(result.success).is_true()
+        assert_that(server.requests['dir']).is_equal_to(2)
+
+    @pytest.mark.asyncio
+    async def test_retry_after(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            server.fail('dir', HTTPStatus.TOO_MANY_REQUESTS, headers={'Retry-After': '0.3'})
+            client = await create_client(server, RetryPolicy(backoff_base=0.01))
+
+            # Act
+            started_at = time.monotonic()
+            result = await client.get_items(REPO_ID, '/')
+            elapsed = time.monotonic() - started_at
+            await client.aclose()
+
+        # Assert
+        assert_that(result.success).is_true()
+        assert_that(elapsed).is_greater_than_or_equal_to(0.3)
+
+    @pytest.mark.asyncio
+    async def test_post_is_not_retried(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            server.fail('change_dir', HTTPStatus.SERVICE_UNAVAILABLE)
+            client = await create_client(server, RetryPolicy(backoff_base=0.01))
+
+            # Act
+            result = await client.create_directory(REPO_ID, '/dir')
+            await client.aclose()
+
+        # Assert
+        assert_that(result.success).is_false()
+        assert_that(result.status).is_equal_to(HTTPStatus.SERVICE_UNAVAILABLE)
+        assert_that(server.requests['change_dir']).is_equal_to(1)
+        assert_that(server.directories).does_not_contain('/dir')
+
+    @pytest.mark.asyncio
+    async def test_post_form_is_resent(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            server.fail('change_dir', HTTPStatus.SERVICE_UNAVAILABLE)
+            client = await create_client(server, RetryPolicy(backoff_base=0.01, retry_non_idempotent=True))
+
+            # Act
+            result = await client.create_directory(REPO_ID, '/dir')
+            await client.aclose()
+
+        # Assert
+        assert_that(result.success).is_true()
+        assert_that(server.requests['change_dir']).is_equal_to(2)
+        assert_that(server.directories).contains('/dir')
+
+    @pytest.mark.asyncio
+    async def test_multipart_form_is_resent(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            server.fail('upload', HTTPStatus.BAD_GATEWAY)
+            client = await create_client(server, RetryPolicy(backoff_base=0.01, retry_non_idempotent=True))
+
+            # Act
+            result = await client.upload(REPO_ID, '/', 'file.txt', b'contents')
+            await client.aclose()
+
+        # Assert
+        assert_that(result.success).is_true()
+        assert_that(server.requests['upload']).is_equal_to(2)
+        assert_that(server.files['/file.txt']).is_equal_to(b'contents')
+
+    @pytest.mark.asyncio
+    async def test_max_total_time_limits_attempt(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            server.delays['dir'] = 1
+            client = await create_client(server, RetryPolicy(backoff_base=0.01, max_total_time=0.3))
+
+            # Act
+            started_at = time.monotonic()
+            with pytest.raises(asyncio.TimeoutError):
+                await client.get_items(REPO_ID, '/')
+            elapsed = time.monotonic() - started_at
+            await client.aclose()
+
+        # Assert
+        assert_that(elapsed).is_less_than(1)
+        assert_that(server.requests['dir']).is_equal_to(1)
+
+    @pytest.mark.asyncio
+    async def test_max_total_time_limits_retries(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            server.fail('dir', HTTPStatus.SERVICE_UNAVAILABLE, headers={'Retry-After': '1'}, times=2)
+            client = await create_client(server, RetryPolicy(backoff_base=0.01, max_total_time=0.5))
+
+            # Act
+            started_at = time.monotonic()
+            result = await client.get_items(REPO_ID, '/')
+            elapsed = time.monotonic() - started_at
+            await client.aclose()
+
+        # Assert
+        assert_that(result.success).is_false()
+        assert_that(result.status).is_equal_to(HTTPStatus.SERVICE_UNAVAILABLE)
+        assert_that(elapsed).is_less_than(0.5)
+        assert_that(server.requests['dir']).is_equal_to(1)
@@ -0,0 +1,105 @@
+import json
+import pytest
+from http import HTTPStatus
+from typing import List
+from pydantic import BaseModel, ValidationError
+from assertpy import assert_that
+from src.aseafile.models import SeaResult, FileItem, Error
+
+ITEM = {
+    'id': '1' * 40,
+    'type': 'file',
+    'name': 'file.txt',
+    'mtime': 1672531200,
+    'permission': 'rw',
+    'size': 4,
+    'modifier_name': 'user',
+    'modifier_email': 'user@example.com',
+    'modifier_contact_email': 'user@example.com',
+    'starred': False
+}
+
+
+class ResultHolder(BaseModel):
+    result: SeaResult[List[FileItem]]
+
+
+def create_result() -> SeaResult[List[FileItem]]:
+    return SeaResult(success=True, status=HTTPStatus.OK, content=[FileItem.parse_obj(ITEM)], retries=1)
+
+
+class TestSeaResult:
+
+    def test_dict_converts_nested_models(self):
+        # Arrange
+        result = create_result()
+
+        # Act
+        fields = result.dict()
+
+        # Assert
+        assert_that(fields['content']).is_equal_to([FileItem.parse_obj(ITEM).dict()])
+        assert_that(fields['retries']).is_equal_to(1)
+
+    def test_json(self):
+        # Arrange
+        result = SeaResult(success=False, status=HTTPStatus.NOT_FOUND, errors=[Error('Not found', 'File not found')])
+
+        # Act
+        fields = json.loads(result.json())
+
+        # Assert
+        assert_that(fields).is_equal_to({
+            'success': False,
+            'status': 404,
+            'errors': [['Not found', 'File not found']],
+            'content': None,
+            'retries': 0
+        })
+
+    def test_copy(self):
+        # Arrange
+        result = create_result()
+
+        # Act
+        copied = result.copy(update={'retries': 2})
+        deep_copied = result.copy(deep=True)
+
+        # Assert
+        assert_that(copied.retries).is_equal_to(2)
+        assert_that(copied.content).is_same_as(result.content)
+        assert_that(deep_copied).is_equal_to(result)
+        assert_that(deep_copied.content).is_not_same_as(result.content)
+
+    def test_parse_obj(self):
+        # Arrange
+        fields = {'success': False, 'status': 404, 'errors': [('Not found', 'File not found')]}
+
+        # Act
+        result = SeaResult.parse_obj(fields)
+
+        # Assert
+        assert_that(result.status).is_equal_to(HTTPStatus.NOT_FOUND)
+        assert_that(result.errors).is_equal_to([Error('Not found', 'File not found')])
+
+    def test_field_of_model_validates_content(self):
+        # Arrange
+        fields = {'result': {'success': True, 'status': 200, 'content': [ITEM]}}
+
+        # Act
+        holder = ResultHolder.parse_obj(fields)
+
+        # Assert
+        assert_that(holder.result.content).is_equal_to([FileItem.parse_obj(ITEM)])
+        assert_that(json.loads(holder.json())['result']['content']).is_equal_to([ITEM])
+
+    def test_field_of_model_with_invalid_content(self):
+        # Arrange
+        fields = {'result': {'success': True, 'status': 200, 'content': [{'id': 'id'}]}}
+
+        # Act
+        with pytest.raises(ValidationError) as error:
+            ResultHolder.parse_obj(fields)
+
+        # Assert
+        assert_that(str(error.value)).contains('result -> content -> 0 -> name')
@@ -0,0 +1,60 @@
+import asyncio
+import threading
+from assertpy import assert_that
+from src.aseafile import SeafileHttpClient
+from benchmarks.standin_server import SeafileStandIn
+
+
+async def ping(client: SeafileHttpClient):
+    result = await client.ping()
+    assert_that(result.success).is_true()
+    return client.session
+
+
+class TestSession:
+
+    def test_session_of_finished_loop_is_detached(self):
+        # Arrange
+        server_loop = asyncio.new_event_loop()
+        server_thread = threading.Thread(target=server_loop.run_forever, daemon=True)
+        server_thread.start()
+        server = asyncio.run_coroutine_threadsafe(SeafileStandIn().__aenter__(), server_loop).result()
+        client = SeafileHttpClient(server.url)
+
+        # Act
+        first_session = asyncio.run(ping(client))
+        second_session = asyncio.run(ping(client))
+        asyncio.run(client.aclose())
+
+        # Assert
+        assert_that(second_session).is_not_same_as(first_session)
+        assert_that(first_session.closed).is_true()
+        assert_that(second_session.closed).is_true()
+
+        asyncio.run_coroutine_threadsafe(server.__aexit__(None, None, None), server_loop).result()
+        server_loop.call_soon_threadsafe(server_loop.stop)
+        server_thread.join()
+        server_loop.close()
+
+    def test_session_of_running_loop_is_closed(self):
+        # Arrange
+        server_loop = asyncio.new_event_loop()
+        server_thread = threading.Thread(target=server_loop.run_forever, daemon=True)
+        server_thread.start()
+        server = asyncio.run_coroutine_threadsafe(SeafileStandIn().__aenter__(), server_loop).result()
+        client = SeafileHttpClient(server.url)
+        first_session = asyncio.run_coroutine_threadsafe(ping(client), server_loop).result()
+
+        # Act
+        second_session = asyncio.run(ping(client))
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0.1), server_loop).result()
+
+        # Assert
+        assert_that(second_session).is_not_same_as(first_session)
+        assert_that(first_session.closed).is_true()
+        assert_that(first_session.connector).is_none()
+
+        asyncio.run_coroutine_threadsafe(server.__aexit__(None, None, None), server_loop).result()
+        server_loop.call_soon_threadsafe(server_loop.stop)
+        server_thread.join()
+        server_loop.close()
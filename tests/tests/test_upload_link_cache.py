@@ -0,0 +1,117 @@
+import io
+import pytest
+from assertpy import assert_that
+from src.aseafile import SeafileHttpClient
+from src.aseafile.models import CacheSettings
+from benchmarks.standin_server import SeafileStandIn, StandInSettings
+
+REPO_ID = SeafileStandIn.REPO_ID
+SETTINGS = StandInSettings(generate=False)
+
+
+async def create_client(server: SeafileStandIn) -> SeafileHttpClient:
+    client = SeafileHttpClient(server.url, upload_link_cache=CacheSettings())
+    await client.authorize('user@example.com', 'password')
+    return client
+
+
+class TestUploadLinkCache:
+
+    @pytest.mark.asyncio
+    async def test_upload_link_is_reused(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            client = await create_client(server)
+
+            # Act
+            first_result = await client.upload(REPO_ID, '/', 'first.txt', b'first')
+            second_result = await client.upload(REPO_ID, '/', 'second.txt', io.BytesIO(b'second'))
+            await client.aclose()
+
+        # Assert
+        assert_that(first_result.success).is_true()
+        assert_that(second_result.success).is_true()
+        assert_that(server.requests['get_upload_link']).is_equal_to(1)
+        assert_that(server.files).is_equal_to({'/first.txt': b'first', '/second.txt': b'second'})
+
+    @pytest.mark.asyncio
+    async def test_upload_bytes_by_expired_link(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            client = await create_client(server)
+            await client.upload(REPO_ID, '/', 'first.txt', b'first')
+            server.expire_links()
+
+            # Act
+            result = await client.upload(REPO_ID, '/', 'second.txt', b'second')
+            await client.aclose()
+
+        # Assert
+        assert_that(result.success).is_true()
+        assert_that(server.requests['get_upload_link']).is_equal_to(2)
+        assert_that(server.files['/second.txt']).is_equal_to(b'second')
+
+    @pytest.mark.asyncio
+    async def test_upload_file_object_by_expired_link(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            client = await create_client(server)
+            await client.upload(REPO_ID, '/', 'first.txt', b'first')
+            server.expire_links()
+            payload = io.BytesIO(b'header|second')
+            payload.seek(len(b'header|'))
+
+            # Act
+            result = await client.upload(REPO_ID, '/', 'second.txt', payload)
+            await client.aclose()
+
+        # Assert
+        assert_that(result.success).is_true()
+        assert_that(result.content.size).is_equal_to(len(b'second'))
+        assert_that(server.requests['upload']).is_equal_to(3)
+        assert_that(server.files['/second.txt']).is_equal_to(b'second')
+        assert_that(payload.closed).is_true()
+
+    @pytest.mark.asyncio
+    async def test_upload_local_file_by_expired_link(self, tmp_path):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            client = await create_client(server)
+            await client.upload(REPO_ID, '/', 'first.txt', b'first')
+            server.expire_links()
+            (tmp_path / 'second.txt').write_bytes(b'second')
+
+            # Act
+            with open(tmp_path / 'second.txt', 'rb') as file:
+                result = await client.uploads(REPO_ID, '/', [
+                    {'filename': 'second.txt', 'payload': file},
+                    {'filename': 'third.txt', 'payload': b'third'}
+                ])
+            await client.aclose()
+
+        # Assert
+        assert_that(result.success).is_true()
+        assert_that(server.files['/second.txt']).is_equal_to(b'second')
+        assert_that(server.files['/third.txt']).is_equal_to(b'third')
+
+    @pytest.mark.asyncio
+    async def test_upload_stream_does_not_use_cached_link(self):
+        async with SeafileStandIn(SETTINGS) as server:
+            # Arrange
+            client = await create_client(server)
+            await client.upload(REPO_ID, '/', 'first.txt', b'first')
+            server.expire_links()
+
+            async def stream():
+                yield b'sec'
+                yield b'ond'
+
+            # Act
+            result = await client.upload(REPO_ID, '/', 'second.txt', stream())
+            await client.aclose()
+
+        # Assert
+        assert_that(result.success).is_true()
+        assert_that(server.requests['get_upload_link']).is_equal_to(2)
+        assert_that(server.requests['upload']).is_equal_to(2)
+        assert_that(server.files['/second.txt']).is_equal_to(b'second')